@@ -6,6 +6,9 @@ The function betweenness centrality accepts a bunch of nodes and computes
 the contribution of those nodes to the betweenness centrality of the whole
 network. Here we divide the network in chunks of nodes and we compute their
 contribution to the betweenness centrality of the whole network.
+
+betweenness_centrality(G, n_jobs=...) does the same without pickling
+the graph for every worker, by sharing one compact copy of it.
 """
 
 from multiprocessing import Pool
@@ -7,7 +7,9 @@ from .current_flow_betweenness import *
 from .current_flow_betweenness_subset import *
 from .degree_alg import *
 from .dispersion import *
+from .distance_sums import *
 from .eigenvector import *
 from .harmonic import *
+from .incremental import *
 from .katz import *
 from .load import *
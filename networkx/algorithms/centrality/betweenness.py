@@ -9,8 +9,10 @@ Betweenness centrality measures.
 #    All rights reserved.
 #    BSD license.
 from heapq import heappush, heappop
-from itertools import count
+from itertools import count, repeat
+from math import ceil, floor, log, sqrt
 import networkx as nx
+from networkx.utils import integer_fastpath
 import random
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 
@@ -19,9 +21,11 @@ __all__ = ['betweenness_centrality',
            'edge_betweenness']
 
 
+@integer_fastpath('node_dict')
 def betweenness_centrality(G, k=None, normalized=True, weight=None,
                            endpoints=False,
-                           seed=None):
+                           seed=None, fastpath=False, n_jobs=None,
+                           epsilon=None, delta=0.1):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -59,6 +63,22 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional
       If True include the endpoints in the shortest path counts.
 
+    fastpath : bool, optional (default=False)
+      If True, run on integer node labels, see integer_fastpath.
+
+    n_jobs : int, optional (default=None)
+      Number of worker processes.  If None or 1 the betweenness is
+      computed in this process.  See Notes.
+
+    epsilon : float, optional (default=None)
+      If not None estimate the betweenness from randomly sampled
+      shortest paths with additive error at most epsilon, see Notes.
+      Cannot be combined with k.
+
+    delta : float, optional (default=0.1)
+      Probability that the estimate for some node misses the error
+      bound epsilon.  Ignored if epsilon is None.
+
     Returns
     -------
     nodes : dictionary
@@ -83,6 +103,25 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With n_jobs > 1 the sources are split into chunks that are handed
+    to a pool of worker processes.  The graph is copied once into
+    shared memory as compressed sparse rows, so every worker reads the
+    same copy, and the partial sums of the workers are added as NumPy
+    arrays.  This requires NumPy and does not support multigraphs.
+
+    Unlike k, epsilon gives an approximation with a guarantee [5]_:
+    pairs of nodes are drawn uniformly at random and a shortest path
+    between them is chosen uniformly at random.  With probability at
+    least 1 - delta, for all nodes at once, the fraction of the samples
+    whose path passes through a node is within epsilon of the fraction
+    of all shortest paths between ordered pairs that does.  The normalized
+    betweenness is this fraction times `n/(n-2)`.  The number of samples
+    in [5]_ depends only on an upper bound on the number of nodes on a
+    shortest path and always suffices; sampling stops earlier when an
+    empirical Bernstein bound shows that fewer samples are enough, as
+    in [6]_.  Each sample runs a single shortest path search that stops
+    at the target.  With epsilon n_jobs is ignored.
+
     References
     ----------
     .. [1] Ulrik Brandes:
@@ -102,25 +141,41 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        A set of measures of centrality based on betweenness.
        Sociometry 40: 35–41, 1977
        http://moreno.ss.uci.edu/23.pdf
+    .. [5] Matteo Riondato and Evgenios M. Kornaropoulos:
+       Fast approximation of betweenness centrality through sampling.
+       Data Mining and Knowledge Discovery 30(2):438-475, 2016.
+    .. [6] Michele Borassi and Emanuele Natale:
+       KADABRA is an ADaptive Algorithm for Betweenness via Random
+       Approximation.
+       24th European Symposium on Algorithms (ESA 2016), 20:1-20:18, 2016.
 
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    if epsilon is not None:
+        if k is not None:
+            raise nx.NetworkXError('k and epsilon cannot both be given.')
+        random.seed(seed)
+        betweenness = _sampled_betweenness(G, weight, endpoints,
+                                           epsilon, delta)
+        return _rescale(betweenness, len(G), normalized=normalized,
+                        directed=G.is_directed())
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
+    if n_jobs is not None and n_jobs > 1:
+        accumulate = 'endpoints' if endpoints else 'basic'
+        betweenness = _parallel_betweenness(G, nodes, weight, accumulate,
+                                            n_jobs)
+    else:
+        nodelist, brandes = _graph_brandes(G, weight)
+        index = dict(zip(nodelist, range(len(nodelist))))
+        b = [0.0] * len(nodelist)
+        for s in nodes:
+            s = index[s]
+            brandes.search(s)
+            brandes.accumulate(b, s, endpoints)
+        betweenness = dict(zip(nodelist, b))
     # rescaling
     betweenness = _rescale(betweenness, len(G),
                            normalized=normalized,
@@ -129,8 +184,9 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     return betweenness
 
 
+@integer_fastpath('edge_dict')
 def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
-                                seed=None):
+                                seed=None, fastpath=False, n_jobs=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -163,6 +219,13 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    fastpath : bool, optional (default=False)
+      If True, run on integer node labels, see integer_fastpath.
+
+    n_jobs : int, optional (default=None)
+      Number of worker processes.  If None or 1 the betweenness is
+      computed in this process.  See Notes of betweenness_centrality().
+
     Returns
     -------
     edges : dictionary
@@ -191,25 +254,25 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(), 0.0))
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    if n_jobs is not None and n_jobs > 1:
+        betweenness = _parallel_betweenness(G, nodes, weight, 'edges',
+                                            n_jobs)
+    else:
+        edges = _edge_list(G)
+        nodelist, brandes = _graph_brandes(G, weight, edges)
+        index = dict(zip(nodelist, range(len(nodelist))))
+        b = [0.0] * len(edges)
+        for s in nodes:
+            s = index[s]
+            brandes.search(s)
+            brandes.accumulate_edges(b, s)
+        betweenness = dict(zip(edges, b))
     # rescaling
-    for n in G:  # remove nodes to only return edges
-        del betweenness[n]
     betweenness = _rescale_e(betweenness, len(G),
                              normalized=normalized,
                              directed=G.is_directed())
@@ -224,106 +287,493 @@ def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None):
 
 # helpers for betweenness centrality
 
-def _single_source_shortest_path_basic(G, s):
-    S = []
-    P = {}
-    for v in G:
-        P[v] = []
-    sigma = dict.fromkeys(G, 0.0)    # sigma[v]=0 for v in G
-    D = {}
-    sigma[s] = 1.0
-    D[s] = 0
-    Q = [s]
-    while Q:   # use BFS to find shortest paths
-        v = Q.pop(0)
-        S.append(v)
-        Dv = D[v]
-        sigmav = sigma[v]
-        for w in G[v]:
-            if w not in D:
-                Q.append(w)
-                D[w] = Dv + 1
-            if D[w] == Dv + 1:   # this is a shortest path, count paths
-                sigma[w] += sigmav
-                P[w].append(v)  # predecessors
-    return S, P, sigma
-
-
-def _single_source_dijkstra_path_basic(G, s, weight='weight'):
-    # modified from Eppstein
-    S = []
-    P = {}
-    for v in G:
-        P[v] = []
-    sigma = dict.fromkeys(G, 0.0)    # sigma[v]=0 for v in G
-    D = {}
-    sigma[s] = 1.0
-    push = heappush
-    pop = heappop
-    seen = {s: 0}
-    c = count()
-    Q = []   # use Q as heap with (distance,node id) tuples
-    push(Q, (0, next(c), s, s))
-    while Q:
-        (dist, _, pred, v) = pop(Q)
-        if v in D:
-            continue  # already searched this node.
-        sigma[v] += sigma[pred]  # count paths
-        S.append(v)
-        D[v] = dist
-        for w, edgedata in G[v].items():
-            vw_dist = dist + edgedata.get(weight, 1)
-            if w not in D and (w not in seen or vw_dist < seen[w]):
-                seen[w] = vw_dist
-                push(Q, (vw_dist, next(c), v, w))
-                sigma[w] = 0.0
-                P[w] = [v]
-            elif vw_dist == seen[w]:  # handle equal paths
-                sigma[w] += sigma[v]
-                P[w].append(v)
-    return S, P, sigma
-
-
-def _accumulate_basic(betweenness, S, P, sigma, s):
-    delta = dict.fromkeys(S, 0)
-    while S:
-        w = S.pop()
-        coeff = (1.0 + delta[w]) / sigma[w]
-        for v in P[w]:
-            delta[v] += sigma[v] * coeff
-        if w != s:
-            betweenness[w] += delta[w]
-    return betweenness
-
+class _Brandes(object):
+    """Shortest path counting for Brandes' algorithm on the nodes 0..n-1.
 
-def _accumulate_endpoints(betweenness, S, P, sigma, s):
-    betweenness[s] += len(S) - 1
-    delta = dict.fromkeys(S, 0)
-    while S:
-        w = S.pop()
-        coeff = (1.0 + delta[w]) / sigma[w]
-        for v in P[w]:
-            delta[v] += sigma[v] * coeff
-        if w != s:
-            betweenness[w] += delta[w] + 1
-    return betweenness
+    adj[v] is the list of neighbors of node v, weights[v] (if not None)
+    the list of the weights of the edges to them and edge_ids[v] (if not
+    None) the list of the positions of these edges in an edge list.
 
+    The sigma, delta, distance and predecessor buffers are allocated
+    once.  search() resets only the nodes reached by the previous
+    search, so running it from every node allocates nothing per node.
+    After search(s), S holds the nodes reached from s by nondecreasing
+    distance and pred[w] the predecessors of w on shortest paths (and
+    pred_edges[w] the edges to them).  The accumulate methods add the
+    dependencies of s to an array indexed by node or by edge position.
+    """
 
-def _accumulate_edges(betweenness, S, P, sigma, s):
-    delta = dict.fromkeys(S, 0)
-    while S:
-        w = S.pop()
-        coeff = (1.0 + delta[w]) / sigma[w]
-        for v in P[w]:
-            c = sigma[v] * coeff
-            if (v, w) not in betweenness:
-                betweenness[(w, v)] += c
+    def __init__(self, adj, weights=None, edge_ids=None):
+        n = len(adj)
+        self.adj = adj
+        self.weights = weights
+        self.edge_ids = edge_ids
+        self.S = []
+        self.sigma = [0.0] * n
+        self.delta = [0.0] * n
+        self.dist = [None] * n
+        self.seen = None if weights is None else [None] * n
+        self.pred = [[] for v in range(n)]
+        self.pred_edges = None
+        if edge_ids is not None:
+            self.pred_edges = [[] for v in range(n)]
+
+    def search(self, s, cutoff=None, target=None):
+        """Count the shortest paths from s.  Breadth-first search stops
+        at distance cutoff; Dijkstra's algorithm ignores it.  If target
+        is not None the search stops as soon as the shortest paths from
+        s to target are counted."""
+        sigma = self.sigma
+        delta = self.delta
+        dist = self.dist
+        seen = self.seen
+        pred = self.pred
+        pred_edges = self.pred_edges
+        for v in self.S:
+            sigma[v] = 0.0
+            delta[v] = 0.0
+            dist[v] = None
+            del pred[v][:]
+            if seen is not None:
+                seen[v] = None
+            if pred_edges is not None:
+                del pred_edges[v][:]
+        del self.S[:]
+        if self.weights is None:
+            self._bfs(s, cutoff, target)
+        else:
+            self._dijkstra(s, target)
+
+    def _bfs(self, s, cutoff, target=None):
+        adj = self.adj
+        edge_ids = self.edge_ids
+        S = self.S
+        sigma = self.sigma
+        dist = self.dist
+        pred = self.pred
+        pred_edges = self.pred_edges
+        sigma[s] = 1.0
+        dist[s] = 0
+        S.append(s)
+        i = 0
+        while i < len(S):  # S is also the queue of the search
+            v = S[i]
+            i += 1
+            dw = dist[v] + 1
+            if cutoff is not None and dw > cutoff:
+                break
+            if target is not None and dist[target] is not None \
+                    and dw > dist[target]:
+                break  # all predecessors of target have been expanded
+            sigmav = sigma[v]
+            if edge_ids is None:
+                for w in adj[v]:
+                    if dist[w] is None:
+                        dist[w] = dw
+                        S.append(w)
+                    if dist[w] == dw:  # this is a shortest path, count paths
+                        sigma[w] += sigmav
+                        pred[w].append(v)
             else:
-                betweenness[(v, w)] += c
-            delta[v] += c
-        if w != s:
-            betweenness[w] += delta[w]
-    return betweenness
+                for w, e in zip(adj[v], edge_ids[v]):
+                    if dist[w] is None:
+                        dist[w] = dw
+                        S.append(w)
+                    if dist[w] == dw:
+                        sigma[w] += sigmav
+                        pred[w].append(v)
+                        pred_edges[w].append(e)
+
+    def _dijkstra(self, s, target=None):
+        adj = self.adj
+        weights = self.weights
+        edge_ids = self.edge_ids
+        S = self.S
+        sigma = self.sigma
+        dist = self.dist
+        seen = self.seen
+        pred = self.pred
+        pred_edges = self.pred_edges
+        push = heappush
+        pop = heappop
+        c = count()
+        sigma[s] = 1.0
+        seen[s] = 0
+        Q = [(0, next(c), s)]
+        while Q:
+            (d, _, v) = pop(Q)
+            if dist[v] is not None:
+                continue  # already searched this node.
+            dist[v] = d
+            S.append(v)
+            if v == target:
+                # Reset the nodes reached but not searched, S does not
+                # hold them.
+                for (_, _, w) in Q:
+                    if dist[w] is None and seen[w] is not None:
+                        sigma[w] = 0.0
+                        seen[w] = None
+                        del pred[w][:]
+                        if pred_edges is not None:
+                            del pred_edges[w][:]
+                break
+            sigmav = sigma[v]
+            ids = repeat(None) if edge_ids is None else edge_ids[v]
+            for w, vw, e in zip(adj[v], weights[v], ids):
+                vw_dist = d + vw
+                if dist[w] is None and (seen[w] is None or vw_dist < seen[w]):
+                    seen[w] = vw_dist
+                    push(Q, (vw_dist, next(c), w))
+                    sigma[w] = sigmav
+                    del pred[w][:]
+                    pred[w].append(v)
+                    if pred_edges is not None:
+                        del pred_edges[w][:]
+                        pred_edges[w].append(e)
+                elif vw_dist == seen[w]:  # handle equal paths
+                    sigma[w] += sigmav
+                    pred[w].append(v)
+                    if pred_edges is not None:
+                        pred_edges[w].append(e)
+
+    def sample_path(self, t, random=random.random):
+        """Return the nodes of a shortest path to t, chosen uniformly at
+        random among all shortest paths from the last source, from t
+        back to the source."""
+        sigma = self.sigma
+        pred = self.pred
+        path = [t]
+        w = t
+        while pred[w]:
+            x = random() * sigma[w]
+            for v in pred[w]:
+                x -= sigma[v]
+                if x < 0:
+                    break
+            path.append(v)
+            w = v
+        return path
+
+    def accumulate(self, betweenness, s, endpoints=False):
+        sigma = self.sigma
+        delta = self.delta
+        pred = self.pred
+        S = self.S
+        extra = 0
+        if endpoints:
+            betweenness[s] += len(S) - 1
+            extra = 1
+        for w in reversed(S):
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in pred[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                betweenness[w] += delta[w] + extra
+
+    def accumulate_edges(self, betweenness, s):
+        sigma = self.sigma
+        delta = self.delta
+        pred = self.pred
+        pred_edges = self.pred_edges
+        for w in reversed(self.S):
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v, e in zip(pred[w], pred_edges[w]):
+                c = sigma[v] * coeff
+                betweenness[e] += c
+                delta[v] += c
+
+    def accumulate_subset(self, betweenness, s, is_target):
+        sigma = self.sigma
+        delta = self.delta
+        pred = self.pred
+        for w in reversed(self.S):
+            pw = pred[w]
+            for v in pw:
+                if is_target[w]:
+                    delta[v] += (sigma[v] / sigma[w]) * (1.0 + delta[w])
+                else:
+                    delta[v] += delta[w] / len(pw)
+            if w != s:
+                betweenness[w] += delta[w]
+
+    def accumulate_edges_subset(self, betweenness, s, is_target):
+        sigma = self.sigma
+        delta = self.delta
+        pred = self.pred
+        pred_edges = self.pred_edges
+        for w in reversed(self.S):
+            pw = pred[w]
+            for v, e in zip(pw, pred_edges[w]):
+                if is_target[w]:
+                    c = (sigma[v] / sigma[w]) * (1.0 + delta[w])
+                else:
+                    c = delta[w] / len(pw)
+                betweenness[e] += c
+                delta[v] += c
+
+    def accumulate_load(self, load, s):
+        delta = self.delta
+        pred = self.pred
+        for w in reversed(self.S):
+            if w == s:
+                continue
+            pw = pred[w]
+            share = (1.0 + delta[w]) / len(pw)  # discount multiple paths
+            for x in pw:
+                if x == s:  # stop if hit source because all remaining x
+                    break   # also have pred[x] == [source]
+                delta[x] += share
+            load[w] += delta[w]
+
+
+def _sampled_betweenness(G, weight, endpoints, epsilon, delta):
+    """Estimate the betweenness of the nodes of G from shortest paths
+    sampled uniformly at random, as sums over ordered pairs of nodes.
+
+    With probability at least 1 - delta each estimate divided by
+    n(n-1) is within epsilon of the exact value divided by n(n-1).
+    """
+    n = len(G)
+    nodelist, brandes = _graph_brandes(G, weight)
+    if n < 2:
+        return dict.fromkeys(nodelist, 0.0)
+    # Riondato and Kornaropoulos: this many samples always suffice for
+    # probability 1 - delta/2, vd bounds the number of nodes on a
+    # shortest path.
+    vd = _vertex_diameter_bound(G, weight, brandes)
+    r = int(ceil(0.5 / epsilon ** 2 *
+                 (floor(log(max(vd - 2, 1), 2)) + 1 + log(2.0 / delta))))
+    # Stop earlier if an empirical Bernstein bound holds for every node,
+    # checked at geometrically growing sample sizes.  The checks share
+    # the other delta/2 through a union bound over nodes and checks.
+    checks = []
+    m = min(100, r)
+    while m < r:
+        checks.append(m)
+        m *= 2
+    checks.append(r)
+    if len(checks) > 1:
+        log_term = log(4.0 * 2 * n * (len(checks) - 1) / delta)
+    counts = [0] * n
+    rand = random.random
+    randrange = random.randrange
+    samples = 0
+    for m in checks:
+        while samples < m:
+            samples += 1
+            s = randrange(n)
+            t = randrange(n - 1)
+            if t >= s:
+                t += 1
+            brandes.search(s, target=t)
+            if brandes.dist[t] is None:
+                continue  # no path, the sample contributes nothing
+            path = brandes.sample_path(t, rand)
+            if not endpoints:
+                path = path[1:-1]
+            for v in path:
+                counts[v] += 1
+        if m == r:
+            break
+        # The bound grows with the variance, which is largest for the
+        # node seen in the fraction of the samples closest to 1/2.
+        p = min(counts, key=lambda c: abs(c - 0.5 * m)) / float(m)
+        variance = p * (1 - p) * m / (m - 1)
+        bound = sqrt(2 * variance * log_term / m) + \
+            7 * log_term / (3.0 * (m - 1))
+        if bound <= epsilon:
+            break
+    scale = n * (n - 1) / float(samples)
+    return dict((v, c * scale) for v, c in zip(nodelist, counts))
+
+
+def _vertex_diameter_bound(G, weight, brandes):
+    """Return an upper bound on the number of nodes on a shortest path
+    of G."""
+    if G.is_directed():
+        # The largest weakly connected component holds all of them.
+        return max(len(c) for c in nx.weakly_connected_components(G))
+    # In a connected undirected graph no shortest path is longer than
+    # twice the eccentricity of any node, so it has at most that many
+    # edges divided by the smallest edge weight.
+    min_weight = 1
+    if weight is not None:
+        weights = [min(w) for w in brandes.weights if w]
+        if weights:
+            min_weight = min(weights)
+    vd = 1
+    reached = [False] * len(G)
+    for s in range(len(G)):
+        if not reached[s]:
+            brandes.search(s)
+            for v in brandes.S:
+                reached[v] = True
+            if min_weight > 0:
+                eccentricity = brandes.dist[brandes.S[-1]]
+                hops = int(floor(2 * eccentricity / float(min_weight)))
+                vd = max(vd, min(hops + 1, len(brandes.S)))
+            else:
+                vd = max(vd, len(brandes.S))
+    return vd
+
+
+def _graph_brandes(G, weight, edges=None, multigraph_weight=None):
+    """Return the list of the nodes of G and a _Brandes engine for G
+    that numbers them by their position in the list.
+
+    If edges is not None, the engine also records the position in edges
+    of the edges to the predecessors.  For multigraphs the weight of
+    several edges is multigraph_weight of their weights if it is given,
+    otherwise the weight attribute of the dict of edge keys.
+    """
+    nodelist = list(G)
+    index = dict(zip(nodelist, range(len(nodelist))))
+    adj = [[index[w] for w in G[v]] for v in nodelist]
+    weights = None
+    if weight is not None:
+        if G.is_multigraph() and multigraph_weight is not None:
+            weights = [[multigraph_weight(d.get(weight, 1)
+                                          for d in keydict.values())
+                        for keydict in G[v].values()] for v in nodelist]
+        else:
+            weights = [[d.get(weight, 1) for d in G[v].values()]
+                       for v in nodelist]
+    edge_ids = None
+    if edges is not None:
+        position = _edge_positions(G, edges)
+        edge_ids = [[position[(v, w)] for w in G[v]] for v in nodelist]
+    return nodelist, _Brandes(adj, weights, edge_ids)
+
+
+def _edge_list(G):
+    """Return the list of the edges of G without repeated edges."""
+    return list(dict.fromkeys(G.edges()))
+
+
+def _edge_positions(G, edges):
+    """Return a dict mapping each edge of G, in both directions if G is
+    undirected, to its position in edges."""
+    position = dict(zip(edges, range(len(edges))))
+    if not G.is_directed():
+        for (u, v), i in zip(edges, range(len(edges))):
+            position.setdefault((v, u), i)
+    return position
+
+
+class _CSRRows(object):
+    """Rows of a CSR matrix: rows[i] is the list values[indptr[i]:indptr[i+1]].
+
+    It stands in for the adjacency lists of _Brandes on the shared
+    arrays of a worker process without copying them.
+    """
+
+    def __init__(self, indptr, values):
+        self.indptr = indptr.tolist()
+        self.values = values
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i):
+        return self.values[self.indptr[i]:self.indptr[i + 1]].tolist()
+
+
+def _parallel_betweenness(G, sources, weight, accumulate, n_jobs,
+                          targets=None):
+    """Return the sum of the betweenness accumulated from every node in
+    sources, computed by a pool of n_jobs worker processes.
+
+    The result is keyed by node, or by edge (in the orientation of
+    G.edges()) if accumulate is 'edges'.  The structure of G is copied
+    once into shared memory, where the workers read it.
+    """
+    import numpy as np
+    from multiprocessing import Pool
+    from multiprocessing.sharedctypes import RawArray
+    if G.is_directed():
+        H = nx.CSRDiGraph(G, weight=weight)
+    else:
+        H = nx.CSRGraph(G, weight=weight)
+    nodelist = H.nodes()
+    index = H.node._index
+    arrays = {'indptr': H.indptr, 'indices': H.indices}
+    if H.data is not None:
+        arrays['weights'] = H.data
+    if accumulate == 'edges':
+        edges = _edge_list(G)
+        position = _edge_positions(G, edges)
+        rows = np.repeat(np.arange(len(nodelist)), np.diff(H.indptr))
+        arrays['edge_ids'] = np.fromiter(
+            (position[(nodelist[u], nodelist[v])]
+             for u, v in zip(rows.tolist(), H.indices.tolist())),
+            dtype=np.int64, count=len(rows))
+        size = len(edges)
+    else:
+        size = len(nodelist)
+    shared = {}
+    for name, a in arrays.items():
+        raw = RawArray('b', max(a.nbytes, 1))
+        np.frombuffer(raw, dtype=a.dtype, count=len(a))[:] = a
+        shared[name] = (raw, a.dtype.str, len(a))
+    if targets is not None:
+        targets = [index[t] for t in targets if t in index]
+    sources = [index[s] for s in sources]
+    chunksize = max(1, len(sources) // (4 * n_jobs))
+    chunks = [sources[i:i + chunksize]
+              for i in range(0, len(sources), chunksize)]
+    pool = Pool(n_jobs, initializer=_init_worker,
+                initargs=(shared, accumulate, targets, size))
+    try:
+        total = np.zeros(size)
+        for part in pool.imap_unordered(_run_chunk, chunks):
+            total += part
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    if accumulate == 'edges':
+        return dict(zip(edges, total.tolist()))
+    return dict(zip(nodelist, total.tolist()))
+
+
+_worker = {}  # state of a worker process, set by _init_worker
+
+
+def _init_worker(shared, accumulate, targets, size):
+    import numpy as np
+    arrays = dict((name, np.frombuffer(raw, dtype=dtype, count=count))
+                  for name, (raw, dtype, count) in shared.items())
+    indptr = arrays['indptr']
+    rows = dict((name, _CSRRows(indptr, a)) for name, a in arrays.items()
+                if name != 'indptr')
+    brandes = _Brandes(rows['indices'], rows.get('weights'),
+                       rows.get('edge_ids'))
+    _worker['brandes'] = brandes
+    _worker['accumulate'] = accumulate
+    _worker['size'] = size
+    if targets is not None:
+        is_target = [False] * len(brandes.adj)
+        for t in targets:
+            is_target[t] = True
+        _worker['is_target'] = is_target
+
+
+def _run_chunk(sources):
+    import numpy as np
+    brandes = _worker['brandes']
+    accumulate = _worker['accumulate']
+    betweenness = [0.0] * _worker['size']
+    for s in sources:
+        brandes.search(s)
+        if accumulate == 'basic':
+            brandes.accumulate(betweenness, s)
+        elif accumulate == 'endpoints':
+            brandes.accumulate(betweenness, s, endpoints=True)
+        elif accumulate == 'edges':
+            brandes.accumulate_edges(betweenness, s)
+        else:
+            brandes.accumulate_subset(betweenness, s, _worker['is_target'])
+    return np.array(betweenness)
 
 
 def _rescale(betweenness, n, normalized, directed=False, k=None):
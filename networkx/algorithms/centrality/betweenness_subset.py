@@ -16,14 +16,13 @@ __all__ = ['betweenness_centrality_subset',
 import networkx as nx
 
 from networkx.algorithms.centrality.betweenness import\
-    _single_source_dijkstra_path_basic as dijkstra
-from networkx.algorithms.centrality.betweenness import\
-    _single_source_shortest_path_basic as shortest_path
+    _edge_list, _graph_brandes, _parallel_betweenness
 
 
 def betweenness_centrality_subset(G,sources,targets,
                                   normalized=False,
-                                  weight=None):
+                                  weight=None,
+                                  n_jobs=None):
     """Compute betweenness centrality for a subset of nodes.
 
     .. math::
@@ -57,6 +56,10 @@ def betweenness_centrality_subset(G,sources,targets,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int, optional (default=None)
+      Number of worker processes.  If None or 1 the betweenness is
+      computed in this process.  See Notes of betweenness_centrality().
+
     Returns
     -------
     nodes : dictionary
@@ -91,14 +94,21 @@ def betweenness_centrality_subset(G,sources,targets,
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    b=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=shortest_path(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=dijkstra(G,s,weight)
-        b=_accumulate_subset(b,S,P,sigma,s,targets)
+    if n_jobs is not None and n_jobs > 1:
+        b=_parallel_betweenness(G,sources,weight,'subset',n_jobs,targets)
+    else:
+        nodelist,brandes=_graph_brandes(G,weight)
+        index=dict(zip(nodelist,range(len(nodelist))))
+        is_target=[False]*len(nodelist)
+        for t in targets:
+            if t in index:
+                is_target[index[t]]=True
+        b=[0.0]*len(nodelist)
+        for s in sources:
+            s=index[s]
+            brandes.search(s)
+            brandes.accumulate_subset(b,s,is_target)
+        b=dict(zip(nodelist,b))
     b=_rescale(b,len(G),normalized=normalized,directed=G.is_directed())
     return b
 
@@ -172,17 +182,19 @@ def edge_betweenness_centrality_subset(G,sources,targets,
 
     """
 
-    b=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    b.update(dict.fromkeys(G.edges(),0.0)) # b[e] for e in G.edges()
+    edges=_edge_list(G)
+    nodelist,brandes=_graph_brandes(G,weight,edges)
+    index=dict(zip(nodelist,range(len(nodelist))))
+    is_target=[False]*len(nodelist)
+    for t in targets:
+        if t in index:
+            is_target[index[t]]=True
+    b=[0.0]*len(edges)
     for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=shortest_path(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=dijkstra(G,s,weight)
-        b=_accumulate_edges_subset(b,S,P,sigma,s,targets)
-    for n in G: # remove nodes to only return edges 
-        del b[n]
+        s=index[s]
+        brandes.search(s)
+        brandes.accumulate_edges_subset(b,s,is_target)
+    b=dict(zip(edges,b))
     b=_rescale_e(b,len(G),normalized=normalized,directed=G.is_directed())
     return b
 
@@ -194,42 +206,6 @@ def betweenness_centrality_source(G,normalized=True,weight=None,sources=None):
     return betweenness_centrality_subset(G,sources,targets,normalized,weight)
 
 
-def _accumulate_subset(betweenness,S,P,sigma,s,targets):
-    delta=dict.fromkeys(S,0)
-    target_set=set(targets)
-    while S:
-        w=S.pop()
-        for v in P[w]:
-            if w in target_set:
-                delta[v]+=(sigma[v]/sigma[w])*(1.0+delta[w])
-            else:
-                delta[v]+=delta[w]/len(P[w])
-        if w != s:
-            betweenness[w]+=delta[w]
-    return betweenness
-
-def _accumulate_edges_subset(betweenness,S,P,sigma,s,targets):
-    delta=dict.fromkeys(S,0)
-    target_set=set(targets)
-    while S:
-        w=S.pop()
-        for v in P[w]:
-            if w in target_set:
-                c=(sigma[v]/sigma[w])*(1.0+delta[w])
-            else:
-                c=delta[w]/len(P[w])
-            if (v,w) not in betweenness:
-                betweenness[(w,v)]+=c
-            else:
-                betweenness[(v,w)]+=c
-            delta[v]+=c
-        if w != s:
-            betweenness[w]+=delta[w]
-    return betweenness
-
-
-
-
 def _rescale(betweenness,n,normalized,directed=False):
     if normalized is True:
         if n <=2:
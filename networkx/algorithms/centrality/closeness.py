@@ -7,15 +7,19 @@ Closeness centrality measures.
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
-import functools
+from heapq import heappush, heappushpop
 import networkx as nx
+from networkx.algorithms.centrality.distance_sums import _distance_sums
+from networkx.utils import integer_fastpath
 __author__ = "\n".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                         'Pieter Swart (swart@lanl.gov)',
                         'Sasha Gutfraind (ag362@cornell.edu)'])
-__all__ = ['closeness_centrality']
+__all__ = ['closeness_centrality', 'top_k_closeness_centrality']
 
 
-def closeness_centrality(G, u=None, distance=None, normalized=True):
+@integer_fastpath('node_dict', 'u')
+def closeness_centrality(G, u=None, distance=None, normalized=True,
+                         fastpath=False):
     r"""Compute closeness centrality for nodes.
 
     Closeness centrality [1]_ of a node `u` is the reciprocal of the
@@ -46,6 +50,9 @@ def closeness_centrality(G, u=None, distance=None, normalized=True):
       If True (default) normalize by the number of nodes in the connected
       part of the graph.
 
+    fastpath : bool, optional (default=False)
+      If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     nodes : dictionary
@@ -54,7 +61,7 @@ def closeness_centrality(G, u=None, distance=None, normalized=True):
     See Also
     --------
     betweenness_centrality, load_centrality, eigenvector_centrality,
-    degree_centrality
+    degree_centrality, distance_centralities
 
     Notes
     -----
@@ -66,7 +73,9 @@ def closeness_centrality(G, u=None, distance=None, normalized=True):
 
     If the 'distance' keyword is set to an edge attribute key then the
     shortest-path length will be computed using Dijkstra's algorithm with
-    that edge attribute as the edge weight.
+    that edge attribute as the edge weight.  Otherwise, if NumPy is
+    available and closeness is computed for all the nodes, the searches
+    from 64 nodes are run at once as in distance_centralities().
 
     References
     ----------
@@ -74,26 +83,19 @@ def closeness_centrality(G, u=None, distance=None, normalized=True):
        Conceptual clarification. Social Networks 1:215-239, 1979.
        http://leonidzhukov.ru/hse/2013/socialnetworks/papers/freeman79-centrality.pdf
     """
-    if distance is not None:
-        # use Dijkstra's algorithm with specified attribute as edge weight 
-        path_length = functools.partial(nx.single_source_dijkstra_path_length,
-                                        weight=distance)
-    else:
-        path_length = nx.single_source_shortest_path_length
-
     if u is None:
         nodes = G.nodes()
     else:
         nodes = [u]
+    sums = _distance_sums(G, nodes, distance, totals=True)
     closeness_centrality = {}
     for n in nodes:
-        sp = path_length(G,n)
-        totsp = sum(sp.values())
+        reached, totsp = sums[n][:2]
         if totsp > 0.0 and len(G) > 1:
-            closeness_centrality[n] = (len(sp)-1.0) / totsp
+            closeness_centrality[n] = (reached-1.0) / totsp
             # normalize to number of nodes-1 in connected part
             if normalized:
-                s = (len(sp)-1.0) / ( len(G) - 1 )
+                s = (reached-1.0) / ( len(G) - 1 )
                 closeness_centrality[n] *= s
         else:
             closeness_centrality[n] = 0.0
@@ -101,3 +103,175 @@ def closeness_centrality(G, u=None, distance=None, normalized=True):
         return closeness_centrality[u]
     else:
         return closeness_centrality
+
+
+def top_k_closeness_centrality(G, k, normalized=True):
+    r"""Return the k nodes with the largest closeness centrality.
+
+    The closeness centrality is that of closeness_centrality(), with
+    distances measured in number of edges.  Most breadth-first searches
+    are stopped early, as soon as a bound shows that their node is not
+    among the k most central ones [1]_.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    k : int
+      The number of nodes to return.  If k is larger than the number of
+      nodes all nodes are returned.
+
+    normalized : bool, optional (default=True)
+      If True normalize by the number of nodes in the connected part of
+      the graph, as closeness_centrality() does.
+
+    Returns
+    -------
+    nodes : list
+      List of the k pairs (node, closeness centrality) with the largest
+      closeness centrality, by decreasing closeness centrality.  Nodes
+      with equal closeness centrality are in the order of G.nodes().
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> nx.top_k_closeness_centrality(G, 2)
+    [(2, 0.6666666666666666), (1, 0.5714285714285714)]
+
+    See Also
+    --------
+    closeness_centrality
+
+    Notes
+    -----
+    The nodes are searched by decreasing degree, which tends to find
+    central nodes first.  The search from a node runs level by level.
+    Before the next level is visited, the sum of the distances to the
+    nodes not visited yet is bounded from below: at most as many of them
+    as the sum of the degrees of the current level are at the next
+    distance and the others are farther.  If the resulting upper bound
+    on the closeness centrality is smaller than the k-th largest value
+    found so far the search is stopped.  For directed graphs the number
+    of reachable nodes is bounded through the condensation of G.
+
+    References
+    ----------
+    .. [1] Elisabetta Bergamini, Michele Borassi, Pierluigi Crescenzi,
+       Andrea Marino and Henning Meyerhenke:
+       Computing Top-k Closeness Centrality Faster in Unweighted Graphs.
+       Proceedings of the 18th Workshop on Algorithm Engineering and
+       Experiments (ALENEX 2016), 68-80, 2016.
+    """
+    nodelist = G.nodes()
+    n = len(nodelist)
+    if n == 0 or k < 1:
+        return []
+    index = dict(zip(nodelist, range(n)))
+    adj = [[index[w] for w in G[v]] for v in nodelist]
+    if G.is_directed():
+        reach = _reach_bound(G, index)
+    else:
+        reach = [0] * n
+        for component in nx.connected_components(G):
+            for v in component:
+                reach[index[v]] = len(component)
+    scale = n - 1.0 if normalized else None
+    order = sorted(range(n), key=lambda v: -len(adj[v]))
+    mark = [None] * n
+    top = []  # heap of the k largest closeness centralities found
+    found = []
+    for v in order:
+        kth = top[0] if len(top) == k else None
+        c = _bfs_cut(adj, v, mark, reach[v], G.is_directed(), scale, kth)
+        if c is None:
+            continue
+        found.append((v, c))
+        if len(top) < k:
+            heappush(top, c)
+        elif c > top[0]:
+            heappushpop(top, c)
+    found.sort(key=lambda vc: (-vc[1], vc[0]))
+    return [(nodelist[v], c) for v, c in found[:k]]
+
+
+def _bfs_cut(adj, s, mark, reach, directed, scale, kth):
+    """Return the closeness centrality of s, or None if it is smaller
+    than kth.
+
+    reach is the number of nodes reachable from s or, for directed
+    graphs, an upper bound on it.  mark is a list of the last source
+    from which each node was visited.
+    """
+    mark[s] = s
+    frontier = [s]
+    visited = 1
+    total = 0
+    level = 0
+    while frontier:
+        if kth is not None:
+            # At most gamma nodes are at distance level + 1.
+            gamma = sum(len(adj[v]) for v in frontier)
+            if level > 0 and not directed:
+                gamma -= len(frontier)  # the edge to the previous level
+            if directed:
+                bound = max(_closeness_bound(r, visited, total, level, gamma,
+                                             scale)
+                            for r in (visited, min(visited + gamma, reach),
+                                      reach))
+            else:
+                bound = _closeness_bound(reach, visited, total, level, gamma,
+                                         scale)
+            if bound < kth:
+                return None
+        level += 1
+        next_level = []
+        for v in frontier:
+            for w in adj[v]:
+                if mark[w] != s:
+                    mark[w] = s
+                    next_level.append(w)
+        visited += len(next_level)
+        total += level * len(next_level)
+        frontier = next_level
+    return _closeness(visited, total, scale)
+
+
+def _closeness_bound(reached, visited, total, level, gamma, scale):
+    """Upper bound on the closeness centrality of a node that reaches
+    reached nodes, of which visited are at a total distance total and
+    at most level, and at most gamma at distance level + 1."""
+    rest = max(reached - visited, 0)
+    near = min(gamma, rest)
+    total += (level + 1) * near + (level + 2) * (rest - near)
+    return _closeness(visited + rest, total, scale)
+
+
+def _closeness(reached, total, scale):
+    """Closeness centrality of a node that reaches reached nodes at a
+    total distance total, computed as in closeness_centrality()."""
+    if total > 0 and scale:
+        return (reached - 1.0) / total * ((reached - 1.0) / scale)
+    elif total > 0:
+        return (reached - 1.0) / total
+    return 0.0
+
+
+def _reach_bound(G, index):
+    """Return a list of upper bounds on the number of nodes reachable
+    from each node of the directed graph G.
+
+    The bound of a strongly connected component is its size plus the
+    bounds of the components it has edges to.
+    """
+    C = nx.condensation(G)
+    members = C.node
+    bound = {}
+    for c in reversed(nx.topological_sort(C)):
+        bound[c] = min(len(members[c]['members']) +
+                       sum(bound[d] for d in C[c]), len(G))
+    reach = [0] * len(G)
+    for c in C:
+        for v in members[c]['members']:
+            reach[index[v]] = bound[c]
+    return reach
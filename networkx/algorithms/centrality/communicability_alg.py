@@ -9,6 +9,7 @@ Communicability and centrality measures.
 #    BSD license.
 import networkx as nx
 from networkx.utils import *
+from networkx.linalg.graphmatrix import _adjacency_operator, _block_size
 __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Franck Kalala (franckkalala@yahoo.fr'])
 __all__ = ['communicability_centrality_exp',
@@ -17,6 +18,9 @@ __all__ = ['communicability_centrality_exp',
            'communicability',
            'communicability_exp',
            'estrada_index',
+           'approximate_communicability',
+           'approximate_communicability_centrality',
+           'approximate_estrada_index',
            ]
 
 @not_implemented_for('directed')
@@ -476,6 +480,373 @@ def estrada_index(G):
     """
     return sum(communicability_centrality(G).values())
 
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def approximate_communicability(G, sources, targets=None, tol=1.0e-8):
+    r"""Return the communicability between the nodes in sources and the
+    nodes in targets without forming the matrix exponential.
+
+    Parameters
+    ----------
+    G: graph
+
+    sources: iterable
+        Nodes of G.
+
+    targets: iterable, optional (default=None)
+        Nodes of G.  If None, all nodes of G.
+
+    tol: float, optional (default=1.0e-8)
+        Error of the polynomial approximation of `e^A`, relative to the
+        largest value of `e^A` on a unit vector.
+
+    Returns
+    -------
+    comm: dictionary of dictionaries
+        Dictionary keyed by the nodes in sources of dictionaries keyed by
+        the nodes in targets with communicability as the value.
+
+    Raises
+    ------
+    NetworkXError
+        If the graph is not undirected and simple, or if a node is not in
+        the graph.
+
+    See Also
+    --------
+    communicability:
+        Communicability between all pairs of nodes in G.
+    approximate_communicability_centrality:
+        Approximate communicability centrality for each node of G.
+
+    Notes
+    -----
+    The column of `e^A` of each source `u` is computed from the sparse
+    adjacency matrix with a Chebyshev expansion [1]_,
+
+    .. math::
+
+        e^{A} e_u \approx e^{c} \left(I_0(r) e_u + 2\sum_{k=1}^{m}
+        I_k(r) T_k\left(\frac{A - cI}{r}\right) e_u\right),
+
+    where `[c - r, c + r]` holds the eigenvalues of `A`, `T_k` are the
+    Chebyshev polynomials and `I_k` the modified Bessel functions of the
+    first kind.  The expansion stops when the Bessel functions bound the
+    rest by `tol`, after about `r` terms: each costs one product by the
+    adjacency matrix, so the time is about `\lambda_{max}` times the
+    number of edges for every source.  Entries much smaller than `tol`
+    times `e^{\lambda_{max}}` have a larger relative error.
+
+    References
+    ----------
+    .. [1] Hillel Tal-Ezer, Ronnie Kosloff,
+       "An accurate and efficient scheme for propagating the time
+       dependent Schrodinger equation",
+       J. Chem. Phys. 81, 3967 (1984).
+
+    Examples
+    --------
+    >>> G = nx.Graph([(0,1),(1,2),(1,5),(5,4),(2,4),(2,3),(4,3),(3,6)])
+    >>> c = nx.approximate_communicability(G, [0, 1], targets=[6])
+    >>> round(c[0][6], 6) == round(nx.communicability_exp(G)[0][6], 6)
+    True
+    """
+    nodelist, A = _binary_adjacency(G)
+    index = dict(zip(nodelist, range(len(nodelist))))
+    sources = list(sources)
+    targets = nodelist if targets is None else list(targets)
+    for v in sources + targets:
+        if v not in index:
+            raise nx.NetworkXError("The node %s is not in the graph." % v)
+    if not sources:
+        return {}
+    rows = [index[v] for v in targets]
+    lmax = _largest_eigenvalues(A, 1)[0][0]
+    comm = {}
+    for start, F in _unit_columns(A, [index[u] for u in sources], lmax, tol):
+        F = F[rows]
+        for j in range(F.shape[1]):
+            comm[sources[start + j]] = dict(zip(targets, F[:, j].tolist()))
+    return comm
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def approximate_communicability_centrality(G, nodes=None, tol=1.0e-8,
+                                           samples=100, k=10, seed=None):
+    r"""Return an approximation of the communicability centrality of the
+    nodes of G.
+
+    Parameters
+    ----------
+    G: graph
+
+    nodes: iterable, optional (default=None)
+        Nodes of G.  If given, the centrality of these nodes is computed
+        up to `tol` from the columns of `e^A`.  If None, the centrality of
+        all nodes is estimated with `samples` random vectors.
+
+    tol: float, optional (default=1.0e-8)
+        Error of the polynomial approximation of `e^A`, relative to the
+        largest value of `e^A` on a unit vector that is not deflated.
+
+    samples: integer, optional (default=100)
+        Number of random vectors of the estimate.  If it is at least the
+        number of nodes, the centrality of all nodes is computed as for
+        given nodes instead.
+
+    k: integer, optional (default=10)
+        Number of largest eigenvalues of the adjacency matrix whose terms
+        are computed exactly in the estimate.
+
+    seed: integer, optional (default=None)
+        Seed for the random vectors.
+
+    Returns
+    -------
+    nodes: dictionary
+        Dictionary of nodes with communicability centrality as the value.
+
+    Raises
+    ------
+    NetworkXError
+        If the graph is not undirected and simple, or if a node is not in
+        the graph.
+
+    See Also
+    --------
+    communicability_centrality:
+        Communicability centrality for each node of G.
+    approximate_communicability:
+        Approximate communicability between pairs of nodes in G.
+    approximate_estrada_index:
+        Approximate Estrada index of G.
+
+    Notes
+    -----
+    The communicability centrality of `u` is `(e^A)_{uu}`.  For given
+    nodes it is read from the columns of `e^A` computed as in
+    approximate_communicability().
+
+    For all nodes the `k` largest eigenvalues `\lambda_j` of `A` and their
+    eigenvectors `\phi_j` are computed, and the rest of the diagonal is
+    estimated from random vectors `z` with entries `\pm 1` [1]_ [2]_,
+
+    .. math::
+
+        SC(u) \approx \sum_{j=1}^{k} \phi_j(u)^2 e^{\lambda_j} +
+        \frac{1}{s}\sum_{i=1}^{s} z_i(u) \left(e^{A} P z_i\right)(u),
+
+    where `P` projects out the `k` eigenvectors and `s` is the number of
+    samples.  The estimate is unbiased and its standard deviation is at
+    most about `e^{\lambda_{k+1}} / \sqrt{s}`, which is small compared with
+    the centrality of the nodes with large eigenvector components when
+    the largest eigenvalues are well separated, as in most networks.
+    The time is about `\lambda_{max}` times the number of edges for every
+    sample.
+
+    References
+    ----------
+    .. [1] Costas Bekas, Effrosyni Kokiopoulou, Yousef Saad,
+       "An estimator for the diagonal of a matrix",
+       Applied Numerical Mathematics 57, 1214-1229 (2007).
+    .. [2] Ernesto Estrada, Juan A. Rodriguez-Velazquez,
+       "Subgraph centrality in complex networks",
+       Physical Review E 71, 056103 (2005).
+       http://arxiv.org/abs/cond-mat/0504730
+
+    Examples
+    --------
+    >>> G = nx.Graph([(0,1),(1,2),(1,5),(5,4),(2,4),(2,3),(4,3),(3,6)])
+    >>> sc = nx.approximate_communicability_centrality(G, nodes=[3])
+    >>> round(sc[3], 6) == round(nx.communicability_centrality(G)[3], 6)
+    True
+    """
+    nodelist, A = _binary_adjacency(G)
+    index = dict(zip(nodelist, range(len(nodelist))))
+    n = len(nodelist)
+    if nodes is None and n > samples:
+        return dict(zip(nodelist, _estimated_diagonal(A, tol, samples, k,
+                                                      seed).tolist()))
+    nodes = nodelist if nodes is None else list(nodes)
+    for v in nodes:
+        if v not in index:
+            raise nx.NetworkXError("The node %s is not in the graph." % v)
+    ids = [index[v] for v in nodes]
+    if not ids:
+        return {}
+    lmax = _largest_eigenvalues(A, 1)[0][0]
+    sc = {}
+    for start, F in _unit_columns(A, ids, lmax, tol):
+        for j in range(F.shape[1]):
+            sc[nodes[start + j]] = float(F[ids[start + j], j])
+    return sc
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def approximate_estrada_index(G, tol=1.0e-8, samples=100, k=10, seed=None):
+    r"""Return an approximation of the Estrada index of the graph G.
+
+    Parameters
+    ----------
+    G: graph
+
+    tol: float, optional (default=1.0e-8)
+        Error of the polynomial approximation of `e^A`, relative to the
+        largest value of `e^A` on a unit vector that is not deflated.
+
+    samples: integer, optional (default=100)
+        Number of random vectors of the estimate.  If it is at least the
+        number of nodes, the index is computed up to `tol` instead.
+
+    k: integer, optional (default=10)
+        Number of largest eigenvalues of the adjacency matrix whose terms
+        are computed exactly.
+
+    seed: integer, optional (default=None)
+        Seed for the random vectors.
+
+    Returns
+    -------
+    estrada index: float
+
+    Raises
+    ------
+    NetworkXError
+        If the graph is not undirected and simple.
+
+    See Also
+    --------
+    estrada_index, approximate_communicability_centrality
+
+    Notes
+    -----
+    The Estrada index is the trace of `e^A`, the sum of the
+    communicability centralities estimated by
+    approximate_communicability_centrality(): the `k` largest
+    eigenvalues contribute `e^{\lambda_j}` exactly and the trace of the
+    rest is estimated from `samples` random vectors [1]_.
+
+    References
+    ----------
+    .. [1] Shashanka Ubaru, Jie Chen, Yousef Saad,
+       "Fast estimation of tr(f(A)) via stochastic Lanczos quadrature",
+       SIAM J. Matrix Anal. Appl. 38, 1075-1099 (2017).
+
+    Examples
+    --------
+    >>> G = nx.Graph([(0,1),(1,2),(1,5),(5,4),(2,4),(2,3),(4,3),(3,6)])
+    >>> ei = nx.approximate_estrada_index(G)
+    >>> round(ei, 6) == round(nx.estrada_index(G), 6)
+    True
+    """
+    sc = approximate_communicability_centrality(G, tol=tol, samples=samples,
+                                                k=k, seed=seed)
+    return float(sum(sc.values()))
+
+def _binary_adjacency(G):
+    """Return the nodes of G and its adjacency matrix as a 0-1 SciPy CSR
+    matrix, which is 0 by 0 if G has no nodes."""
+    if len(G) == 0:
+        import scipy.sparse
+        return [], scipy.sparse.csr_matrix((0, 0))
+    nodelist, A = _adjacency_operator(G, weight=None)
+    if (A.data != 1).any():
+        A = A.copy()
+        A.data[:] = 1
+    return nodelist, A
+
+def _largest_eigenvalues(A, k):
+    """Return the k largest eigenvalues of the symmetric matrix A in
+    decreasing order and their eigenvectors as columns, or all of them
+    if A has at most k + 1 rows."""
+    import numpy
+    n = A.shape[0]
+    if A.nnz == 0:
+        return numpy.zeros(min(k, n)), numpy.eye(n, min(k, n))
+    if n <= k + 1:
+        w, v = numpy.linalg.eigh(A.toarray())
+    else:
+        from scipy.sparse.linalg import eigsh
+        w, v = eigsh(A, k=k, which='LA')
+    order = numpy.argsort(w)[::-1][:k]
+    return w[order], v[:, order]
+
+def _unit_columns(A, ids, lmax, tol):
+    """Generate the position in ids and the columns of e^A of the nodes
+    ids[start:start + b], for blocks of b nodes."""
+    import numpy
+    n = A.shape[0]
+    b = _block_size(n)
+    for start in range(0, len(ids), b):
+        block = ids[start:start + b]
+        B = numpy.zeros((n, len(block)))
+        B[block, numpy.arange(len(block))] = 1
+        yield start, _expm_multiply(A, B, -lmax, lmax, tol)
+
+def _estimated_diagonal(A, tol, samples, k, seed):
+    """Return the estimate of the diagonal of e^A with the k largest
+    eigenvalues deflated, see approximate_communicability_centrality()."""
+    import numpy
+    n = A.shape[0]
+    w, Q = _largest_eigenvalues(A, k + 1)
+    lmax = w[0]
+    # The rest lies in [-lmax, lambda_{k+1}].
+    upper = w[-1] if len(w) > k else lmax
+    w, Q = w[:k], Q[:, :k]
+    diagonal = numpy.dot(Q ** 2, numpy.exp(w))
+    rng = numpy.random.RandomState(seed)
+    b = _block_size(n)
+    tail = numpy.zeros(n)
+    for start in range(0, samples, b):
+        Z = rng.randint(2, size=(n, min(b, samples - start))) * 2.0 - 1
+        F = _expm_multiply(A, Z, -lmax, upper, tol, Q)
+        tail += (Z * F).sum(axis=1)
+    return diagonal + tail / samples
+
+def _expm_multiply(A, B, lower, upper, tol, Q=None):
+    """Return e^A P B for a symmetric matrix A with the eigenvalues in
+    [lower, upper] on the range of P, by the Chebyshev expansion of e^x
+    on that interval.
+
+    P projects out the orthonormal columns of Q, which must span an
+    invariant subspace of A, or is the identity if Q is None.  The
+    projection is applied at every term so that rounding errors in the
+    directions of Q, whose eigenvalues are larger than upper, do not grow.
+    """
+    import numpy
+    from scipy.special import ive
+
+    def project(X):
+        if Q is None or Q.shape[1] == 0:
+            return X
+        return X - numpy.dot(Q, numpy.dot(Q.T, X))
+
+    c = (upper + lower) / 2.0
+    r = (upper - lower) / 2.0
+    X = project(B)
+    if r <= 0:
+        return numpy.exp(c) * X
+    # Coefficients relative to e^upper: e^c I_j(r) = e^upper ive(j, r).
+    # For j > r the ratio of consecutive Bessel functions is below
+    # r / (j + 1), which bounds the rest of the series.
+    coefficients = [ive(0, r)]
+    j = 1
+    while True:
+        a = ive(j, r)
+        if j > r and 2 * a / (1 - r / (j + 1.0)) < tol:
+            break
+        coefficients.append(2 * a)
+        j += 1
+    T0 = X
+    T1 = project((A.dot(X) - c * X) / r)
+    F = coefficients[0] * T0
+    if len(coefficients) > 1:
+        F += coefficients[1] * T1
+    for a in coefficients[2:]:
+        T0, T1 = T1, project(2 * (A.dot(T1) - c * T1) / r - T0)
+        F += a * T1
+    return numpy.exp(upper) * F
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -117,18 +117,26 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
         raise nx.NetworkXError('Number random pairs k>kmax (%d>%d) '%(k,kmax),
                                'Increase kmax or epsilon')
     cstar2k = cstar/(2*k)
+    # the weights of the edges at each node, from the Laplacian
+    W = -L.tocsr()
+    W.setdiag(0)
+    W.eliminate_zeros()
+    rows = np.repeat(np.arange(n), np.diff(W.indptr))
+    total = np.zeros(n)
     for i in range(k):
         s,t = random.sample(range(n),2)
         b = np.zeros(n, dtype=dtype)
         b[s] = 1
         b[t] = -1
         p = C.solve(b)
-        for v in H:
-            if v==s or v==t:
-                continue
-            for nbr in H[v]:
-                w = H[v][nbr].get(weight,1.0)
-                betweenness[v] += w*np.abs(p[v]-p[nbr])*cstar2k
+        # current through each node other than s and t
+        flow = np.bincount(rows, W.data*np.abs(p[rows]-p[W.indices]),
+                           minlength=n)
+        flow[s] = 0
+        flow[t] = 0
+        total += flow
+    for v in H:
+        betweenness[v] = total[v]*cstar2k
     if normalized:
         factor = 1.0
     else:
@@ -8,8 +8,11 @@
 #    BSD license.
 import networkx as nx
 from networkx.algorithms.centrality.flow_matrix import *
+from networkx.algorithms.centrality.flow_matrix import _resistance_sketch
 __author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
-__all__ = ['current_flow_closeness_centrality', 'information_centrality']
+__all__ = ['current_flow_closeness_centrality', 'information_centrality',
+           'approximate_current_flow_closeness_centrality',
+           'approximate_effective_resistance']
 
 def current_flow_closeness_centrality(G, weight='weight',
                                       dtype=float, solver='lu'):
@@ -96,6 +99,192 @@ def current_flow_closeness_centrality(G, weight='weight',
 information_centrality = current_flow_closeness_centrality
 
 
+def approximate_current_flow_closeness_centrality(G, weight='weight',
+                                                  epsilon=0.5, solver='pcg',
+                                                  tol=1e-5, seed=None):
+    r"""Compute the approximate current-flow closeness centrality for nodes.
+
+    The effective resistances between all pairs of nodes are approximated
+    by the distances between the rows of a random projection of the
+    graph [1]_, which takes `O(\log n / \epsilon^2)` Laplacian solves in
+    place of one for every node.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    weight : string or None, optional (default='weight')
+      Key for edge data used as the edge weight.
+      If None, then use 1 as each edge weight.
+
+    epsilon: float, optional (default=0.5)
+      Relative error of the effective resistances, which sets the number
+      `k = \lceil 24 \ln n / \epsilon^2 \rceil` of random projections.
+
+    solver: string (default='pcg')
+       Type of linear solver to use for the Laplacian solves.  Options
+       are "pcg" (preconditioned conjugate gradient method, uses least
+       memory), "chol" (Cholesky factorization, requires scikits.sparse)
+       and "lu" (LU factorization).
+
+    tol: float, optional (default=1e-5)
+       Tolerance of relative residual for the "pcg" solver.
+
+    seed: integer, optional (default=None)
+       Seed for the random projections.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with current flow closeness centrality as the
+       value.
+
+    Raises
+    ------
+    NetworkXError
+       If the graph is directed or not connected.
+
+    See Also
+    --------
+    current_flow_closeness_centrality, approximate_effective_resistance
+
+    Notes
+    -----
+    The current-flow closeness centrality of `v` is `1 / \sum_u R(u, v)`
+    for the effective resistances `R(u, v)`.  With the rows `z_u` of the
+    projection the sum is `\sum_u \|z_u - z_v\|^2`, which takes `O(nk)`
+    time for all nodes together.  With high probability all the sums are
+    within a factor `1 \pm \epsilon` of the exact ones.
+
+    References
+    ----------
+    .. [1] Daniel A. Spielman and Nikhil Srivastava:
+       Graph Sparsification by Effective Resistances.
+       SIAM Journal on Computing 40(6):1913-1926, 2011.
+       http://arxiv.org/abs/0803.0929
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> c = nx.approximate_current_flow_closeness_centrality(G, seed=1)
+    >>> c[0] < c[1]
+    True
+    """
+    import numpy as np
+    if G.is_directed():
+        raise nx.NetworkXError(
+            "current_flow_closeness_centrality() not defined for digraphs.")
+    if not nx.is_connected(G):
+        raise nx.NetworkXError("Graph not connected.")
+    nodelist, blocks = _resistance_sketch(G, weight, epsilon, solver, tol,
+                                          seed)
+    n = len(nodelist)
+    total = np.zeros(n)
+    for Z in blocks:
+        # sum over u of |z_u - z_v|^2 for every column
+        square = Z ** 2
+        total += n * square.sum(axis=1) + square.sum() - \
+            2 * Z.dot(Z.sum(axis=0))
+    return dict(zip(nodelist, (1.0 / total).tolist()))
+
+
+def approximate_effective_resistance(G, pairs=None, weight='weight',
+                                     epsilon=0.5, solver='pcg', tol=1e-5,
+                                     seed=None):
+    r"""Compute approximate effective resistances between pairs of nodes.
+
+    The effective resistance between two nodes is the potential
+    difference between them when a unit current enters the graph at one
+    and leaves it at the other, the edges being resistors of resistance
+    `1 / weight`.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    pairs : iterable of 2-tuples, optional (default=None)
+      Pairs of nodes.  If None, the edges of G.
+
+    weight : string or None, optional (default='weight')
+      Key for edge data used as the edge weight.
+      If None, then use 1 as each edge weight.
+
+    epsilon: float, optional (default=0.5)
+      Relative error of the effective resistances, which sets the number
+      `k = \lceil 24 \ln n / \epsilon^2 \rceil` of random projections.
+
+    solver: string (default='pcg')
+       Type of linear solver to use for the Laplacian solves, see
+       approximate_current_flow_closeness_centrality().
+
+    tol: float, optional (default=1e-5)
+       Tolerance of relative residual for the "pcg" solver.
+
+    seed: integer, optional (default=None)
+       Seed for the random projections.
+
+    Returns
+    -------
+    resistances : dictionary
+       Dictionary keyed by the pairs with effective resistance as the
+       value.
+
+    Raises
+    ------
+    NetworkXError
+       If the graph is directed or not connected, or if a node is not in
+       the graph.
+
+    See Also
+    --------
+    approximate_current_flow_closeness_centrality
+
+    Notes
+    -----
+    The resistances are the squared distances between the rows of the
+    random projection of [1]_, computed with `k` Laplacian solves by one
+    solver, in `O(m k)` time and `O(n + |pairs|)` memory besides the
+    solver.  With high probability all of them are within a factor
+    `1 \pm \epsilon` of the exact values.
+
+    References
+    ----------
+    .. [1] Daniel A. Spielman and Nikhil Srivastava:
+       Graph Sparsification by Effective Resistances.
+       SIAM Journal on Computing 40(6):1913-1926, 2011.
+       http://arxiv.org/abs/0803.0929
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> r = nx.approximate_effective_resistance(G, [(0, 3)], epsilon=0.1)
+    >>> abs(r[0, 3] - 3) < 0.5
+    True
+    """
+    import numpy as np
+    if G.is_directed():
+        raise nx.NetworkXError(
+            "approximate_effective_resistance() not defined for digraphs.")
+    if not nx.is_connected(G):
+        raise nx.NetworkXError("Graph not connected.")
+    pairs = G.edges() if pairs is None else list(pairs)
+    nodelist, blocks = _resistance_sketch(G, weight, epsilon, solver, tol,
+                                          seed)
+    index = dict(zip(nodelist, range(len(nodelist))))
+    for pair in pairs:
+        for x in pair:
+            if x not in index:
+                raise nx.NetworkXError("The node %s is not in the graph." % x)
+    u = np.array([index[x] for x, y in pairs], dtype=int)
+    v = np.array([index[y] for x, y in pairs], dtype=int)
+    resistance = np.zeros(len(pairs))
+    for Z in blocks:
+        resistance += ((Z[u] - Z[v]) ** 2).sum(axis=1)
+    return dict(zip(pairs, resistance.tolist()))
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
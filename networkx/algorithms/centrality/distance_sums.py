@@ -0,0 +1,330 @@
+"""
+Closeness, harmonic centrality, eccentricity and average distance from
+one pass of shortest path searches.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from __future__ import division
+import networkx as nx
+__all__ = ['distance_centralities']
+
+
+def distance_centralities(G, distance=None, normalized=True, n_jobs=None):
+    r"""Compute closeness centrality, harmonic centrality, eccentricity
+    and average distance of the nodes together.
+
+    All four are functions of the shortest path distances from a node,
+    so a single search from every node gives them all.  For a node `u`
+    reaching the `r(u) - 1` other nodes `v` at distance `d(u, v)`,
+
+    .. math::
+
+        closeness(u) = \frac{r(u) - 1}{\sum_v d(u, v)}, \quad
+        harmonic(u) = \sum_v \frac{1}{d(u, v)},
+
+    the eccentricity of `u` is the largest `d(u, v)` and the average
+    distance is `\sum_v d(u, v) / (r(u) - 1)`.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    distance : edge attribute key, optional (default=None)
+      Use the specified edge attribute as the edge distance in shortest
+      path calculations.  If None, each edge has distance 1.
+
+    normalized : bool, optional (default=True)
+      If True normalize the closeness centrality by the number of nodes
+      in the connected part of the graph, as closeness_centrality() does.
+
+    n_jobs : int, optional (default=None)
+      Number of worker processes among which the sources are split.  If
+      None or 1 all distances are computed in this process.
+
+    Returns
+    -------
+    centralities : dictionary
+      Dictionary with keys 'closeness', 'harmonic', 'eccentricity' and
+      'average_distance', each a dictionary keyed by node.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> c = nx.distance_centralities(G)
+    >>> c['closeness'] == nx.closeness_centrality(G)
+    True
+    >>> c['eccentricity'] == nx.eccentricity(G)
+    True
+    >>> c['average_distance'][0]
+    2.0
+
+    See Also
+    --------
+    closeness_centrality, harmonic_centrality, eccentricity
+
+    Notes
+    -----
+    The values only take into account the nodes reachable from each
+    node: unlike eccentricity() no error is raised for disconnected
+    graphs.  For directed graphs the distances are those from the node,
+    as in closeness_centrality(), while harmonic_centrality() uses the
+    distances to the node.  The average distance of a node that reaches
+    no other node is 0.
+
+    For unweighted graphs the sources are searched 64 at a time with the
+    multi-source breadth-first search of [1]_: each node holds a word
+    whose bits mark the sources that reached it, and one level of all
+    the searches is a bitwise or of the words of the neighbors.  This
+    requires NumPy; without it, and for weighted graphs and multigraphs,
+    every source is searched on its own.  So are the sources of graphs
+    deeper than the number of sources searched at once, such as long
+    paths, since every level of the searches goes over all the edges.
+
+    References
+    ----------
+    .. [1] Manuel Then, Moritz Kaufmann, Fernando Chirigati, Tuan-Anh
+       Hoang-Vu, Kien Pham, Alfons Kemper, Thomas Neumann and Huy T. Vo:
+       The More the Merrier: Efficient Multi-Source Graph Traversal.
+       Proceedings of the VLDB Endowment 8(4):449-460, 2014.
+    """
+    sums = _distance_sums(G, G.nodes(), distance, n_jobs=n_jobs)
+    n = len(G)
+    closeness = {}
+    harmonic = {}
+    eccentricity = {}
+    average = {}
+    for v, (reached, total, inverse, farthest) in sums.items():
+        if total > 0 and n > 1:
+            closeness[v] = (reached - 1.0) / total
+            if normalized:
+                closeness[v] *= (reached - 1.0) / (n - 1)
+            average[v] = total / (reached - 1.0)
+        else:
+            closeness[v] = 0.0
+            average[v] = 0.0
+        harmonic[v] = inverse
+        eccentricity[v] = farthest
+    return {'closeness': closeness, 'harmonic': harmonic,
+            'eccentricity': eccentricity, 'average_distance': average}
+
+
+def _distance_sums(G, sources, weight=None, reverse=False, n_jobs=None,
+                   totals=False):
+    """Return a dict mapping each node in sources to a tuple (reached,
+    total, inverse, farthest): the number of nodes reached from it
+    (itself included), and the sum, the sum of the reciprocals and the
+    maximum of their distances.
+
+    If reverse is True the distances to the sources are used instead
+    for directed graphs.  Zero distances to other nodes are left out of
+    the sum of the reciprocals.  If totals is True the sources searched
+    one at a time only get the first two values, and None for the others.
+    """
+    sources = list(sources)
+    sums = {}
+    # Below 64 sources a word of the multi-source search is mostly empty,
+    # and a single search costs less than one level over the whole graph.
+    if weight is None and not G.is_multigraph() and len(sources) >= 64:
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            sums, sources = _multi_bfs_sums(G, sources, reverse, n_jobs)
+    if not sources:
+        return sums
+    if reverse and G.is_directed():
+        G = G.reverse()
+    if n_jobs is not None and n_jobs > 1:
+        lengths = nx.parallel_all_pairs_path_length(G, weight, n_jobs=n_jobs,
+                                                    nodelist=sources)
+    elif weight is None:
+        lengths = ((s, nx.single_source_shortest_path_length(G, s))
+                   for s in sources)
+    else:
+        lengths = ((s, nx.single_source_dijkstra_path_length(G, s,
+                                                              weight=weight))
+                   for s in sources)
+    for s, dist in lengths:
+        d = dist.values()
+        if totals:
+            sums[s] = (len(dist), sum(d), None, None)
+        else:
+            sums[s] = (len(dist), sum(d), sum(1 / x for x in d if x > 0),
+                       max(d))
+    return sums
+
+
+def _multi_bfs_sums(G, sources, reverse, n_jobs):
+    """_distance_sums for unweighted graphs with the bit-parallel
+    multi-source breadth-first search.
+
+    Returns the sums and the list of the sources left to search one at a
+    time because the graph is too deep for the multi-source search.
+    """
+    import numpy as np
+    if G.is_directed():
+        H = G if isinstance(G, nx.CSRDiGraph) else nx.CSRDiGraph(G,
+                                                                 weight=None)
+        # A node is reached from the sources that reached one of its
+        # predecessors, which are the successors in the reverse graph.
+        if not reverse:
+            H = H.reverse()
+    else:
+        H = G if isinstance(G, nx.CSRGraph) else nx.CSRGraph(G, weight=None)
+    index = H.node._index
+    ids = np.array([index[s] for s in sources], dtype=np.int64)
+    # Sources per pass, 64 per word, so that the neighbor words gathered
+    # in one level take at most 2**23 words.
+    words = max(1, min(16, 2 ** 23 // max(len(H.indices), 1),
+                       (len(ids) + 63) // 64))
+    size = 64 * words
+    # A level over the whole graph costs about as much as one search from
+    # a single source, so the sources of a pass that would go deeper than
+    # its number of sources are searched one at a time: on path_graph(5000)
+    # that is four times faster.  A pass is at least as deep as the search
+    # from its first source, which is run first, and in a connected graph
+    # at most twice as deep.
+    if G.is_directed():
+        indptr, indices = H._pindptr.tolist(), H._pindices.tolist()
+    else:
+        indptr, indices = H.indptr.tolist(), H.indices.tolist()
+    batches = []
+    left = []
+    for i in range(0, len(ids), size):
+        if _depth(indptr, indices, ids[i], size // 2) > size // 2:
+            left.extend(sources[i:i + size])
+        else:
+            batches.append((ids[i:i + size],
+                            np.arange(i, min(i + size, len(ids)))))
+    if n_jobs is not None and n_jobs > 1:
+        results = _parallel_batches(H.indptr, H.indices, batches, size,
+                                    n_jobs)
+    else:
+        results = ((batch[1].tolist(),
+                    _multi_bfs(H.indptr, H.indices, batch, size))
+                   for batch in batches)
+    sums = {}
+    for positions, columns in results:
+        if columns is None:
+            left.extend(sources[s] for s in positions)
+            continue
+        for s, reached, total, inverse, farthest in zip(positions, *columns):
+            sums[sources[s]] = (reached, total, inverse, farthest)
+    return sums, left
+
+
+def _depth(indptr, indices, source, cutoff):
+    """Return the largest distance from source to the nodes it reaches
+    along the rows of indices, or cutoff + 1 if it is larger."""
+    seen = set([source])
+    frontier = [source]
+    level = -1
+    while frontier:
+        level += 1
+        if level > cutoff:
+            break
+        nextlevel = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if v not in seen:
+                    seen.add(v)
+                    nextlevel.append(v)
+        frontier = nextlevel
+    return level
+
+
+def _multi_bfs(indptr, indices, batch, max_level=None):
+    """Search at once from the nodes in batch, a pair of arrays of the
+    nodes and of their positions in the list of all sources.
+
+    A node is reached from the sources that reached the nodes in its row
+    of indices.  Returns lists of the number of reached nodes, the sum,
+    the sum of the reciprocals and the maximum of the distances for each
+    source, or None if the search goes deeper than max_level.
+    """
+    import numpy as np
+    n = len(indptr) - 1
+    nodes = batch[0]
+    k = len(nodes)
+    words = (k + 63) // 64
+    seen = np.zeros((n, words), dtype=np.uint64)
+    bit = np.arange(k)
+    np.bitwise_or.at(seen, (nodes, bit // 64),
+                     np.left_shift(np.uint64(1), (bit % 64).astype(np.uint64)))
+    frontier = seen.copy()
+    rows = np.flatnonzero(np.diff(indptr))  # nodes with neighbors
+    starts = indptr[rows]
+    reached = np.ones(k, dtype=np.int64)
+    total = np.zeros(k, dtype=np.int64)
+    inverse = np.zeros(k)
+    farthest = np.zeros(k, dtype=np.int64)
+    level = 0
+    while len(rows):
+        level += 1
+        if max_level is not None and level > max_level:
+            return None
+        new = np.zeros((n, words), dtype=np.uint64)
+        new[rows] = np.bitwise_or.reduceat(frontier[indices], starts, axis=0)
+        new &= ~seen
+        touched = np.flatnonzero(new.any(axis=1))
+        if not len(touched):
+            break
+        seen[touched] |= new[touched]
+        frontier = new
+        # Number of nodes first reached at this level from each source.
+        bits = np.unpackbits(new[touched].astype('<u8').view(np.uint8),
+                             axis=1)
+        # unpackbits puts the highest bit of each byte first.
+        count = bits.sum(axis=0, dtype=np.int64).reshape(-1, 8)[:, ::-1]
+        count = count.ravel()[:k]
+        reached += count
+        total += level * count
+        inverse += count / level
+        farthest[count > 0] = level
+    return (reached.tolist(), total.tolist(), inverse.tolist(),
+            farthest.tolist())
+
+
+def _parallel_batches(indptr, indices, batches, max_level, n_jobs):
+    """Generate the positions and the results of _multi_bfs for every
+    batch, computed by a pool of n_jobs worker processes that share one
+    copy of the graph."""
+    import numpy as np
+    from multiprocessing import Pool
+    from multiprocessing.sharedctypes import RawArray
+    shared = []
+    for a in (indptr, indices):
+        raw = RawArray('b', max(a.nbytes, 1))
+        np.frombuffer(raw, dtype=a.dtype, count=len(a))[:] = a
+        shared.append((raw, a.dtype.str, len(a)))
+    pool = Pool(n_jobs, initializer=_init_worker,
+                initargs=(shared, max_level))
+    try:
+        for result in pool.imap_unordered(_run_batch, batches):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+_worker = {}  # state of a worker process, set by _init_worker
+
+
+def _init_worker(shared, max_level):
+    import numpy as np
+    _worker['max_level'] = max_level
+    _worker['arrays'] = [np.frombuffer(raw, dtype=dtype, count=count)
+                         for raw, dtype, count in shared]
+
+
+def _run_batch(batch):
+    indptr, indices = _worker['arrays']
+    return (batch[1].tolist(),
+            _multi_bfs(indptr, indices, batch, _worker['max_level']))
@@ -9,6 +9,7 @@ Eigenvector centrality.
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.linalg.graphmatrix import _adjacency_operator
 __author__ = "\n".join(['Aric Hagberg (aric.hagberg@gmail.com)',
                         'Pieter Swart (swart@lanl.gov)',
                         'Sasha Gutfraind (ag362@cornell.edu)'])
@@ -74,7 +75,8 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
     The eigenvector calculation is done by the power iteration method and has
     no guarantee of convergence. The iteration will stop after ``max_iter``
     iterations or an error tolerance of ``number_of_nodes(G)*tol`` has been
-    reached.
+    reached.  If SciPy is available the iteration multiplies by the
+    adjacency matrix as a sparse matrix.
 
     For directed graphs this is "left" eigenvector centrality which corresponds
     to the in-edges in the graph. For out-edges eigenvector centrality
@@ -98,6 +100,18 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
     if len(G) == 0:
         raise nx.NetworkXException("Empty graph.")
 
+    try:
+        import scipy.sparse
+    except ImportError:
+        pass
+    else:
+        x = _eigenvector_power_iteration(G, max_iter, tol, nstart, weight)
+        if x is None:
+            raise nx.NetworkXError('eigenvector_centrality(): power '
+                                   'iteration failed to converge in %d '
+                                   'iterations.' % max_iter)
+        return x
+
     if nstart is None:
         # choose starting vector with entries of 1/len(G)
         x = dict([(n,1.0/len(G)) for n in G])
@@ -129,11 +143,13 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
         if err < nnodes*tol:
             return x
 
-    raise nx.NetworkXError("""eigenvector_centrality():
-power iteration failed to converge in %d iterations."%(i+1))""")
+    raise nx.NetworkXError('eigenvector_centrality(): power '
+                           'iteration failed to converge in %d '
+                           'iterations.' % max_iter)
 
 
-def eigenvector_centrality_numpy(G, weight='weight'):
+def eigenvector_centrality_numpy(G, weight='weight', max_iter=50, tol=0,
+                                 dtype=float):
     """Compute the eigenvector centrality for the graph G.
 
     Eigenvector centrality computes the centrality for a node based on the
@@ -157,6 +173,18 @@ def eigenvector_centrality_numpy(G, weight='weight'):
       The name of the edge attribute used as weight.
       If None, all edge weights are considered equal.
 
+    max_iter : integer, optional (default=50)
+      Maximum number of Arnoldi update iterations allowed, per
+      eigenvalue sought.
+
+    tol : float, optional (default=0)
+      Relative accuracy for eigenvalues (stopping criterion).
+      The default value of 0 implies machine precision.
+
+    dtype : NumPy data type, optional (default=float)
+      The data type of the adjacency matrix and of the computation.
+      Use numpy.float32 to halve the memory of the matrix.
+
     Returns
     -------
     nodes : dictionary
@@ -180,7 +208,9 @@ def eigenvector_centrality_numpy(G, weight='weight'):
     The measure was introduced by [1]_.
 
     This algorithm uses the SciPy sparse eigenvalue solver (ARPACK) to
-    find the largest eigenvalue/eigenvector pair.
+    find the largest eigenvalue/eigenvector pair, the solver for symmetric
+    matrices for undirected graphs.  The adjacency matrix of a CSRGraph
+    is built once and shared with the other sparse solvers.
 
     For directed graphs this is "left" eigenvector centrality which corresponds
     to the in-edges in the graph. For out-edges eigenvector centrality
@@ -196,19 +226,59 @@ def eigenvector_centrality_numpy(G, weight='weight'):
        Networks: An Introduction.
        Oxford University Press, USA, 2010, pp. 169.
     """
-    import scipy as sp
+    import numpy as np
     from scipy.sparse import linalg
     if len(G) == 0:
         raise nx.NetworkXException('Empty graph.')
-    M = nx.to_scipy_sparse_matrix(G, nodelist=G.nodes(), weight=weight,
-                                  dtype=float)
-    eigenvalue, eigenvector = linalg.eigs(M.T, k=1, which='LR')
-    largest = eigenvector.flatten().real
-    norm = sp.sign(largest.sum())*sp.linalg.norm(largest)
-    centrality = dict(zip(G,map(float,largest/norm)))
+    nodelist, M = _adjacency_operator(G, weight, dtype)
+    if len(G) < 3:
+        # ARPACK needs more rows than eigenvalues sought plus one
+        eigenvalues, eigenvectors = np.linalg.eig(M.T.toarray())
+        largest = eigenvectors[:, eigenvalues.real.argmax()].real
+    elif G.is_directed():
+        eigenvalue, eigenvector = linalg.eigs(M.T, k=1, which='LR',
+                                              maxiter=max_iter, tol=tol)
+        largest = eigenvector.flatten().real
+    else:
+        eigenvalue, eigenvector = linalg.eigsh(M, k=1, which='LA',
+                                               maxiter=max_iter, tol=tol)
+        largest = eigenvector.flatten()
+    norm = np.sign(largest.sum()) * np.linalg.norm(largest)
+    centrality = dict(zip(nodelist, (largest / norm).tolist()))
     return centrality
 
 
+def _eigenvector_power_iteration(G, max_iter, tol, nstart, weight):
+    """Return the eigenvector centrality computed by eigenvector_centrality()
+    with a sparse adjacency matrix, or None if the iteration did not
+    converge."""
+    import numpy as np
+    nodelist, A = _adjacency_operator(G, weight)
+    AT = A.T
+    nnodes = len(nodelist)
+    if nstart is None:
+        # choose starting vector with entries of 1/len(G)
+        x = np.repeat(1.0 / nnodes, nnodes)
+    else:
+        x = np.array([nstart[n] for n in nodelist], dtype=float)
+    # normalize starting vector
+    x /= x.sum()
+    # make up to max_iter iterations
+    for i in range(max_iter):
+        xlast = x
+        # do the multiplication y^T = x^T A
+        x = AT.dot(xlast)
+        # normalize vector
+        norm = np.sqrt((x ** 2).sum())
+        if norm > 0:
+            x /= norm
+        # check convergence
+        err = np.absolute(x - xlast).sum()
+        if err < nnodes * tol:
+            return dict(zip(nodelist, x.tolist()))
+    return None
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -137,3 +137,101 @@ def laplacian_sparse_matrix(G, nodelist=None, weight='weight', dtype=None,
     data = np.asarray(A.sum(axis=1).T)
     D = scipy.sparse.spdiags(data,0,n,n, format=format)
     return  D - A
+
+
+def _laplacian_edges(G, weight='weight'):
+    """Return the nodes of G, its Laplacian as a CSR matrix and the
+    endpoints and weights of its edges, each once, as arrays.
+
+    Self-loops are left out and parallel edges are merged.
+    """
+    import numpy as np
+    import scipy.sparse
+    from networkx.linalg.graphmatrix import _adjacency_operator
+    nodelist, A = _adjacency_operator(G, weight=weight)
+    A = A.tolil()
+    A.setdiag(0)
+    A = A.tocsr()
+    A.eliminate_zeros()
+    n = A.shape[0]
+    degree = np.asarray(A.sum(axis=1)).ravel()
+    L = scipy.sparse.spdiags(degree, 0, n, n, format='csr') - A
+    E = scipy.sparse.triu(A, k=1).tocoo()
+    return nodelist, L, E.row, E.col, E.data
+
+
+def _laplacian_solver(L, solver='pcg', tol=1e-5):
+    """Return a function that solves L X = B for the Laplacian L of a
+    connected graph and a block B whose columns sum to zero.
+
+    The solutions are zero at the node of largest degree, whose row and
+    column are removed to make the system nonsingular.  The remaining
+    matrix is factored, or preconditioned by its diagonal, once for all
+    the blocks.  The solvers are those of algebraic_connectivity():
+    'pcg' (preconditioned conjugate gradient method, with tolerance tol
+    on the relative residual), 'chol' (Cholesky factorization) and 'lu'
+    (LU factorization).
+    """
+    import numpy as np
+    from networkx.linalg.algebraicconnectivity import (_CholeskySolver,
+                                                       _LUSolver, _PCGSolver)
+    if solver not in ('pcg', 'chol', 'lu'):
+        raise nx.NetworkXError('unknown linear system solver.')
+    n = L.shape[0]
+    if n < 2:
+        return lambda B: np.zeros(B.shape)
+    d = L.diagonal()
+    keep = np.arange(n) != d.argmax()
+    L1 = L[keep][:, keep]
+    if solver == 'pcg':
+        inverse = 1.0 / d[keep]
+        pcg = _PCGSolver(L1.dot, lambda x: inverse * x)
+        solve = lambda B: pcg.solve(B, tol)
+    else:
+        solve = (_CholeskySolver if solver == 'chol' else _LUSolver)(
+            L1.tocsc()).solve
+
+    def grounded_solve(B):
+        X = np.zeros(B.shape)
+        X[keep] = solve(B[keep])
+        return X
+    return grounded_solve
+
+
+def _resistance_sketch(G, weight='weight', epsilon=0.5, solver='pcg',
+                       tol=1e-5, seed=None):
+    r"""Return the nodes of G and a generator of blocks of columns of the
+    random projection Z of Spielman and Srivastava, such that the
+    effective resistance between the nodes i and j is approximately the
+    squared distance between the rows i and j of Z.
+
+    Z is `L^+ B^T W^{1/2} Q^T` for the incidence matrix B and the weights
+    W of the edges and a `k \times m` matrix Q of random entries
+    `\pm 1/\sqrt{k}` with `k = \lceil 24 \ln n / \epsilon^2 \rceil`.  Its
+    columns are computed by blocks with one solver, so only a block and
+    the accumulated results have to be kept.
+    """
+    import math
+    import numpy as np
+    import scipy.sparse
+    from networkx.linalg.graphmatrix import _block_size
+    nodelist, L, u, v, w = _laplacian_edges(G, weight)
+    n = len(nodelist)
+    m = len(w)
+    k = int(math.ceil(24 * math.log(max(n, 2)) / epsilon ** 2))
+    root = np.sqrt(w)
+    # transpose of the weighted incidence matrix, n x m
+    BT = scipy.sparse.csr_matrix(
+        (np.concatenate([root, -root]),
+         (np.concatenate([u, v]), np.concatenate([np.arange(m)] * 2))),
+        shape=(n, m))
+    solve = _laplacian_solver(L, solver, tol)
+    rng = np.random.RandomState(seed)
+    size = _block_size(max(n, m))
+
+    def blocks():
+        for start in range(0, k, size):
+            b = min(size, k - start)
+            Q = (rng.randint(2, size=(m, b)) * 2.0 - 1) / math.sqrt(k)
+            yield solve(BT.dot(Q))
+    return nodelist, blocks()
@@ -5,8 +5,7 @@ Harmonic centrality measure.
 #    Alessandro Luongo
 #    BSD license.
 from __future__ import division
-import functools
-import networkx as nx
+from networkx.algorithms.centrality.distance_sums import _distance_sums
 
 __author__ = "\n".join(['Alessandro Luongo (alessandro.luongo@studenti.unimi.it'])
 __all__ = ['harmonic_centrality']
@@ -42,39 +41,20 @@ def harmonic_centrality(G, distance=None):
     See Also
     --------
     betweenness_centrality, load_centrality, eigenvector_centrality,
-    degree_centrality, closeness_centrality
+    degree_centrality, closeness_centrality, distance_centralities
 
     Notes
     -----
     If the 'distance' keyword is set to an edge attribute key then the
     shortest-path length will be computed using Dijkstra's algorithm with
-    that edge attribute as the edge weight.
+    that edge attribute as the edge weight.  Otherwise, if NumPy is
+    available, the searches from 64 nodes are run at once as in
+    distance_centralities().
 
     References
     ----------
     .. [1] Boldi, Paolo, and Sebastiano Vigna. "Axioms for centrality." Internet Mathematics 10.3-4 (2014): 222-262.
     """
 
-    if distance is not None:
-        # use Dijkstra's algorithm with specified attribute as edge weight
-        path_length = functools.partial(nx.all_pairs_dijkstra_path_length,
-                                        weight=distance)
-    else:
-        path_length = nx.all_pairs_shortest_path_length
-
-    nodes = G.nodes()
-    harmonic_centrality = {}
-
-    if len(G) <= 1:
-        for singleton in nodes:
-            harmonic_centrality[singleton] = 0.0
-        return harmonic_centrality
-
-    sp = path_length(G.reverse() if G.is_directed() else G)
-
-    for n in nodes:
-        harmonic_centrality[n] = sum([1/i if i > 0 else 0 for i in sp[n].values()])
-
-    return harmonic_centrality
-
-
+    sums = _distance_sums(G, G, distance, reverse=True)
+    return dict((n, sums[n][2]) for n in G)
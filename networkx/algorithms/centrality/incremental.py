@@ -0,0 +1,247 @@
+"""
+Betweenness and closeness centrality maintained under edge updates.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import (_graph_brandes,
+                                                        _rescale, _Brandes)
+__all__ = ['IncrementalCentrality']
+
+
+class IncrementalCentrality(object):
+    """Betweenness and closeness centrality of a graph that changes by
+    edge insertions and deletions.
+
+    The shortest path distances from every node and its dependencies, the
+    contributions of the node as a source to the betweenness, are kept.
+    After an edge is inserted or deleted only the sources whose shortest
+    path DAG contains the edge, or would contain it, are searched again,
+    in the spirit of [1]_ and [2]_, and their old dependencies are
+    replaced by the new ones.  An update therefore never costs more than
+    a computation from scratch.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph or directed graph.  It is modified by add_edge()
+      and remove_edge() and must not be changed in any other way while
+      the object is in use.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+      Weights must be greater than zero.
+
+    normalized : bool, optional (default=True)
+      Normalize the scores as betweenness_centrality() and
+      closeness_centrality() do.
+
+    endpoints : bool, optional (default=False)
+      If True include the endpoints in the shortest path counts of the
+      betweenness.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> c = nx.IncrementalCentrality(G)
+    >>> c.betweenness()[1]
+    0.6666666666666666
+    >>> c.add_edge(0, 3)
+    >>> c.betweenness()[1]
+    0.16666666666666666
+    >>> c.closeness() == nx.closeness_centrality(G)
+    True
+
+    Notes
+    -----
+    The distances and dependencies take `O(n^2)` memory.  Updates add
+    and subtract floating point numbers, so after many of them the scores
+    may differ from a computation from scratch by rounding errors.
+
+    Multigraphs are not supported.
+
+    See Also
+    --------
+    betweenness_centrality, closeness_centrality
+
+    References
+    ----------
+    .. [1] Min-Joong Lee, Jungmin Lee, Jaimie Yejean Park, Ryan Hyun Choi
+       and Chin-Wan Chung:
+       QUBE: a Quick algorithm for Updating BEtweenness centrality.
+       Proceedings of the 21st International Conference on World Wide
+       Web, 351-360, 2012.
+    .. [2] Fuad Jamour, Spiros Skiadopoulos and Panos Kalnis:
+       Parallel Algorithm for Incremental Betweenness Centrality on
+       Large Graphs.
+       IEEE Transactions on Parallel and Distributed Systems
+       29(3):659-672, 2018.
+    """
+
+    def __init__(self, G, weight=None, normalized=True, endpoints=False):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'multigraph type')
+        self.G = G
+        self.weight = weight
+        self.normalized = normalized
+        self.endpoints = endpoints
+        self.nodelist, self._brandes = _graph_brandes(G, weight)
+        self._index = dict(zip(self.nodelist, range(len(self.nodelist))))
+        self._adj = self._brandes.adj
+        self._weights = self._brandes.weights
+        n = len(self.nodelist)
+        self._betweenness = [0.0] * n
+        self._scratch = [0.0] * n
+        self._dist = [None] * n
+        self._reached = [0] * n
+        self._total = [0] * n
+        self._dependencies = [((), ())] * n
+        for s in range(n):
+            self._search(s)
+
+    def betweenness(self):
+        """Return a dictionary of nodes with betweenness centrality as
+        the value."""
+        betweenness = dict(zip(self.nodelist, self._betweenness))
+        return _rescale(betweenness, len(self.nodelist),
+                        normalized=self.normalized,
+                        directed=self.G.is_directed())
+
+    def closeness(self):
+        """Return a dictionary of nodes with closeness centrality as the
+        value."""
+        n = len(self.nodelist)
+        closeness = {}
+        for v, reached, total in zip(self.nodelist, self._reached,
+                                     self._total):
+            if total > 0.0 and n > 1:
+                closeness[v] = (reached - 1.0) / total
+                if self.normalized:
+                    closeness[v] *= (reached - 1.0) / (n - 1)
+            else:
+                closeness[v] = 0.0
+        return closeness
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between u and v to the graph and update the
+        centralities.
+
+        The nodes are added if they are not in the graph.  If the edge is
+        already in the graph its attributes are updated, which changes
+        the centralities only if its weight changes.
+        """
+        if u in self.G and v in self.G[u]:
+            data = dict(self.G[u][v])
+            data.update(attr)
+            self.remove_edge(u, v)
+            attr = data
+        for x in (u, v):
+            if x not in self._index:
+                self._add_node(x)
+        i = self._index[u]
+        j = self._index[v]
+        w = 1 if self.weight is None else attr.get(self.weight, 1)
+        dist = self._dist
+        affected = [s for s in range(len(dist))
+                    if _shortens(dist[s], i, j, w) or
+                    (not self.G.is_directed() and _shortens(dist[s], j, i, w))]
+        self.G.add_edge(u, v, **attr)
+        self._adj[i].append(j)
+        if self._weights is not None:
+            self._weights[i].append(w)
+        if not self.G.is_directed() and i != j:
+            self._adj[j].append(i)
+            if self._weights is not None:
+                self._weights[j].append(w)
+        for s in affected:
+            self._search(s)
+
+    def remove_edge(self, u, v):
+        """Remove the edge between u and v from the graph and update the
+        centralities.
+
+        Raises
+        ------
+        NetworkXError
+           If there is not an edge between u and v.
+        """
+        if u not in self.G or v not in self.G[u]:
+            raise nx.NetworkXError("The edge %s-%s is not in the graph."
+                                   % (u, v))
+        i = self._index[u]
+        j = self._index[v]
+        w = 1 if self.weight is None else self.G[u][v].get(self.weight, 1)
+        dist = self._dist
+        affected = [s for s in range(len(dist))
+                    if _on_shortest_path(dist[s], i, j, w) or
+                    (not self.G.is_directed() and
+                     _on_shortest_path(dist[s], j, i, w))]
+        self.G.remove_edge(u, v)
+        self._remove_neighbor(i, j)
+        if not self.G.is_directed() and i != j:
+            self._remove_neighbor(j, i)
+        for s in affected:
+            self._search(s)
+
+    def _add_node(self, x):
+        self.G.add_node(x)
+        self._index[x] = len(self.nodelist)
+        self.nodelist.append(x)
+        self._adj.append([])
+        if self._weights is not None:
+            self._weights.append([])
+        for d in self._dist:
+            d.append(None)
+        # The dependencies of the new source are all zero.
+        self._dist.append([None] * len(self.nodelist))
+        self._dist[-1][-1] = 0
+        self._betweenness.append(0.0)
+        self._scratch.append(0.0)
+        self._dependencies.append(((), ()))
+        self._reached.append(1)
+        self._total.append(0)
+        self._brandes = _Brandes(self._adj, self._weights)
+
+    def _remove_neighbor(self, i, j):
+        k = self._adj[i].index(j)
+        del self._adj[i][k]
+        if self._weights is not None:
+            del self._weights[i][k]
+
+    def _search(self, s):
+        """Replace the dependencies of s and the distances from s by
+        those in the current graph."""
+        brandes = self._brandes
+        scratch = self._scratch
+        betweenness = self._betweenness
+        for v, x in zip(*self._dependencies[s]):
+            betweenness[v] -= x
+        brandes.search(s)
+        brandes.accumulate(scratch, s, self.endpoints)
+        S = list(brandes.S)
+        dependencies = [scratch[v] for v in S]
+        for v, x in zip(S, dependencies):
+            betweenness[v] += x
+            scratch[v] = 0.0
+        self._dependencies[s] = (S, dependencies)
+        self._dist[s] = list(brandes.dist)
+        self._reached[s] = len(S)
+        self._total[s] = sum(brandes.dist[v] for v in S)
+
+
+def _shortens(dist, i, j, w):
+    """Return True if an edge i->j of weight w is on a shortest path of
+    the graph with it, given the distances dist without it."""
+    return dist[i] is not None and (dist[j] is None or dist[i] + w <= dist[j])
+
+
+def _on_shortest_path(dist, i, j, w):
+    """Return True if the edge i->j of weight w is on a shortest path,
+    given the distances dist."""
+    return dist[i] is not None and dist[j] == dist[i] + w
@@ -9,6 +9,7 @@ Katz centrality.
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.linalg.graphmatrix import _adjacency_operator
 from networkx.utils import not_implemented_for
 __author__ = "\n".join(['Aric Hagberg (aric.hagberg@gmail.com)',
                         'Pieter Swart (swart@lanl.gov)',
@@ -124,7 +125,8 @@ def katz_centrality(G, alpha=0.1, beta=1.0,
     The constant alpha should be strictly less than the inverse of largest
     eigenvalue of the adjacency matrix for the algorithm to converge.
     The iteration will stop after max_iter iterations or an error tolerance of
-    number_of_nodes(G)*tol has been reached.
+    number_of_nodes(G)*tol has been reached.  If SciPy is available the
+    iteration multiplies by the adjacency matrix as a sparse matrix.
 
     When `\alpha = 1/\lambda_{max}` and `\beta=0`, Katz centrality is the same
     as eigenvector centrality.
@@ -164,6 +166,14 @@ def katz_centrality(G, alpha=0.1, beta=1.0,
             raise nx.NetworkXError('beta dictionary '
                                    'must have a value for every node')
 
+    try:
+        import scipy.sparse
+    except ImportError:
+        pass
+    else:
+        return _katz_power_iteration(G, alpha, b, max_iter, tol, x,
+                                     normalized, weight)
+
     # make up to max_iter iterations
     for i in range(max_iter):
         xlast = x
@@ -196,7 +206,7 @@ def katz_centrality(G, alpha=0.1, beta=1.0,
 
 @not_implemented_for('multigraph')
 def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True,
-                          weight = 'weight'):
+                          weight = 'weight', dtype=float):
     r"""Compute the Katz centrality for the graph G.
 
     Katz centrality computes the centrality for a node based on the centrality
@@ -247,6 +257,10 @@ def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    dtype : NumPy data type, optional (default=float)
+      The data type of the adjacency matrix and of the solution when SciPy
+      is available.  Use numpy.float32 to halve the memory of the matrix.
+
     Returns
     -------
     nodes : dictionary
@@ -283,9 +297,10 @@ def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True,
     ------
     Katz centrality was introduced by [2]_.
 
-    This algorithm uses a direct linear solver to solve the above equation.
-    The constant alpha should be strictly less than the inverse of largest
-    eigenvalue of the adjacency matrix for there to be a solution.  When
+    This algorithm uses a direct linear solver to solve the above equation,
+    the sparse solver of SciPy if it is available.  The constant alpha
+    should be strictly less than the inverse of largest eigenvalue of the
+    adjacency matrix for there to be a solution.  When
     `\alpha = 1/\lambda_{max}` and `\beta=0`, Katz centrality is the same as
     eigenvector centrality.
 
@@ -322,17 +337,60 @@ def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True,
         except (TypeError,ValueError,AttributeError):
             raise nx.NetworkXError('beta must be a number')
 
-    A = nx.adj_matrix(G, nodelist=nodelist, weight=weight).todense().T
-    n = np.array(A).shape[0]
-    centrality = np.linalg.solve( np.eye(n,n) - (alpha * A) , b)
+    try:
+        import scipy.sparse
+        from scipy.sparse import linalg
+    except ImportError:
+        A = nx.adj_matrix(G, nodelist=nodelist, weight=weight).todense().T
+        n = np.array(A).shape[0]
+        centrality = np.linalg.solve( np.eye(n,n) - (alpha * A) , b)
+    else:
+        # solve in the order of the rows of the shared adjacency matrix
+        index = dict(zip(nodelist, range(len(nodelist))))
+        nodelist, A = _adjacency_operator(G, weight, dtype)
+        b = b[[index[n] for n in nodelist]]
+        n = len(nodelist)
+        M = scipy.sparse.identity(n, dtype=dtype, format='csc') - \
+            alpha * A.T.tocsc()
+        centrality = linalg.spsolve(M, b.ravel().astype(dtype))
+    centrality = np.asarray(centrality).ravel()
     if normalized:
-        norm = np.sign(sum(centrality)) * np.linalg.norm(centrality)
+        norm = np.sign(centrality.sum()) * np.linalg.norm(centrality)
     else:
         norm = 1.0
-    centrality = dict(zip(nodelist, map(float,centrality/norm)))
+    centrality = dict(zip(nodelist, (centrality / norm).tolist()))
     return centrality
 
 
+def _katz_power_iteration(G, alpha, beta, max_iter, tol, nstart, normalized,
+                          weight):
+    """Return the Katz centrality computed by katz_centrality() with a
+    sparse adjacency matrix, for beta and nstart dicts."""
+    import numpy as np
+    nodelist, A = _adjacency_operator(G, weight)
+    AT = A.T
+    nnodes = len(nodelist)
+    b = np.array([beta[n] for n in nodelist], dtype=float)
+    x = np.array([nstart[n] for n in nodelist], dtype=float)
+    # make up to max_iter iterations
+    for i in range(max_iter):
+        xlast = x
+        # do the multiplication y^T = Alpha * x^T A - Beta
+        x = alpha * AT.dot(xlast) + b
+        # check convergence
+        err = np.absolute(x - xlast).sum()
+        if err < nnodes * tol:
+            if normalized:
+                # normalize vector
+                norm = np.sqrt((x ** 2).sum())
+                if norm > 0:
+                    x /= norm
+            return dict(zip(nodelist, x.tolist()))
+
+    raise nx.NetworkXError('Power iteration failed to converge in '
+                           '%d iterations.' % max_iter)
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
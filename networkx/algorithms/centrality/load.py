@@ -17,6 +17,7 @@ __all__ = ['load_centrality',
            'edge_load']
 
 import networkx as nx
+from networkx.algorithms.centrality.betweenness import _graph_brandes
 
 def newman_betweenness_centrality(G,v=None,cutoff=None,
                            normalized=True,
@@ -68,83 +69,23 @@ def newman_betweenness_centrality(G,v=None,cutoff=None,
        Physical Review Letters 87(27):1–4, 2001.
        http://phya.snu.ac.kr/~dkim/PRL87278701.pdf
     """
-    if v is not None:   # only one node
-        betweenness=0.0
-        for source in G:
-            ubetween = _node_betweenness(G, source, cutoff, False, weight)
-            betweenness += ubetween[v] if v in ubetween else 0
-        if normalized:
-            order = G.order()
-            if order <= 2:
-                return betweenness # no normalization b=0 for all nodes
-            betweenness *= 1.0 / ((order-1) * (order-2))
-        return betweenness
-    else:
-        betweenness = {}.fromkeys(G,0.0)
-        for source in betweenness:
-            ubetween = _node_betweenness(G, source, cutoff, False, weight)
-            for vk in ubetween:
-                betweenness[vk] += ubetween[vk]
-        if normalized:
-            order = G.order()
-            if order <= 2:
-                return betweenness # no normalization b=0 for all nodes
-            scale = 1.0 / ((order-1) * (order-2))
-            for v in betweenness:
-                betweenness[v] *= scale
-        return betweenness  # all nodes
-
-def _node_betweenness(G,source,cutoff=False,normalized=True,weight=None):
-    """Node betweenness helper:
-    see betweenness_centrality for what you probably want.
-
-    This actually computes "load" and not betweenness.
-    See https://networkx.lanl.gov/ticket/103
-
-    This calculates the load of each node for paths from a single source.
-    (The fraction of number of shortests paths from source that go
-    through each node.)
-
-    To get the load for a node you need to do all-pairs shortest paths.
-
-    If weight is not None then use Dijkstra for finding shortest paths.
-    In this case a cutoff is not implemented and so is ignored.
-
-    """
-
-    # get the predecessor and path length data
-    if weight is None:
-        (pred,length)=nx.predecessor(G,source,cutoff=cutoff,return_seen=True)
-    else:
-        (pred,length)=nx.dijkstra_predecessor_and_distance(G,source,weight=weight)
-
-    # order the nodes by path length
-    onodes = [ (l,vert) for (vert,l) in length.items() ]
-    onodes.sort()
-    onodes[:] = [vert for (l,vert) in onodes if l>0]
-
-    # intialize betweenness
-    between={}.fromkeys(length,1.0)
-
-    while onodes:
-        v=onodes.pop()
-        if v in pred:
-            num_paths=len(pred[v])   # Discount betweenness if more than
-            for x in pred[v]:        # one shortest path.
-                if x==source:   # stop if hit source because all remaining v
-                    break       #  also have pred[v]==[source]
-                between[x]+=between[v]/float(num_paths)
-    #  remove source
-    for v in between:
-        between[v]-=1
-    # rescale to be between 0 and 1
+    nodelist,brandes=_graph_brandes(G,weight,multigraph_weight=min)
+    if weight is not None or not cutoff:
+        cutoff=None # Dijkstra's algorithm ignores the cutoff
+    betweenness=[0.0]*len(nodelist)
+    for source in range(len(nodelist)):
+        brandes.search(source,cutoff)
+        brandes.accumulate_load(betweenness,source)
+    betweenness=dict(zip(nodelist,betweenness))
     if normalized:
-        l=len(between)
-        if l > 2:
-            scale=1.0/float((l-1)*(l-2)) # 1/the number of possible paths
-            for v in between:
-                between[v] *= scale
-    return between
+        order = G.order()
+        if order > 2:
+            scale = 1.0 / ((order-1) * (order-2))
+            for n in betweenness:
+                betweenness[n] *= scale
+    if v is not None:   # only one node
+        return betweenness.get(v, 0.0)
+    return betweenness  # all nodes
 
 
 load_centrality=newman_betweenness_centrality
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 def weighted_G():
@@ -129,6 +130,75 @@ class TestBetweennessCentrality(object):
         for n in sorted(G):
             assert_almost_equal(b[n],b_answer[n],places=3)
 
+    def test_fastpath(self):
+        """Betweenness centrality: relabeled to integers"""
+        G=nx.florentine_families_graph()
+        assert_equal(nx.betweenness_centrality(G,fastpath=True),
+                     nx.betweenness_centrality(G))
+        assert_equal(nx.betweenness_centrality(G,k=5,seed=1,fastpath=True),
+                     nx.betweenness_centrality(G,k=5,seed=1))
+        assert_equal(nx.edge_betweenness_centrality(G,fastpath=True),
+                     nx.edge_betweenness_centrality(G))
+        assert_equal(nx.closeness_centrality(G,fastpath=True),
+                     nx.closeness_centrality(G))
+        assert_equal(nx.closeness_centrality(G,'Medici',fastpath=True),
+                     nx.closeness_centrality(G,'Medici'))
+
+
+    def test_n_jobs(self):
+        """Betweenness centrality: worker processes"""
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        G=nx.florentine_families_graph()
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=1+i%3
+        D=nx.gnm_random_graph(30,90,seed=1,directed=True)
+        for H in [G,D]:
+            for weight in [None,'weight']:
+                for endpoints in [False,True]:
+                    b=nx.betweenness_centrality(H,weight=weight,
+                                                endpoints=endpoints,n_jobs=2)
+                    b_answer=nx.betweenness_centrality(H,weight=weight,
+                                                       endpoints=endpoints)
+                    for n in H:
+                        assert_almost_equal(b[n],b_answer[n])
+                b=nx.edge_betweenness_centrality(H,weight=weight,n_jobs=3)
+                b_answer=nx.edge_betweenness_centrality(H,weight=weight)
+                assert_equal(set(b),set(b_answer))
+                for e in H.edges():
+                    assert_almost_equal(b[e],b_answer[e])
+        b=nx.betweenness_centrality(G,k=5,seed=1,n_jobs=2)
+        b_answer=nx.betweenness_centrality(G,k=5,seed=1)
+        for n in G:
+            assert_almost_equal(b[n],b_answer[n])
+        assert_raises(nx.NetworkXError,nx.betweenness_centrality,
+                      nx.MultiGraph(G),n_jobs=2)
+
+    def test_epsilon(self):
+        """Betweenness centrality: sampled shortest paths"""
+        G=nx.florentine_families_graph()
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=1+i%3
+        D=nx.gnm_random_graph(30,90,seed=1,directed=True)
+        for H in [G,D]:
+            n=len(H)
+            for weight in [None,'weight']:
+                for endpoints in [False,True]:
+                    b=nx.betweenness_centrality(H,weight=weight,
+                                                endpoints=endpoints,
+                                                epsilon=0.05,seed=1)
+                    b_answer=nx.betweenness_centrality(H,weight=weight,
+                                                       endpoints=endpoints)
+                    for v in H:
+                        assert_true(abs(b[v]-b_answer[v])*(n-2)/n <= 0.05)
+        b=nx.betweenness_centrality(nx.path_graph(4),normalized=False,
+                                    epsilon=0.1,seed=1)
+        assert_equal(b[0],0)
+        assert_equal(b[3],0)
+        assert_raises(nx.NetworkXError,nx.betweenness_centrality,
+                      G,k=5,epsilon=0.1)
 
     def test_ladder_graph(self):
         """Betweenness centrality: Ladder graph"""
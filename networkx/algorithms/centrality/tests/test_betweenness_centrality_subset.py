@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx
 from networkx import betweenness_centrality_subset,\
      edge_betweenness_centrality_subset
@@ -103,6 +104,24 @@ class TestSubsetBetweennessCentrality:
             assert_almost_equal(b[n],b_answer[n])
 
 
+    def test_n_jobs(self):
+        """Betweenness centrality: worker processes"""
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        G=networkx.gnm_random_graph(30,60,seed=1)
+        for weight in [None,'weight']:
+            b=betweenness_centrality_subset(G,sources=range(10),
+                                            targets=range(5,20),
+                                            weight=weight,n_jobs=2)
+            b_answer=betweenness_centrality_subset(G,sources=range(10),
+                                                   targets=range(5,20),
+                                                   weight=weight)
+            for n in sorted(G):
+                assert_almost_equal(b[n],b_answer[n])
+
+
 class TestBetweennessCentralitySources:
     def test_K5(self):
         """Betweenness centrality: K5"""
@@ -91,3 +91,26 @@ class TestClosenessCentrality:
         for n in sorted(XG):
             assert_almost_equal(c[n],d[n],places=3)
 
+    def test_u_long_path(self):
+        # A single node is searched on its own, in a few milliseconds,
+        # not with a multi-source search over the whole path at each level.
+        G=nx.path_graph(10000)
+        assert_almost_equal(nx.closeness_centrality(G,u=0),2/10000.0)
+        assert_almost_equal(nx.closeness_centrality(G,u=0,normalized=False),
+                            2/10000.0)
+
+    def test_top_k_closeness(self):
+        D=nx.gnm_random_graph(60,90,seed=1,directed=True)
+        G=nx.gnm_random_graph(60,70,seed=2)
+        for H in [self.K, self.T, self.Gb, self.F, G, D,
+                  nx.grid_2d_graph(5,6)]:
+            order=dict(zip(H.nodes(),range(len(H))))
+            for normalized in [True,False]:
+                c=nx.closeness_centrality(H,normalized=normalized)
+                ranking=sorted(c.items(),key=lambda vc:(-vc[1],order[vc[0]]))
+                for k in [1,5,len(H)+1]:
+                    top=nx.top_k_closeness_centrality(H,k,normalized)
+                    assert_equal(top,ranking[:k])
+        assert_equal(nx.top_k_closeness_centrality(nx.Graph(),3),[])
+        assert_equal(nx.top_k_closeness_centrality(self.P3,2),
+                     [(1,1.0),(0,2/3.0)])
@@ -132,3 +132,50 @@ class TestCommunicability:
         answer=1041.2470334195475
         result=estrada_index(nx.karate_club_graph())
         assert_almost_equal(answer,result,places=7)
+
+    def test_approximate_communicability(self):
+        G = nx.karate_club_graph()
+        exact = communicability_exp(G)
+        result = approximate_communicability(G, [0, 33], targets=[0, 5, 33])
+        assert_equal(sorted(result), [0, 33])
+        for u in result:
+            assert_equal(sorted(result[u]), [0, 5, 33])
+            for v in result[u]:
+                assert_almost_equal(exact[u][v], result[u][v], places=5)
+        result = approximate_communicability(G, [1], tol=1e-14)
+        for v in G:
+            assert_almost_equal(exact[1][v], result[1][v], places=10)
+        assert_raises(nx.NetworkXError, approximate_communicability, G, [34])
+        assert_equal(approximate_communicability(nx.Graph(), []), {})
+
+    def test_approximate_communicability_centrality(self):
+        G = nx.barabasi_albert_graph(300, 3, seed=1)
+        exact = communicability_centrality(G)
+        result = approximate_communicability_centrality(G, nodes=[0, 10],
+                                                        tol=1e-14)
+        assert_equal(sorted(result), [0, 10])
+        for v in result:
+            assert_almost_equal(exact[v] / result[v], 1, places=10)
+        result = approximate_communicability_centrality(G, samples=50,
+                                                        seed=1)
+        error = sum(abs(exact[v] - result[v]) for v in G)
+        assert_true(error < 0.01 * sum(exact.values()))
+        # with as many samples as nodes the values are exact
+        result = approximate_communicability_centrality(G, samples=300,
+                                                        tol=1e-14)
+        for v in G:
+            assert_almost_equal(exact[v] / result[v], 1, places=5)
+        assert_equal(approximate_communicability_centrality(nx.Graph()), {})
+
+    def test_approximate_estrada_index(self):
+        G = nx.barabasi_albert_graph(300, 3, seed=1)
+        answer = estrada_index(G)
+        for k in (1, 10):
+            result = approximate_estrada_index(G, samples=50, k=k, seed=1)
+            assert_almost_equal(answer / result, 1, places=2)
+        result = approximate_estrada_index(G, samples=50, k=20, seed=1)
+        assert_almost_equal(answer / result, 1, places=3)
+        assert_almost_equal(approximate_estrada_index(nx.empty_graph(3)), 3)
+        assert_equal(approximate_estrada_index(nx.Graph()), 0)
+        assert_raises(nx.NetworkXNotImplemented, approximate_estrada_index,
+                      nx.DiGraph([(0, 1)]))
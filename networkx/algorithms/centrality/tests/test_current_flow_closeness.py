@@ -45,3 +45,56 @@ class TestFlowClosenessCentrality(object):
 
 class TestWeightedFlowClosenessCentrality(object):
     pass
+
+
+class TestApproximateFlowClosenessCentrality(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_grid(self):
+        G=networkx.grid_2d_graph(6,6)
+        b=networkx.current_flow_closeness_centrality(G)
+        for solver in ('pcg', 'lu'):
+            ba=networkx.approximate_current_flow_closeness_centrality(
+                G, epsilon=0.2, solver=solver, seed=1)
+            for n in G:
+                assert_true(abs(ba[n] / b[n] - 1) < 0.2)
+
+    def test_effective_resistance(self):
+        G=networkx.cycle_graph(8)
+        G.add_edge(0, 4, weight=2.0)
+        # exact resistances from the pseudo-inverse of the Laplacian
+        nodes=G.nodes()
+        C=np.linalg.pinv(networkx.laplacian_matrix(G, nodes).toarray())
+        answer={}
+        for i, u in enumerate(nodes):
+            for j, v in enumerate(nodes):
+                if u < v:
+                    answer[u, v]=C[i, i] + C[j, j] - 2 * C[i, j]
+        # between 0 and 4 the two paths of 4 edges of resistance 1 are in
+        # parallel with the edge of resistance 1/2
+        assert_almost_equal(answer[0, 4], 1 / (2 + 0.5))
+        r=networkx.approximate_effective_resistance(G, answer, epsilon=0.2,
+                                                    seed=1)
+        for pair in answer:
+            assert_true(abs(r[pair] / answer[pair] - 1) < 0.2)
+        r=networkx.approximate_effective_resistance(G, seed=1)
+        assert_equal(sorted(r), sorted(G.edges()))
+
+    def test_errors(self):
+        G=networkx.Graph([(0, 1), (2, 3)])
+        assert_raises(networkx.NetworkXError,
+                      networkx.approximate_current_flow_closeness_centrality, G)
+        assert_raises(networkx.NetworkXError,
+                      networkx.approximate_effective_resistance,
+                      networkx.path_graph(3), [(0, 3)])
+        assert_raises(networkx.NetworkXError,
+                      networkx.approximate_effective_resistance,
+                      networkx.path_graph(3), solver='qr')
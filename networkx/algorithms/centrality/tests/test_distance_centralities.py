@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+
+
+class TestDistanceCentralities:
+
+    def check(self, G, distance=None, **kwds):
+        c = nx.distance_centralities(G, distance=distance, **kwds)
+        closeness = nx.closeness_centrality(G, distance=distance)
+        R = G.reverse() if G.is_directed() else G
+        harmonic = nx.harmonic_centrality(R, distance=distance)
+        assert_equal(set(c), set(['closeness', 'harmonic', 'eccentricity',
+                                  'average_distance']))
+        for n in G:
+            assert_almost_equal(c['closeness'][n], closeness[n])
+            assert_almost_equal(c['harmonic'][n], harmonic[n])
+        if distance is None:
+            path_length = nx.single_source_shortest_path_length
+        else:
+            path_length = lambda G, n: nx.single_source_dijkstra_path_length(
+                G, n, weight=distance)
+        for n in G:
+            length = path_length(G, n)
+            assert_equal(c['eccentricity'][n], max(length.values()))
+            if len(length) > 1:
+                assert_almost_equal(c['average_distance'][n],
+                                    sum(length.values()) / (len(length) - 1.0))
+            else:
+                assert_equal(c['average_distance'][n], 0)
+
+    def test_graphs(self):
+        G = nx.gnm_random_graph(150, 200, seed=1)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = 1 + i % 3
+        D = nx.gnm_random_graph(150, 300, seed=2, directed=True)
+        for i, (u, v) in enumerate(D.edges()):
+            D[u][v]['weight'] = 1 + i % 2
+        for H in [G, D, nx.MultiGraph(G), nx.empty_graph(3), nx.Graph()]:
+            self.check(H)
+            self.check(H, 'weight')
+
+    def test_path(self):
+        G = nx.path_graph(4)
+        c = nx.distance_centralities(G, normalized=False)
+        assert_equal(c['eccentricity'], {0: 3, 1: 2, 2: 2, 3: 3})
+        assert_almost_equal(c['harmonic'][0], 1 + 1 / 2.0 + 1 / 3.0)
+        assert_almost_equal(c['closeness'][1], 3 / 4.0)
+        assert_almost_equal(c['average_distance'][1], 4 / 3.0)
+
+    def test_n_jobs(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        G = nx.gnm_random_graph(100, 150, seed=3)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = 1 + i % 3
+        for distance in [None, 'weight']:
+            c = nx.distance_centralities(G, distance=distance, n_jobs=2)
+            c_answer = nx.distance_centralities(G, distance=distance)
+            for key in c_answer:
+                for n in G:
+                    assert_almost_equal(c[key][n], c_answer[key][n])
+
+    def test_deep_graphs(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        from networkx.algorithms.centrality.distance_sums import \
+            _distance_sums
+        # Searches deeper than the 64 sources of a pass are run one at a
+        # time, whether this shows from the first source or midway.
+        D = nx.DiGraph()
+        D.add_node(0)
+        D.add_path(range(1, 200))
+        for sources in [range(64), range(1, 65)]:
+            sums = _distance_sums(D, sources)
+            for s in sources:
+                d = nx.single_source_shortest_path_length(D, s).values()
+                reached, total, inverse, farthest = sums[s]
+                assert_equal((reached, total, farthest),
+                             (len(d), sum(d), max(d)))
+                assert_almost_equal(inverse, sum(1.0 / x for x in d if x))
+        self.check(nx.path_graph(300))
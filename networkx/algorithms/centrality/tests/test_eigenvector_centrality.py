@@ -58,6 +58,23 @@ class TestEigenvectorCentrality(object):
         G=networkx.path_graph(3)
         b=networkx.eigenvector_centrality(G,max_iter=0)
 
+    def test_float32(self):
+        G = networkx.barbell_graph(5, 3)
+        b = networkx.eigenvector_centrality_numpy(G)
+        b32 = networkx.eigenvector_centrality_numpy(G, dtype=np.float32)
+        for n in G:
+            assert_almost_equal(b[n], b32[n], places=3)
+
+    def test_csrgraph(self):
+        G = networkx.CSRGraph(networkx.barbell_graph(5, 3))
+        b = networkx.eigenvector_centrality_numpy(G)
+        # the adjacency matrix is shared with later calls
+        assert_equal(list(G._cache), [('adjacency', 'weight', '<f8')])
+        p = networkx.eigenvector_centrality(G, tol=1e-10, max_iter=1000)
+        assert_equal(len(G._cache), 1)
+        for n in G:
+            assert_almost_equal(b[n], p[n], places=6)
+
 class TestEigenvectorCentralityDirected(object):
     numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
     @classmethod
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from nose.tools import *
+import networkx as nx
+
+
+class TestIncrementalCentrality:
+
+    def check(self, c, G, weight=None, endpoints=False):
+        b = c.betweenness()
+        b_answer = nx.betweenness_centrality(G, weight=weight,
+                                             endpoints=endpoints,
+                                             normalized=c.normalized)
+        assert_equal(set(b), set(b_answer))
+        for n in G:
+            assert_almost_equal(b[n], b_answer[n])
+        cl = c.closeness()
+        cl_answer = nx.closeness_centrality(G, distance=weight,
+                                            normalized=c.normalized)
+        for n in G:
+            assert_almost_equal(cl[n], cl_answer[n])
+
+    def test_path(self):
+        G = nx.path_graph(4)
+        c = nx.IncrementalCentrality(G)
+        self.check(c, G)
+        c.add_edge(0, 3)
+        assert_true(G.has_edge(0, 3))
+        self.check(c, G)
+        c.remove_edge(1, 2)
+        assert_false(G.has_edge(1, 2))
+        self.check(c, G)
+        c.add_edge(3, 'a')
+        self.check(c, G)
+
+    def test_updates(self):
+        for directed in [False, True]:
+            for weight in [None, 'weight']:
+                for endpoints in [False, True]:
+                    G = nx.gnm_random_graph(20, 30, seed=1,
+                                            directed=directed)
+                    for i, (u, v) in enumerate(G.edges()):
+                        G[u][v]['weight'] = 1 + i % 3
+                    c = nx.IncrementalCentrality(G, weight=weight,
+                                                 endpoints=endpoints)
+                    self.check(c, G, weight, endpoints)
+                    for i in range(10):
+                        u, v = sorted(G.edges())[3 * i % G.size()]
+                        c.remove_edge(u, v)
+                        self.check(c, G, weight, endpoints)
+                        c.add_edge(i, 19 - i, weight=1 + i % 2)
+                        self.check(c, G, weight, endpoints)
+                        c.add_edge(i + 20, i, weight=2)
+                        self.check(c, G, weight, endpoints)
+
+    def test_change_weight(self):
+        G = nx.cycle_graph(5)
+        c = nx.IncrementalCentrality(G, weight='weight', normalized=False)
+        c.add_edge(0, 1, weight=10)
+        assert_equal(G[0][1]['weight'], 10)
+        self.check(c, G, 'weight')
+        assert_almost_equal(c.betweenness()[3], 4)
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        c = nx.IncrementalCentrality(G)
+        assert_raises(nx.NetworkXError, c.remove_edge, 0, 2)
+        assert_raises(nx.NetworkXError, c.remove_edge, 0, 'a')
+        assert_raises(nx.NetworkXNotImplemented, nx.IncrementalCentrality,
+                      nx.MultiGraph(G))
@@ -226,6 +226,14 @@ class TestKatzCentralityNumpy(object):
 
 
 
+    def test_float32(self):
+        G = networkx.barbell_graph(5, 3)
+        b = networkx.katz_centrality(G, 0.1, tol=1e-10)
+        b32 = networkx.katz_centrality_numpy(G, 0.1, dtype=np.float32)
+        for n in G:
+            assert_almost_equal(b[n], b32[n], places=5)
+
+
 class TestKatzCentralityDirected(object):
     def setUp(self):
         G = networkx.DiGraph()
@@ -50,6 +50,14 @@ class TestLoadCentrality:
         for n in sorted(self.G):
             assert_equal(b[n],self.exact_weighted[n])
 
+    def test_cutoff_load(self):
+        b=nx.load_centrality(self.P4,cutoff=1,normalized=False)
+        assert_equal(b,{0: 0.0, 1: 0.0, 2: 0.0, 3: 0.0})
+        b=nx.load_centrality(self.P4,cutoff=2,normalized=False)
+        assert_equal(b,{0: 0.0, 1: 2.0, 2: 2.0, 3: 0.0})
+        b=nx.load_centrality(self.P4,v=1,cutoff=2,normalized=False)
+        assert_equal(b,2.0)
+
     def test_k5_load(self):
         G=self.K5
         c=nx.load_centrality(G)
@@ -10,6 +10,7 @@ Connected components.
 #    BSD license.
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
+from networkx.utils.decorators import integer_fastpath
 
 __authors__ = "\n".join(['Eben Kenah',
                          'Aric Hagberg <aric.hagberg@gmail.com>'
@@ -24,7 +25,8 @@ __all__ = [
 
 
 @not_implemented_for('directed')
-def connected_components(G):
+@integer_fastpath('node_set_iter')
+def connected_components(G, fastpath=False):
     """Generate connected components.
 
     Parameters
@@ -32,6 +34,9 @@ def connected_components(G):
     G : NetworkX graph
        An undirected graph
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     comp : generator of sets
@@ -78,7 +83,9 @@ def connected_component_subgraphs(G, copy=True):
        An undirected graph.
 
     copy: bool (default=True)
-      If True make a copy of the graph attributes
+      If True make a copy of the graph attributes.  If False, generate
+      read-only views of G (see subgraph_view) that share its attributes
+      and are created in time proportional to the component size.
 
     Returns
     -------
@@ -110,7 +117,7 @@ def connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(c).copy()
         else:
-            yield G.subgraph(c)
+            yield nx.subgraph_view(G, c)
 
 
 def number_connected_components(G):
@@ -9,6 +9,7 @@
 #    BSD license.
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
+from networkx.utils.decorators import integer_fastpath
 
 __authors__ = "\n".join(['Eben Kenah',
                          'Aric Hagberg (hagberg@lanl.gov)'
@@ -25,7 +26,8 @@ __all__ = ['number_strongly_connected_components',
 
 
 @not_implemented_for('undirected')
-def strongly_connected_components(G):
+@integer_fastpath('node_set_iter')
+def strongly_connected_components(G, fastpath=False):
     """Generate nodes in strongly connected components of graph.
 
     Parameters
@@ -33,6 +35,9 @@ def strongly_connected_components(G):
     G : NetworkX Graph
         An directed graph.
 
+    fastpath : bool, optional (default=False)
+        If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     comp : generator of sets
@@ -277,7 +282,8 @@ def strongly_connected_component_subgraphs(G, copy=True):
 
     copy : boolean, optional
         if copy is True, Graph, node, and edge attributes are copied to
-        the subgraphs.
+        the subgraphs.  If False, generate read-only views of G (see
+        subgraph_view) that share its attributes.
 
     Returns
     -------
@@ -309,7 +315,7 @@ def strongly_connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp).copy()
         else:
-            yield G.subgraph(comp)
+            yield nx.subgraph_view(G, comp)
 
 
 @not_implemented_for('undirected')
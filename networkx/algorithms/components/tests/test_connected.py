@@ -66,6 +66,11 @@ class TestConnected:
         C = {frozenset([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16])}
         assert_equal({frozenset(g) for g in cc(G)}, C)
 
+    def test_connected_components_fastpath(self):
+        cc = nx.connected_components
+        G = nx.relabel_nodes(self.G, lambda n: str(n))
+        assert_equal(list(cc(G, fastpath=True)), list(cc(G)))
+
     def test_node_connected_components(self):
         ncc = nx.node_connected_component
         G = self.grid
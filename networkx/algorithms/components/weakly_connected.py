@@ -105,7 +105,8 @@ def weakly_connected_component_subgraphs(G, copy=True):
         A directed graph.
 
     copy: bool (default=True)
-        If True make a copy of the graph attributes
+        If True make a copy of the graph attributes.  If False, generate
+        read-only views of G (see subgraph_view) that share its attributes.
 
     Returns
     -------
@@ -142,7 +143,7 @@ def weakly_connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp).copy()
         else:
-            yield G.subgraph(comp)
+            yield nx.subgraph_view(G, comp)
 
 
 @not_implemented_for('undirected')
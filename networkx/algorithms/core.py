@@ -23,9 +23,10 @@ __author__ = "\n".join(['Dan Schult (dschult@colgate.edu)',
 __all__ = ['core_number','k_core','k_shell','k_crust','k_corona','find_cores']
 
 import networkx as nx
+from networkx.classes.csrgraph import _cache
 
-def core_number(G):
-    """Return the core number for each vertex.
+def core_number(G, weight=None, direction='in+out', method='bz'):
+    r"""Return the core number for each vertex.
 
     A k-core is a maximal subgraph that contains nodes of degree k or more.
 
@@ -37,6 +38,21 @@ def core_number(G):
     G : NetworkX graph
        A graph or directed graph
 
+    weight : string or None, optional (default=None)
+       The edge attribute that holds the numerical value used as a weight.
+       If not None, the degree of a node is the sum of the weights of its
+       edges, and the cores are the s-cores of [2]_.
+
+    direction : string, optional (default='in+out')
+       For directed graphs, the degree of a node used for the cores:
+       'in' (in-degree), 'out' (out-degree) or 'in+out' (in-degree +
+       out-degree).  Ignored for undirected graphs.
+
+    method : string, optional (default='bz')
+       'bz' removes the nodes one by one in order of degree [1]_ [2]_.
+       'peeling' removes all the nodes of degree at most k at once, in
+       rounds of NumPy array operations, for k from 0 up [3]_.
+
     Returns
     -------
     core_number : dictionary
@@ -52,13 +68,29 @@ def core_number(G):
     Not implemented for graphs with parallel edges or self loops.
 
     For directed graphs the node degree is defined to be the
-    in-degree + out-degree.
+    in-degree + out-degree unless direction is given.
+
+    The neighbors of the nodes are kept in flat lists of node indices,
+    which take `O(m)` memory.  The 'bz' method takes `O(m)` time, or
+    `O(m \log n)` with a weight; the 'peeling' method takes `O(m)` time
+    plus `O(n)` for every distinct core number.
+
+    For a CSRGraph the core numbers are read from its arrays and kept
+    with the graph, so k_core(), k_shell(), k_crust() and k_corona() do
+    not compute them again.
 
     References
     ----------
     .. [1] An O(m) Algorithm for Cores Decomposition of Networks
        Vladimir Batagelj and Matjaz Zaversnik, 2003.
        http://arxiv.org/abs/cs.DS/0310049
+    .. [2] Generalized Cores
+       Vladimir Batagelj and Matjaz Zaversnik, 2002.
+       http://arxiv.org/abs/cs/0202039
+    .. [3] ParK: An Efficient Algorithm for k-core Decomposition on
+       Multicore Processors
+       Naga Shailaja Dasari, Desh Ranjan and Mohammad Zubair, 2014.
+       IEEE International Conference on Big Data, 9-16.
     """
     if G.is_multigraph():
         raise nx.NetworkXError(
@@ -69,42 +101,208 @@ def core_number(G):
                 'Input graph has self loops; the core number is not defined.',
                 'Consider using G.remove_edges_from(G.selfloop_edges()).')
 
-    if G.is_directed():
-        import itertools
-        def neighbors(v):
-            return itertools.chain.from_iterable([G.predecessors_iter(v),
-                                                  G.successors_iter(v)])
+    if direction not in ('in', 'out', 'in+out'):
+        raise nx.NetworkXError("unknown direction '%s'." % direction)
+    if method not in ('bz', 'peeling'):
+        raise nx.NetworkXError("unknown method '%s'." % method)
+    if not G.is_directed():
+        direction = None
+    cache = _cache(G)
+    key = ('core_number', weight, direction)
+    if cache is not None and key in cache:
+        return dict(cache[key])
+    nodes, indptr, indices, weights = _peeling_lists(G, weight, direction)
+    if method == 'peeling':
+        core = _level_peeling(len(nodes), indptr, indices, weights)
+    elif weights is None:
+        core = _bz_cores(len(nodes), indptr, indices)
+    else:
+        core = _generalized_cores(len(nodes), indptr, indices, weights)
+    core = dict(zip(nodes, core))
+    if cache is not None:
+        cache[key] = core
+        return dict(core)
+    return core
+
+def _peeling_lists(G, weight, direction):
+    """Return the nodes of G and lists indptr, indices and weights such
+    that removing node i lowers the degree of node indices[j] by
+    weights[j] (by 1 if weights is None), for j from indptr[i] to
+    indptr[i + 1].
+
+    Node i has degree sum(weights[j] for j with indices[j] == i).
+    """
+    if isinstance(G, nx.CSRGraph):
+        return _csr_peeling_lists(G, weight, direction)
+    # removing a node lowers the in-degree of its successors and the
+    # out-degree of its predecessors
+    if direction is None:
+        adjacencies = [G.adj]
+    elif direction == 'in':
+        adjacencies = [G.succ]
+    elif direction == 'out':
+        adjacencies = [G.pred]
     else:
-        neighbors=G.neighbors_iter
-    degrees=G.degree()
-    # sort nodes by degree
-    nodes=sorted(degrees,key=degrees.get)
-    bin_boundaries=[0]
-    curr_degree=0
-    for i,v in enumerate(nodes):
-        if degrees[v]>curr_degree:
-            bin_boundaries.extend([i]*(degrees[v]-curr_degree))
-            curr_degree=degrees[v]
-    node_pos = dict((v,pos) for pos,v in enumerate(nodes))
-    # initial guesses for core is degree
-    core=degrees
-    nbrs=dict((v,set(neighbors(v))) for v in G)
+        adjacencies = [G.pred, G.succ]
+    nodes = list(G)
+    index = dict(zip(nodes, range(len(nodes))))
+    indptr = [0]
+    indices = []
+    weights = None if weight is None else []
     for v in nodes:
-        for u in nbrs[v]:
-            if core[u] > core[v]:
-                nbrs[u].remove(v)
-                pos=node_pos[u]
-                bin_start=bin_boundaries[core[u]]
-                node_pos[u]=bin_start
-                node_pos[nodes[bin_start]]=pos
-                nodes[bin_start],nodes[pos]=nodes[pos],nodes[bin_start]
-                bin_boundaries[core[u]]+=1
-                core[u]-=1
+        for adj in adjacencies:
+            nbrs = adj[v]
+            indices.extend(index[u] for u in nbrs)
+            if weight is not None:
+                weights.extend(d.get(weight, 1) for d in nbrs.values())
+        indptr.append(len(indices))
+    return nodes, indptr, indices, weights
+
+def _csr_peeling_lists(G, weight, direction):
+    """_peeling_lists for a CSRGraph, from its arrays."""
+    import numpy as np
+    nodes = G.nodes()
+    column = None
+    if weight is not None:
+        column = G.edge_columns.get(weight)
+        if column is None:
+            column = np.ones(len(G.indices))
+    if direction is None or direction == 'in':
+        indptr, indices, weights = G.indptr, G.indices, column
+    elif direction == 'out':
+        indptr, indices = G._pindptr, G._pindices
+        weights = None if column is None else column[G._perm]
+    else:
+        n = len(nodes)
+        rows = np.concatenate([np.repeat(np.arange(n), np.diff(G.indptr)),
+                               np.repeat(np.arange(n), np.diff(G._pindptr))])
+        order = np.argsort(rows, kind='mergesort')
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows,
+                                                            minlength=n))])
+        indices = np.concatenate([G.indices, G._pindices])[order]
+        weights = None if column is None else \
+            np.concatenate([column, column[G._perm]])[order]
+    if weights is not None:
+        weights = weights.tolist()
+    return nodes, indptr.tolist(), indices.tolist(), weights
+
+def _bz_cores(n, indptr, indices):
+    """Return the core numbers of the nodes 0 to n-1, see _peeling_lists,
+    with the bucket algorithm of Batagelj and Zaversnik."""
+    degree = [0] * n
+    for u in indices:
+        degree[u] += 1
+    # vert lists the nodes sorted by degree, pos is the position of each
+    # node in vert and bins[d] the first position of degree d
+    bins = [0] * (max(degree) + 1 if n else 1)
+    for d in degree:
+        bins[d] += 1
+    start = 0
+    for d, count in enumerate(bins):
+        bins[d] = start
+        start += count
+    pos = [0] * n
+    vert = [0] * n
+    for v, d in enumerate(degree):
+        pos[v] = bins[d]
+        vert[pos[v]] = v
+        bins[d] += 1
+    bins.insert(0, 0)
+    for v in vert:
+        dv = degree[v]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            du = degree[u]
+            if du > dv:
+                # move u to the start of its bin, which then shrinks by one
+                pu = pos[u]
+                pw = bins[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u] = pw
+                    vert[pu] = w
+                    pos[w] = pu
+                    vert[pw] = u
+                bins[du] += 1
+                degree[u] = du - 1
+    return degree
+
+def _generalized_cores(n, indptr, indices, weights):
+    """Return the weighted core numbers of the nodes 0 to n-1, see
+    _peeling_lists, removing the nodes in order of degree with a heap."""
+    from heapq import heapify, heappop, heappush
+    degree = [0] * n
+    for u, w in zip(indices, weights):
+        degree[u] += w
+    heap = [(d, v) for v, d in enumerate(degree)]
+    heapify(heap)
+    removed = [False] * n
+    core = [0] * n
+    level = None
+    while heap:
+        d, v = heappop(heap)
+        if removed[v] or d != degree[v]:
+            continue  # outdated entry
+        removed[v] = True
+        if level is None or d > level:
+            level = d
+        core[v] = level
+        for j in range(indptr[v], indptr[v + 1]):
+            u = indices[j]
+            if not removed[u]:
+                degree[u] -= weights[j]
+                heappush(heap, (degree[u], u))
     return core
 
+def _level_peeling(n, indptr, indices, weights):
+    """Return the core numbers of the nodes 0 to n-1, see _peeling_lists,
+    removing all the nodes of degree at most the current level at once."""
+    import numpy as np
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    if weights is not None:
+        weights = np.asarray(weights)
+    degree = np.bincount(indices, weights, minlength=n)
+    if weights is None or weights.dtype.kind in 'iub':
+        degree = degree.astype(np.int64)
+    core = np.zeros(n, dtype=degree.dtype)
+    alive = np.ones(n, dtype=bool)
+    remaining = np.arange(n)
+    level = None
+    while len(remaining):
+        low = degree[remaining].min()
+        if level is None or low > level:
+            level = low
+        frontier = remaining[degree[remaining] <= level]
+        while len(frontier):
+            core[frontier] = level
+            alive[frontier] = False
+            # positions in indices of the rows of the frontier
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            positions = offsets + np.arange(counts.sum())
+            positions = positions[alive[indices[positions]]]
+            nbrs, inverse = np.unique(indices[positions],
+                                      return_inverse=True)
+            if weights is None:
+                degree[nbrs] -= np.bincount(inverse, minlength=len(nbrs))
+            else:
+                degree[nbrs] -= np.bincount(inverse, weights[positions],
+                                            minlength=len(nbrs)).astype(
+                                                degree.dtype)
+            frontier = nbrs[degree[nbrs] <= level]
+        remaining = remaining[alive[remaining]]
+    return core.tolist()
+
 find_cores=core_number
 
-def k_core(G,k=None,core_number=None):
+def _core_subgraph(G, nodes, copy):
+    """Return the subgraph of G induced by nodes, as a copy or a view."""
+    if copy:
+        return G.subgraph(nodes).copy()
+    return nx.subgraph_view(G, nodes)
+
+def k_core(G,k=None,core_number=None,copy=True):
     """Return the k-core of G.
 
     A k-core is a maximal subgraph that contains nodes of degree k or more.
@@ -117,6 +315,10 @@ def k_core(G,k=None,core_number=None):
       The order of the core.  If not specified return the main core.
     core_number : dictionary, optional
       Precomputed core numbers for the graph G.
+    copy : bool, optional (default=True)
+      If True return an independent copy of the subgraph.  If False
+      return a read-only view of G (see subgraph_view), which is created
+      without copying any edges.
 
     Returns
     -------
@@ -137,7 +339,8 @@ def k_core(G,k=None,core_number=None):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
-    Graph, node, and edge attributes are copied to the subgraph.
+    Graph, node, and edge attributes are copied to the subgraph unless
+    copy is False.
 
     See Also
     --------
@@ -154,9 +357,9 @@ def k_core(G,k=None,core_number=None):
     if k is None:
         k=max(core_number.values()) # max core
     nodes=(n for n in core_number if core_number[n]>=k)
-    return G.subgraph(nodes).copy()
+    return _core_subgraph(G, nodes, copy)
 
-def k_shell(G,k=None,core_number=None):
+def k_shell(G,k=None,core_number=None,copy=True):
     """Return the k-shell of G.
 
     The k-shell is the subgraph of nodes in the k-core but not in the (k+1)-core.
@@ -169,6 +372,10 @@ def k_shell(G,k=None,core_number=None):
       The order of the shell.  If not specified return the main shell.
     core_number : dictionary, optional
       Precomputed core numbers for the graph G.
+    copy : bool, optional (default=True)
+      If True return an independent copy of the subgraph.  If False
+      return a read-only view of G (see subgraph_view), which is created
+      without copying any edges.
 
 
     Returns
@@ -191,7 +398,8 @@ def k_shell(G,k=None,core_number=None):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
-    Graph, node, and edge attributes are copied to the subgraph.
+    Graph, node, and edge attributes are copied to the subgraph unless
+    copy is False.
 
     See Also
     --------
@@ -210,9 +418,9 @@ def k_shell(G,k=None,core_number=None):
     if k is None:
         k=max(core_number.values()) # max core
     nodes=(n for n in core_number if core_number[n]==k)
-    return G.subgraph(nodes).copy()
+    return _core_subgraph(G, nodes, copy)
 
-def k_crust(G,k=None,core_number=None):
+def k_crust(G,k=None,core_number=None,copy=True):
     """Return the k-crust of G.
 
     The k-crust is the graph G with the k-core removed.
@@ -225,6 +433,10 @@ def k_crust(G,k=None,core_number=None):
       The order of the shell.  If not specified return the main crust.
     core_number : dictionary, optional
       Precomputed core numbers for the graph G.
+    copy : bool, optional (default=True)
+      If True return an independent copy of the subgraph.  If False
+      return a read-only view of G (see subgraph_view), which is created
+      without copying any edges.
 
     Returns
     -------
@@ -246,7 +458,8 @@ def k_crust(G,k=None,core_number=None):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
-    Graph, node, and edge attributes are copied to the subgraph.
+    Graph, node, and edge attributes are copied to the subgraph unless
+    copy is False.
 
     See Also
     --------
@@ -264,10 +477,10 @@ def k_crust(G,k=None,core_number=None):
     if k is None:
         k=max(core_number.values())-1
     nodes=(n for n in core_number if core_number[n]<=k)
-    return G.subgraph(nodes).copy()
+    return _core_subgraph(G, nodes, copy)
 
 
-def k_corona(G, k, core_number=None):
+def k_corona(G, k, core_number=None, copy=True):
     """Return the k-corona of G.
 
     The k-corona is the subgraph of nodes in the k-core which have
@@ -281,6 +494,10 @@ def k_corona(G, k, core_number=None):
        The order of the corona.
     core_number : dictionary, optional
        Precomputed core numbers for the graph G.
+    copy : bool, optional (default=True)
+       If True return an independent copy of the subgraph.  If False
+       return a read-only view of G (see subgraph_view), which is created
+       without copying any edges.
 
     Returns
     -------
@@ -300,7 +517,8 @@ def k_corona(G, k, core_number=None):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
-    Graph, node, and edge attributes are copied to the subgraph.
+    Graph, node, and edge attributes are copied to the subgraph unless
+    copy is False.
 
     See Also
     --------
@@ -320,4 +538,4 @@ def k_corona(G, k, core_number=None):
     nodes = (n for n in core_number
              if core_number[n] == k
              and len([v for v in G[n] if core_number[v] >= k]) == k)
-    return G.subgraph(nodes).copy()
+    return _core_subgraph(G, nodes, copy)
@@ -104,8 +104,12 @@ def build_residual_network(G, capacity):
 
     inf = float('inf')
     # Extract edges with positive capacities. Self loops excluded.
-    edge_list = [(u, v, attr) for u, v, attr in G.edges_iter(data=True)
-                 if u != v and attr.get(capacity, inf) > 0]
+    if isinstance(G, nx.CSRGraph):
+        edge_list = _csr_capacities(G, capacity)
+    else:
+        edge_list = [(u, v, attr.get(capacity, inf))
+                     for u, v, attr in G.edges_iter(data=True)]
+    edge_list = [(u, v, c) for u, v, c in edge_list if u != v and c > 0]
     # Simulate infinity with three times the sum of the finite edge capacities
     # or any positive value if the sum is zero. This allows the
     # infinite-capacity edges to be distinguished for unboundedness detection
@@ -116,11 +120,10 @@ def build_residual_network(G, capacity):
     # finite-capacity edge is at most 1/3 of inf, if an operation moves more
     # than 1/3 of inf units of flow to t, there must be an infinite-capacity
     # s-t path in G.
-    inf = 3 * sum(attr[capacity] for u, v, attr in edge_list
-                  if capacity in attr and attr[capacity] != inf) or 1
+    inf = 3 * sum(c for u, v, c in edge_list if c != inf) or 1
     if G.is_directed():
-        for u, v, attr in edge_list:
-            r = min(attr.get(capacity, inf), inf)
+        for u, v, c in edge_list:
+            r = min(c, inf)
             if not R.has_edge(u, v):
                 # Both (u, v) and (v, u) must be present in the residual
                 # network.
@@ -130,9 +133,9 @@ def build_residual_network(G, capacity):
                 # The edge (u, v) was added when (v, u) was visited.
                 R[u][v]['capacity'] = r
     else:
-        for u, v, attr in edge_list:
+        for u, v, c in edge_list:
             # Add a pair of edges with equal residual capacities.
-            r = min(attr.get(capacity, inf), inf)
+            r = min(c, inf)
             R.add_edge(u, v, capacity=r)
             R.add_edge(v, u, capacity=r)
 
@@ -142,6 +145,36 @@ def build_residual_network(G, capacity):
     return R
 
 
+def _csr_capacities(G, capacity):
+    """Return the edges (u, v, c) of the CSRGraph or CSRDiGraph G in the
+    order of G.edges(), where c is the capacity of the edge.
+
+    The capacities are read from the column G.edge_columns[capacity]
+    rather than from an edge data dict built for every edge.  They are
+    infinite for the edges without the attribute.
+    """
+    import numpy as np
+    rows = G._rows()
+    indices = G.indices
+    column = G.edge_columns.get(capacity)
+    if column is None:
+        caps = np.empty(len(indices))
+        caps.fill(np.inf)
+    else:
+        caps = column
+        missing = G._missing.get(capacity)
+        if missing is not None:
+            caps = column.astype(float)
+            caps[missing] = np.inf
+    if not G.is_directed():
+        # each edge once, as it comes in G.edges()
+        keep = rows <= indices
+        rows, indices, caps = rows[keep], indices[keep], caps[keep]
+    labels = G.node._labels
+    return [(labels[u], labels[v], c) for u, v, c in
+            zip(rows.tolist(), indices.tolist(), caps.tolist())]
+
+
 def detect_unboundedness(R, s, t):
     """Detect an infinite-capacity s-t path in R.
     """
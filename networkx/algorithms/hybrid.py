@@ -14,7 +14,6 @@ __author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu
 
 _all__ = ['kl_connected_subgraph', 'is_kl_connected']
 
-import copy
 import networkx as nx
 
 
@@ -68,7 +67,7 @@ def kl_connected_subgraph(G, k, l, low_memory=False, same_as_graph=False):
             2004. 89--104.
 
     """
-    H=copy.deepcopy(G)    # subgraph we construct by removing from G
+    H=G.copy()    # subgraph we construct by removing from G
 
     graphOK=True
     deleted_some=True # hack to start off the while loop
@@ -83,7 +82,7 @@ def kl_connected_subgraph(G, k, l, low_memory=False, same_as_graph=False):
                     [verts.update(G.neighbors(w)) for w in verts.copy()]
                 G2=G.subgraph(list(verts))
             else:
-                G2=copy.deepcopy(G)
+                G2=G.copy(attr='share')
             ###
             path=[u,v]
             cnt=0
@@ -166,7 +165,7 @@ def is_kl_connected(G, k, l, low_memory=False):
                 [verts.update(G.neighbors(w)) for w in verts.copy()]
             G2=G.subgraph(verts)
         else:
-            G2=copy.deepcopy(G)
+            G2=G.copy(attr='share')
         ###
         path=[u,v]
         cnt=0
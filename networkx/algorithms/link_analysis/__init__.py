@@ -1,2 +1,3 @@
 from networkx.algorithms.link_analysis.pagerank_alg import *
 from networkx.algorithms.link_analysis.hits_alg import *
+from networkx.algorithms.link_analysis.pagerank_tracker import *
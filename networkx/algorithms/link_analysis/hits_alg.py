@@ -9,6 +9,7 @@
 #    NetworkX:http://networkx.github.io/
 import networkx as nx
 from networkx.exception import NetworkXError
+from networkx.linalg.graphmatrix import _adjacency_operator
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 __all__ = ['hits','hits_numpy','hits_scipy','authority_matrix','hub_matrix']
 
@@ -52,7 +53,8 @@ def hits(G,max_iter=100,tol=1.0e-8,nstart=None,normalized=True):
     The eigenvector calculation is done by the power iteration method
     and has no guarantee of convergence.  The iteration will stop
     after max_iter iterations or an error tolerance of
-    number_of_nodes(G)*tol has been reached.
+    number_of_nodes(G)*tol has been reached.  If SciPy is available the
+    iteration multiplies by the adjacency matrix as a sparse matrix.
 
     The HITS algorithm was designed for directed graphs but this
     algorithm does not check if the input graph is directed and will
@@ -73,6 +75,12 @@ def hits(G,max_iter=100,tol=1.0e-8,nstart=None,normalized=True):
         raise Exception("hits() not defined for graphs with multiedges.")
     if len(G) == 0:
         return {},{}
+    try:
+        import scipy.sparse
+    except ImportError:
+        pass
+    else:
+        return _hits_power_iteration(G, max_iter, tol, nstart, normalized)
     # choose fixed starting vector if not given
     if nstart is None:
         h=dict.fromkeys(G,1.0/G.number_of_nodes())
@@ -96,6 +104,9 @@ def hits(G,max_iter=100,tol=1.0e-8,nstart=None,normalized=True):
         for n in h:
             for nbr in G[n]:
                 h[n]+=a[nbr]*G[n][nbr].get('weight',1)
+        if max(h.values()) == 0:
+            raise NetworkXError("HITS: the hub values are all 0, the "
+                                "graph has no edges with nonzero weight.")
         # normalize vector
         s=1.0/max(h.values())
         for n in h: h[n]*=s
@@ -129,7 +140,7 @@ def hub_matrix(G,nodelist=None):
     M=nx.to_numpy_matrix(G,nodelist=nodelist)
     return M*M.T
 
-def hits_numpy(G,normalized=True):
+def hits_numpy(G,normalized=True,dtype=float):
     """Return HITS hubs and authorities values for nodes.
 
     The HITS algorithm computes two numbers for a node.
@@ -144,6 +155,10 @@ def hits_numpy(G,normalized=True):
     normalized : bool (default=True)
        Normalize results by the sum of all of the values.
 
+    dtype : NumPy data type, optional (default=float)
+       The data type of the sparse adjacency matrix and of the singular
+       vectors.  Use numpy.float32 to halve the memory of the matrix.
+
     Returns
     -------
     (hubs,authorities) : two-tuple of dictionaries
@@ -157,7 +172,10 @@ def hits_numpy(G,normalized=True):
 
     Notes
     -----
-    The eigenvector calculation uses NumPy's interface to LAPACK.
+    The eigenvector calculation uses NumPy's interface to LAPACK.  If
+    SciPy is available the hubs and authorities are instead the leading
+    singular vectors of the sparse adjacency matrix, computed by ARPACK,
+    and no dense matrix is built.
 
     The HITS algorithm was designed for directed graphs but this
     algorithm does not check if the input graph is directed and will
@@ -181,25 +199,39 @@ def hits_numpy(G,normalized=True):
             "hits_numpy() requires NumPy: http://scipy.org/")
     if len(G) == 0:
         return {},{}
-    H=nx.hub_matrix(G,G.nodes())
-    e,ev=np.linalg.eig(H)
-    m=e.argsort()[-1] # index of maximum eigenvalue
-    h=np.array(ev[:,m]).flatten()
-    A=nx.authority_matrix(G,G.nodes())
-    e,ev=np.linalg.eig(A)
-    m=e.argsort()[-1] # index of maximum eigenvalue
-    a=np.array(ev[:,m]).flatten()
+    try:
+        from scipy.sparse import linalg
+    except ImportError:
+        linalg = None
+    if linalg is not None and len(G) > 2:
+        nodelist, M = _adjacency_operator(G, 'weight', dtype)
+        u, sigma, vt = linalg.svds(M, k=1)
+        h = u.ravel()
+        a = vt.ravel()
+        # the singular vectors are nonnegative up to their sign
+        h = h * np.sign(h.sum())
+        a = a * np.sign(a.sum())
+    else:
+        nodelist = G.nodes()
+        H=nx.hub_matrix(G,nodelist)
+        e,ev=np.linalg.eig(H)
+        m=e.argsort()[-1] # index of maximum eigenvalue
+        h=np.array(ev[:,m]).flatten()
+        A=nx.authority_matrix(G,nodelist)
+        e,ev=np.linalg.eig(A)
+        m=e.argsort()[-1] # index of maximum eigenvalue
+        a=np.array(ev[:,m]).flatten()
     if normalized:
         h = h/h.sum()
         a = a/a.sum()
     else:
         h = h/h.max()
         a = a/a.max()
-    hubs=dict(zip(G.nodes(),map(float,h)))
-    authorities=dict(zip(G.nodes(),map(float,a)))
+    hubs=dict(zip(nodelist,map(float,h)))
+    authorities=dict(zip(nodelist,map(float,a)))
     return hubs,authorities
 
-def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
+def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True,dtype=float):
     """Return HITS hubs and authorities values for nodes.
 
     The HITS algorithm computes two numbers for a node.
@@ -223,6 +255,10 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
     normalized : bool (default=True)
        Normalize results by the sum of all of the values.
 
+    dtype : NumPy data type, optional (default=float)
+       The data type of the adjacency matrix and of the iteration.
+       Use numpy.float32 to halve the memory of the matrix.
+
     Returns
     -------
     (hubs,authorities) : two-tuple of dictionaries
@@ -236,7 +272,9 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
 
     Notes
     -----
-    This implementation uses SciPy sparse matrices.
+    This implementation uses SciPy sparse matrices.  The authority matrix
+    is not formed: each iteration multiplies by the adjacency matrix and
+    its transpose.
 
     The eigenvector calculation is done by the power iteration method
     and has no guarantee of convergence.  The iteration will stop
@@ -266,18 +304,18 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
             "hits_scipy() requires SciPy: http://scipy.org/")
     if len(G) == 0:
         return {},{}
-    M=nx.to_scipy_sparse_matrix(G,nodelist=G.nodes())
-    (n,m)=M.shape # should be square
-    A=M.T*M # authority matrix
-    x=scipy.ones((n,1))/n  # initial guess
+    nodelist, M = _adjacency_operator(G, 'weight', dtype)
+    n = len(nodelist)
+    MT = M.T
+    x=np.ones(n, dtype=dtype)/n  # initial guess
     # power iteration on authority matrix
     i=0
     while True:
         xlast=x
-        x=A*x
+        x=MT.dot(M.dot(x))
         x=x/x.max()
         # check convergence, l1 norm
-        err=scipy.absolute(x-xlast).sum()
+        err=np.absolute(x-xlast).sum()
         if err < tol:
             break
         if i>max_iter:
@@ -285,16 +323,54 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
             "HITS: power iteration failed to converge in %d iterations."%(i+1))
         i+=1
 
-    a=np.asarray(x).flatten()
+    a=x
     # h=M*a
-    h=np.asarray(M*a).flatten()
+    h=M.dot(a)
     if normalized:
         h = h/h.sum()
         a = a/a.sum()
-    hubs=dict(zip(G.nodes(),map(float,h)))
-    authorities=dict(zip(G.nodes(),map(float,a)))
+    hubs=dict(zip(nodelist,map(float,h)))
+    authorities=dict(zip(nodelist,map(float,a)))
     return hubs,authorities
 
+
+def _hits_power_iteration(G, max_iter, tol, nstart, normalized):
+    """Return the hubs and authorities computed by hits() with a sparse
+    adjacency matrix."""
+    import numpy as np
+    nodelist, M = _adjacency_operator(G, 'weight')
+    MT = M.T
+    if nstart is None:
+        h = np.repeat(1.0 / len(nodelist), len(nodelist))
+    else:
+        h = np.array([nstart[n] for n in nodelist], dtype=float)
+        # normalize starting vector
+        h /= h.sum()
+    i = 0
+    while True: # power iteration: make up to max_iter iterations
+        hlast = h
+        # a^T = hlast^T * G, then h = G * a
+        a = MT.dot(hlast)
+        h = M.dot(a)
+        if h.max() == 0:
+            raise NetworkXError("HITS: the hub values are all 0, the "
+                                "graph has no edges with nonzero weight.")
+        # normalize vectors
+        h /= h.max()
+        a /= a.max()
+        # check convergence, l1 norm
+        err = np.absolute(h - hlast).sum()
+        if err < tol:
+            break
+        if i > max_iter:
+            raise NetworkXError(
+            "HITS: power iteration failed to converge in %d iterations."%(i+1))
+        i += 1
+    if normalized:
+        a /= a.sum()
+        h /= h.sum()
+    return dict(zip(nodelist, h.tolist())), dict(zip(nodelist, a.tolist()))
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
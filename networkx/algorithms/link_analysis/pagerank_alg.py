@@ -6,12 +6,16 @@
 #    All rights reserved.
 #    BSD license.
 #    NetworkX:http://networkx.github.io/
+from collections import deque
 import networkx as nx
+from networkx.classes.csrgraph import _cache
 from networkx.exception import NetworkXError
+from networkx.linalg.graphmatrix import _adjacency_operator, _block_size
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'pagerank_batch',
+           'approximate_personalized_pagerank', 'google_matrix']
 
 
 @not_implemented_for('multigraph')
@@ -76,6 +80,9 @@ def pagerank(G, alpha=0.85, personalization=None,
     after max_iter iterations or an error tolerance of
     number_of_nodes(G)*tol has been reached.
 
+    If SciPy is available the iteration runs on a sparse matrix as in
+    pagerank_scipy(), otherwise on the dicts of the graph.
+
     The PageRank algorithm was designed for directed graphs but this
     algorithm does not check if the input graph is directed and will
     execute on undirected graphs by converting each edge in the
@@ -83,7 +90,7 @@ def pagerank(G, alpha=0.85, personalization=None,
 
     See Also
     --------
-    pagerank_numpy, pagerank_scipy, google_matrix
+    pagerank_numpy, pagerank_scipy, pagerank_batch, google_matrix
 
     References
     ----------
@@ -96,6 +103,13 @@ def pagerank(G, alpha=0.85, personalization=None,
     """
     if len(G) == 0:
         return {}
+    try:
+        import scipy.sparse
+    except ImportError:
+        pass
+    else:
+        return _pagerank_sparse(G, 'pagerank', alpha, personalization,
+                                max_iter, tol, nstart, weight, dangling)
 
     if not G.is_directed():
         D = G.to_directed()
@@ -343,7 +357,7 @@ def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight',
 
 def pagerank_scipy(G, alpha=0.85, personalization=None,
                    max_iter=100, tol=1.0e-6, weight='weight',
-                   dangling=None):
+                   dangling=None, nstart=None):
     """Return the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -382,6 +396,10 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
       matrix (see notes under google_matrix). It may be common to have the
       dangling dict to be the same as the personalization dict.
 
+    nstart : dictionary, optional
+      Starting value of PageRank iteration for each node, for example
+      the PageRank of a previous version of the graph.
+
     Returns
     -------
     pagerank : dictionary
@@ -395,7 +413,8 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     Notes
     -----
     The eigenvector calculation uses power iteration with a SciPy
-    sparse matrix representation.
+    sparse matrix representation.  For a CSRGraph or CSRDiGraph the
+    matrix is built once and kept with the graph.
 
     This implementation works with Multi(Di)Graphs. For multigraphs the
     weight between two nodes is set to be the sum of all edge weights
@@ -403,7 +422,7 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
 
     See Also
     --------
-    pagerank, pagerank_numpy, google_matrix
+    pagerank, pagerank_numpy, pagerank_batch, google_matrix
 
     References
     ----------
@@ -414,62 +433,385 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
        The PageRank citation ranking: Bringing order to the Web. 1999
        http://dbpubs.stanford.edu:8090/pub/showDoc.Fulltext?lang=en&doc=1999-66&format=pdf
     """
-    import scipy.sparse
-
-    N = len(G)
-    if N == 0:
+    if len(G) == 0:
         return {}
+    return _pagerank_sparse(G, 'pagerank_scipy', alpha, personalization,
+                            max_iter, tol, nstart, weight, dangling)
 
-    nodelist = G.nodes()
-    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  dtype=float)
-    S = scipy.array(M.sum(axis=1)).flatten()
-    S[S != 0] = 1.0 / S[S != 0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
 
-    # initial vector
-    x = scipy.repeat(1.0 / N, N)
+def pagerank_batch(G, personalizations, alpha=0.85, max_iter=100,
+                   tol=1.0e-6, nstart=None, weight='weight', dangling=None):
+    """Return the personalized PageRank of the nodes for many
+    personalization vectors at once.
 
-    # Personalization vector
-    if personalization is None:
-        p = scipy.repeat(1.0 / N, N)
-    else:
-        missing = set(nodelist) - set(personalization)
-        if missing:
-            raise NetworkXError('Personalization vector dictionary '
-                                'must have a value for every node. '
-                                'Missing nodes %s' % missing)
-        p = scipy.array([personalization[n] for n in nodelist],
-                        dtype=float)
-        p = p / p.sum()
+    Parameters
+    -----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
 
-    # Dangling nodes
-    if dangling is None:
-        dangling_weights = p
-    else:
-        missing = set(nodelist) - set(dangling)
-        if missing:
-            raise NetworkXError('Dangling node dictionary '
-                                'must have a value for every node. '
-                                'Missing nodes %s' % missing)
-        # Convert the dangling dictionary into an array in nodelist order
-        dangling_weights = scipy.array([dangling[n] for n in nodelist],
-                                       dtype=float)
-        dangling_weights /= dangling_weights.sum()
-    is_dangling = scipy.where(S == 0)[0]
+    personalizations : list of dicts
+      The personalization vectors.  Each is a dictionary keyed by node,
+      for example with the nodes of a seed set as keys; nodes that are
+      not keys get 0.  The values must not all be 0.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method solver,
+      for each vector.
+
+    nstart : NumPy array or list of dicts, optional
+      Starting values, one column or dict per personalization vector,
+      for example a previous result of pagerank_batch().
 
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, see pagerank().
+      By default, dangling nodes are given outedges according to each
+      personalization vector.
+
+    Returns
+    -------
+    pagerank : NumPy array
+       Array with a row for each node, in the order of G.nodes(), and a
+       column with the PageRank for each personalization vector.
+
+    Raises
+    ------
+    NetworkXError
+       If a personalization vector has a key that is not a node of G, or
+       if the power iteration does not converge for some vector within
+       max_iter iterations.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> pr = nx.pagerank_batch(G, [{0: 1}, {1: 1, 2: 1}], alpha=0.9)
+    >>> pr.shape
+    (4, 2)
+    >>> pr = nx.pagerank_batch(G, [{0: 1}, {1: 1, 2: 2}], nstart=pr)
+
+    Notes
+    -----
+    The transition matrix is built once and all the vectors are iterated
+    together, so each iteration is one product of the sparse matrix with
+    a dense matrix with a column per vector.  A vector stops being
+    iterated when it has converged.  For a CSRGraph or CSRDiGraph the
+    matrix is kept with the graph and reused by later calls.
+
+    See Also
+    --------
+    pagerank, pagerank_scipy
+    """
+    for personalization in personalizations:
+        for n in personalization:
+            if n not in G:
+                raise NetworkXError('pagerank_batch: personalization node '
+                                    '%s is not in the graph.' % (n,))
+    if len(G) == 0:
+        import numpy as np
+        return np.zeros((0, len(personalizations)))
+    nodelist, X = _pagerank_columns(G, alpha, personalizations, max_iter,
+                                    tol, nstart, weight, dangling)
+    if X is None:
+        raise NetworkXError('pagerank_batch: power iteration failed to '
+                            'converge in %d iterations.' % max_iter)
+    return X
+
+
+def approximate_personalized_pagerank(G, seeds, epsilon=1.0e-4, alpha=0.85,
+                                      weight='weight', reverse=False):
+    r"""Return an approximation of the PageRank personalized on the seed
+    nodes, computed from the neighborhood of the seeds only.
+
+    Parameters
+    -----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    seeds : iterable or dict
+      The seed nodes, or a dictionary with the personalization value of
+      each seed node.  Nodes that are not seeds get 0.
+
+    epsilon : float, optional
+      Error tolerance, default=1.0e-4.  See the notes.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    reverse : bool, optional
+      If False (the default) return the PageRank of the nodes personalized
+      on the seeds.  If True return for each node `s` the PageRank of the
+      seeds personalized on `s`, the contribution of `s` to the PageRank
+      of the seeds.
+
+    Returns
+    -------
+    pagerank : dictionary
+       Dictionary of the nodes with a nonzero approximation, with the
+       approximation as value.
+
+    Raises
+    ------
+    NetworkXError
+       If a seed is not in the graph or all personalization values are 0.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> pr = nx.approximate_personalized_pagerank(G, [0], epsilon=1e-3)
+    >>> sorted(pr) == [0, 1, 2, 3, 4]
+    True
+    >>> pr = nx.approximate_personalized_pagerank(G, [0], epsilon=0.1)
+    >>> sorted(pr)
+    [0, 1, 2]
+
+    Notes
+    -----
+    The forward push of Andersen, Chung and Lang [1]_ keeps an
+    approximation `p` and a residual `r`, starting with `p = 0` and `r`
+    the personalization vector.  A push at a node `u` moves `1 - \alpha`
+    of `r(u)` to `p(u)` and spreads the rest over the successors of `u`
+    along the weights of the out-edges; the residual of a node without
+    successors is spread according to the personalization vector, as
+    pagerank() does by default.  Nodes are pushed until `r(u) < \epsilon
+    d(u)` for every node, where `d(u)` is the sum of the weights of the
+    out-edges of `u`, or 1 if it is 0.  Then `p` underestimates the
+    PageRank, for undirected graphs by at most `\epsilon d(u)` at every
+    node `u`.  Without weights `d(u)` is the number of successors of `u`
+    and the pushes cost `O(1 / ((1 - \alpha) \epsilon))` time whatever
+    the size of the graph.
+
+    With reverse=True the reverse push of [2]_ spreads the residual of a
+    node over its predecessors instead, until `r(u) < \epsilon` for every
+    node, and the approximation of every contribution is then
+    underestimated by at most `\epsilon`.  In this direction the random
+    walk stops at nodes without successors, so the values are the
+    contributions to pagerank() only for graphs in which every node has a
+    successor.
+
+    See Also
+    --------
+    pagerank, pagerank_batch
+
+    References
+    ----------
+    .. [1] Reid Andersen, Fan Chung and Kevin Lang:
+       Local Graph Partitioning using PageRank Vectors.
+       Proceedings of the 47th Annual IEEE Symposium on Foundations of
+       Computer Science, 475-486, 2006.
+    .. [2] Reid Andersen, Christian Borgs, Jennifer Chayes, John Hopcroft,
+       Vahab Mirrokni and Shang-Hua Teng:
+       Local Computation of PageRank Contributions.
+       Algorithms and Models for the Web-Graph, LNCS 4863, 150-165, 2007.
+    """
+    if not hasattr(seeds, 'items'):
+        seeds = dict.fromkeys(seeds, 1)
+    for n in seeds:
+        if n not in G:
+            raise NetworkXError("The seed %s is not in the graph." % (n,))
+    s = float(sum(seeds.values()))
+    if s == 0:
+        raise NetworkXError("The personalization values of the seeds "
+                            "must not all be 0.")
+    personalization = dict((n, v / s) for n, v in seeds.items() if v)
+    if G.is_directed():
+        succ, pred = G.succ, G.pred
+    else:
+        succ = pred = G.adj
+    multigraph = G.is_multigraph()
+    out_weights = {}
+
+    def out_weight(u):
+        """Return the sum of the weights of the out-edges of u."""
+        if u not in out_weights:
+            out_weights[u] = float(sum(_edge_weight(d, weight, multigraph)
+                                       for d in succ[u].values()))
+        return out_weights[u]
+
+    if reverse:
+        def threshold(u):
+            return epsilon
+    else:
+        def threshold(u):
+            return epsilon * (out_weight(u) or 1)
+    p = {}
+    r = dict(personalization)
+    queue = deque(u for u in r if r[u] >= threshold(u))
+    queued = set(queue)
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        ru = r.pop(u)
+        p[u] = p.get(u, 0) + (1 - alpha) * ru
+        if reverse:
+            # u gets from each predecessor v the fraction of the pushes
+            # of v that goes along the edges from v to u.
+            push = ((v, alpha * ru * _edge_weight(d, weight, multigraph) /
+                     out_weight(v)) for v, d in pred[u].items())
+        elif out_weight(u) > 0:
+            share = alpha * ru / out_weight(u)
+            push = ((v, share * _edge_weight(d, weight, multigraph))
+                    for v, d in succ[u].items())
+        else:
+            push = ((v, alpha * ru * x) for v, x in personalization.items())
+        for v, x in push:
+            r[v] = r.get(v, 0) + x
+            if v not in queued and r[v] >= threshold(v):
+                queue.append(v)
+                queued.add(v)
+    return p
+
+
+def _edge_weight(data, weight, multigraph):
+    """Return the weight of an edge with the given data, the sum of the
+    weights of the parallel edges for multigraphs."""
+    if weight is None:
+        return len(data) if multigraph else 1
+    if multigraph:
+        return sum(d.get(weight, 1) for d in data.values())
+    return data.get(weight, 1)
+
+
+def _pagerank_sparse(G, name, alpha, personalization, max_iter, tol, nstart,
+                     weight, dangling):
+    """Return the PageRank of pagerank() and pagerank_scipy() as a dict,
+    computed by _pagerank_columns."""
+    for values, what in ((personalization, 'Personalization vector'),
+                         (dangling, 'Dangling node')):
+        if values is not None:
+            missing = set(G) - set(values)
+            if missing:
+                raise NetworkXError('%s dictionary '
+                                    'must have a value for every node. '
+                                    'Missing nodes %s' % (what, missing))
+    if personalization is not None:
+        personalization = [personalization]
+    if nstart is not None:
+        nstart = [nstart]
+    nodelist, X = _pagerank_columns(G, alpha, personalization, max_iter,
+                                    tol, nstart, weight, dangling)
+    if X is None:
+        raise NetworkXError('%s: power iteration failed to converge '
+                            'in %d iterations.' % (name, max_iter))
+    return dict(zip(nodelist, X[:, 0].tolist()))
+
+
+def _pagerank_columns(G, alpha, personalizations, max_iter, tol, nstart,
+                      weight, dangling):
+    """Run the power iteration for every personalization vector (one
+    uniform vector if personalizations is None).
+
+    Returns the list of nodes and an array with a column for each vector,
+    or None for the array if some vector did not converge.
+    """
+    import numpy as np
+    nodelist, MT, is_dangling = _transition_matrix(G, weight)
+    N = len(nodelist)
+    index = dict(zip(nodelist, range(N)))
+    if personalizations is None:
+        P = np.repeat(1.0 / N, N)[:, None]
+    else:
+        P = _columns(personalizations, index)
+    if nstart is None:
+        X = np.repeat(1.0 / N, N * P.shape[1]).reshape(N, P.shape[1])
+    elif hasattr(nstart, 'shape'):
+        X = np.array(nstart, dtype=float)
+        X /= X.sum(axis=0)
+    else:
+        X = _columns(nstart, index)
+    if dangling is not None:
+        dangling = _columns([dangling], index)
+    size = _block_size(N)
+    for start in range(0, P.shape[1], size):
+        block = slice(start, start + size)
+        if not _power_iteration(MT, is_dangling, P[:, block], dangling,
+                                X[:, block], alpha, max_iter, tol):
+            return nodelist, None
+    return nodelist, X
+
+
+def _power_iteration(MT, is_dangling, P, D, X, alpha, max_iter, tol):
+    """Iterate the columns of X in place, with the personalization vectors
+    in the columns of P and the dangling vector D (P if None).
+
+    Returns False if some column did not converge within max_iter
+    iterations.
+    """
+    import numpy as np
+    N = X.shape[0]
+    columns = np.arange(X.shape[1])
+    x = X.copy()
+    p = P
+    d = P if D is None else D
     # power iteration: make up to max_iter iterations
     for _ in range(max_iter):
         xlast = x
-        x = alpha * (x * M + sum(x[is_dangling]) * dangling_weights) + \
+        x = alpha * (MT.dot(xlast) + d * xlast[is_dangling].sum(axis=0)) + \
             (1 - alpha) * p
-        # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < N * tol:
-            return dict(zip(nodelist, map(float, x)))
-    raise NetworkXError('pagerank_scipy: power iteration failed to converge '
-                        'in %d iterations.' % max_iter)
+        # check convergence of every column, l1 norm
+        err = np.absolute(x - xlast).sum(axis=0)
+        converged = err < N * tol
+        if converged.any():
+            X[:, columns[converged]] = x[:, converged]
+            if converged.all():
+                return True
+            # go on with the other columns only
+            active = ~converged
+            columns = columns[active]
+            x = x[:, active]
+            p = p[:, active]
+            if D is None:
+                d = p
+    return False
+
+
+def _columns(vectors, index):
+    """Return an array with a column for each dict in vectors, normalized
+    to sum to 1, and a row for each node in index.  Keys that are not in
+    index are ignored."""
+    import numpy as np
+    A = np.zeros((len(index), len(vectors)))
+    for j, vector in enumerate(vectors):
+        items = [(index[n], v) for n, v in vector.items() if n in index]
+        A[[i for i, v in items], j] = [v for i, v in items]
+    return A / A.sum(axis=0)
+
+
+def _transition_matrix(G, weight):
+    """Return the nodes of G, the transpose of the right stochastic
+    matrix of G as a SciPy sparse matrix and the positions of the
+    dangling nodes.
+
+    The result is kept in the cache of a CSRGraph.
+    """
+    import numpy as np
+    import scipy.sparse
+    cache = _cache(G)
+    key = ('transition', weight)
+    if cache is not None and key in cache:
+        return cache[key]
+    nodelist, M = _adjacency_operator(G, weight)
+    N = len(nodelist)
+    S = np.asarray(M.sum(axis=1)).flatten()
+    is_dangling = np.where(S == 0)[0]
+    S[S != 0] = 1.0 / S[S != 0]
+    Q = scipy.sparse.spdiags(S, 0, N, N, format='csr')
+    MT = Q.dot(M).T.tocsr()
+    if cache is not None:
+        cache[key] = (nodelist, MT, is_dangling)
+    return nodelist, MT, is_dangling
 
 
 # fixture for nose tests
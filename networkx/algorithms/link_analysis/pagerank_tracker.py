@@ -0,0 +1,331 @@
+"""
+PageRank maintained under edge insertions and deletions.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from collections import deque
+import networkx as nx
+from networkx.algorithms.link_analysis.pagerank_alg import (_columns,
+                                                            _pagerank_columns,
+                                                            _transition_matrix)
+__all__ = ['PageRankTracker']
+
+
+class PageRankTracker(object):
+    r"""PageRank of a graph that changes by batches of edge insertions and
+    deletions.
+
+    The scores are kept as an approximation `p` with a residual `r`, as
+    in the forward push of approximate_personalized_pagerank(), such that
+    the PageRank is `p` plus the PageRank personalized on `r`.  When the
+    out-edges of a node `u` change only the residual of the old and new
+    successors of `u` has to be corrected for the invariant to hold, by
+    `\alpha p(u) / (1 - \alpha)` times the change of the transition
+    probabilities [1]_.  Nodes are then pushed locally until the residual
+    is small again.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph or directed graph.  Undirected graphs are handled
+      as directed graphs with two directed edges for each undirected edge.
+      It is modified by add_edges_from() and remove_edges_from() and must
+      not be changed in any other way while the object is in use.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    personalization: dict, optional
+      The personalization vector, a dictionary keyed by node; nodes that
+      are not keys, including the nodes added later, get 0.  By default,
+      a uniform distribution over the current nodes is used.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, see pagerank().
+      By default, dangling nodes are given outedges according to the
+      personalization vector.
+
+    tol : float, optional
+      Error tolerance.  The residual of every node `u` is kept below `tol`
+      times its number of successors (at least 1), so the scores are off
+      by at most about `tol` times the number of edges in total.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> pr = nx.PageRankTracker(G)
+    >>> pr.add_edges_from([(0, 2), (2, 3)])
+    >>> pr.remove_edge(1, 2)
+    >>> p = pr.pagerank()
+    >>> q = nx.pagerank(G)
+    >>> all(abs(p[n] - q[n]) < 1e-4 for n in G)
+    True
+
+    Notes
+    -----
+    The initial scores are computed as in pagerank_scipy() when SciPy is
+    available, and by pushes from the personalization vector otherwise.
+    The results follow pagerank(): the residual of dangling nodes goes to
+    the dangling vector, or to the personalization vector, which is kept
+    as a single number since it is a multiple of the PageRank itself.
+
+    Multigraphs are not supported.
+
+    See Also
+    --------
+    pagerank, approximate_personalized_pagerank
+
+    References
+    ----------
+    .. [1] Hongyang Zhang, Peter Lofgren and Ashish Goel:
+       Approximate Personalized PageRank on Dynamic Graphs.
+       Proceedings of the 22nd ACM SIGKDD International Conference on
+       Knowledge Discovery and Data Mining, 1315-1324, 2016.
+    """
+
+    def __init__(self, G, alpha=0.85, personalization=None, weight='weight',
+                 dangling=None, tol=1.0e-6):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'multigraph type')
+        self.G = G
+        self.alpha = alpha
+        self.weight = weight
+        self.tol = tol
+        self._succ = G.succ if G.is_directed() else G.adj
+        self._personalization = _normalized(personalization)
+        self._dangling = _normalized(dangling)
+        self._out_weight = dict((u, self._row_weight(u)) for u in G)
+        # The residual is r plus _restart times the personalization
+        # vector, and the PageRank of p + r is 1 - _restart times the
+        # PageRank of the graph.
+        self._restart = 0.0
+        self._p, self._r = self._initial_scores()
+        # sum of p over the dangling nodes
+        self._dangling_mass = sum(self._p.get(u, 0) for u, w in
+                                  self._out_weight.items() if w == 0)
+        self._queue = deque()
+        self._queued = set()
+        for u in list(self._r):
+            self._add_residual(u, 0.0)
+        self._push()
+
+    def pagerank(self):
+        """Return a dictionary of nodes with PageRank as the value."""
+        scale = 1.0 / (1 - self._restart)
+        p = self._p
+        return dict((n, p.get(n, 0.0) * scale) for n in self.G)
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between u and v to the graph and update the scores.
+
+        See add_edges_from().
+        """
+        self.add_edges_from([(u, v)], **attr)
+
+    def add_edges_from(self, ebunch, **attr):
+        """Add the edges in ebunch to the graph and update the scores.
+
+        The edges are given as 2-tuples (u, v) or 3-tuples (u, v, d), as
+        for Graph.add_edges_from().  The nodes are added if they are not
+        in the graph.  The scores are updated once for the whole batch.
+        """
+        ebunch = list(ebunch)
+        for e in ebunch:
+            for x in e[:2]:
+                if x not in self.G:
+                    self._add_node(x)
+        rows = self._rows(ebunch)
+        self.G.add_edges_from(ebunch, **attr)
+        self._update(rows)
+
+    def remove_edge(self, u, v):
+        """Remove the edge between u and v from the graph and update the
+        scores.
+
+        See remove_edges_from().
+        """
+        self.remove_edges_from([(u, v)])
+
+    def remove_edges_from(self, ebunch):
+        """Remove the edges in ebunch from the graph and update the scores.
+
+        The scores are updated once for the whole batch.
+
+        Raises
+        ------
+        NetworkXError
+           If an edge is not in the graph.  No edge is removed then.
+        """
+        ebunch = list(ebunch)
+        for e in ebunch:
+            u, v = e[:2]
+            if u not in self._succ or v not in self._succ[u]:
+                raise nx.NetworkXError("The edge %s-%s is not in the graph."
+                                       % (u, v))
+        rows = self._rows(ebunch)
+        self.G.remove_edges_from(ebunch)
+        self._update(rows)
+
+    def _initial_scores(self):
+        """Return p and r, from pagerank_scipy() when possible."""
+        G = self.G
+        try:
+            import scipy.sparse
+        except ImportError:
+            pass
+        else:
+            if len(G) > 0:
+                personalization = self._personalization
+                if personalization is not None:
+                    personalization = [personalization]
+                nodelist, X = _pagerank_columns(G, self.alpha,
+                                                personalization, 100,
+                                                self.tol, None, self.weight,
+                                                self._dangling)
+                if X is not None:
+                    return self._residual(nodelist, X[:, 0])
+        if self._personalization is None:
+            return {}, dict.fromkeys(G, 1.0 / max(len(G), 1))
+        return {}, dict(self._personalization)
+
+    def _residual(self, nodelist, x):
+        """Return p and r for the scores x of the nodes in nodelist."""
+        import numpy as np
+        alpha = self.alpha
+        N = len(nodelist)
+        nodelist, MT, is_dangling = _transition_matrix(self.G, self.weight)
+        index = dict(zip(nodelist, range(N)))
+        if self._personalization is None:
+            s = np.repeat(1.0 / N, N)
+        else:
+            s = _columns([self._personalization], index)[:, 0]
+        d = s if self._dangling is None else \
+            _columns([self._dangling], index)[:, 0]
+        xP = MT.dot(x) + d * x[is_dangling].sum()
+        r = s - (x - alpha * xP) / (1 - alpha)
+        return dict(zip(nodelist, x.tolist())), dict(zip(nodelist, r.tolist()))
+
+    def _row_weight(self, u):
+        """Return the sum of the weights of the out-edges of u."""
+        weight = self.weight
+        if weight is None:
+            return len(self._succ[u])
+        return float(sum(d.get(weight, 1) for d in self._succ[u].values()))
+
+    def _row(self, u):
+        """Return the transition probabilities from u as a dict, or None
+        if u is dangling."""
+        total = self._row_weight(u)
+        if total == 0:
+            return None
+        weight = self.weight
+        return dict((v, (1 if weight is None else d.get(weight, 1)) / total)
+                    for v, d in self._succ[u].items())
+
+    def _rows(self, ebunch):
+        """Return the transition probabilities of the nodes whose
+        out-edges are changed by the edges in ebunch."""
+        tails = set(e[0] for e in ebunch)
+        if not self.G.is_directed():
+            tails.update(e[1] for e in ebunch)
+        return dict((u, self._row(u)) for u in tails)
+
+    def _update(self, rows):
+        """Correct the residual for the changes of the transition
+        probabilities from the old ones in rows, then push."""
+        scale = self.alpha / (1 - self.alpha)
+        for u, old in rows.items():
+            new = self._row(u)
+            self._out_weight[u] = self._row_weight(u)
+            pu = self._p.get(u, 0.0)
+            if (old is None) != (new is None):
+                self._dangling_mass += pu if new is None else -pu
+            if pu:
+                self._add_row(new, scale * pu)
+                self._add_row(old, -scale * pu)
+            # the threshold of u depends on its number of successors
+            self._add_residual(u, 0.0)
+        self._push()
+
+    def _add_node(self, x):
+        """Add the node x to the graph and correct the residual if the
+        personalization vector is uniform."""
+        n = len(self.G)
+        self.G.add_node(x)
+        self._out_weight[x] = 0
+        if self._personalization is not None:
+            return
+        if n == 0:
+            self._add_residual(x, 1.0)
+            return
+        # The personalization vector s becomes (n s + e_x) / (n + 1).  The
+        # residual changes by k times that change, where k counts s once
+        # and once more for each dangling row equal to s.
+        k = 1.0
+        if self._dangling is None:
+            k += self.alpha * self._dangling_mass / (1 - self.alpha)
+        c = self._restart
+        self._restart = k + (c - k) * (n + 1) / n
+        self._add_residual(x, (k - c) / n)
+
+    def _add_row(self, row, x):
+        """Add x times the transition probabilities row to the residual."""
+        if row is None:
+            if self._dangling is None:
+                self._restart += x
+                return
+            row = self._dangling
+        for v, y in row.items():
+            self._add_residual(v, x * y)
+
+    def _add_residual(self, v, x):
+        r = self._r
+        r[v] = r.get(v, 0.0) + x
+        if v not in self._queued and \
+                abs(r[v]) >= self.tol * max(len(self._succ[v]), 1):
+            self._queue.append(v)
+            self._queued.add(v)
+
+    def _push(self):
+        alpha = self.alpha
+        weight = self.weight
+        succ = self._succ
+        p = self._p
+        r = self._r
+        queue = self._queue
+        queued = self._queued
+        while queue:
+            u = queue.popleft()
+            queued.discard(u)
+            ru = r.pop(u)
+            if abs(ru) < self.tol * max(len(succ[u]), 1):
+                # other pushes made the residual small again
+                r[u] = ru
+                continue
+            p[u] = p.get(u, 0.0) + (1 - alpha) * ru
+            total = self._out_weight[u]
+            if total == 0:
+                self._dangling_mass += (1 - alpha) * ru
+                self._add_row(None, alpha * ru)
+                continue
+            share = alpha * ru / total
+            for v, d in succ[u].items():
+                w = 1 if weight is None else d.get(weight, 1)
+                self._add_residual(v, share * w)
+
+
+def _normalized(values):
+    """Return a copy of the dict values normalized to sum to 1, or None if
+    values is None."""
+    if values is None:
+        return None
+    s = float(sum(values.values()))
+    return dict((n, v / s) for n, v in values.items() if v)
@@ -91,3 +91,25 @@ class TestHITS:
             raise SkipTest('scipy not available.')
         G=networkx.Graph()
         assert_equal(networkx.hits_scipy(G),({},{}))
+
+    def test_sparse_solvers(self):
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = networkx.gnp_random_graph(30, 0.2, seed=1, directed=True)
+        h, a = networkx.hits(G, tol=1.e-12, max_iter=1000)
+        for hubs, authorities in [networkx.hits_numpy(G),
+                                  networkx.hits_scipy(G, tol=1.e-12,
+                                                      max_iter=1000),
+                                  networkx.hits_scipy(G, tol=1.e-6,
+                                                      dtype=np.float32),
+                                  networkx.hits_numpy(G, dtype=np.float32)]:
+            for n in G:
+                assert_almost_equal(h[n], hubs[n], places=5)
+                assert_almost_equal(a[n], authorities[n], places=5)
+
+    def test_no_edges(self):
+        G = networkx.empty_graph(3)
+        assert_raises(networkx.NetworkXError, networkx.hits, G)
@@ -158,3 +158,129 @@ class TestPageRankScipy(TestPageRank):
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+
+    def test_batch_pagerank(self):
+        G = self.G
+        personalizations = [{1: 1}, {2: 1, 5: 3},
+                            dict((n, random.random()) for n in G)]
+        pr = networkx.pagerank_batch(G, personalizations, alpha=0.9,
+                                     tol=1.e-08, dangling=self.dangling_edges)
+        assert_equal(pr.shape, (len(G), 3))
+        for j, personalization in enumerate(personalizations):
+            personalization = dict((n, personalization.get(n, 0))
+                                   for n in G)
+            p = networkx.pagerank_scipy(G, alpha=0.9, tol=1.e-08,
+                                        personalization=personalization,
+                                        dangling=self.dangling_edges)
+            for i, n in enumerate(G):
+                assert_almost_equal(pr[i, j], p[n], places=6)
+
+    def test_batch_warm_start(self):
+        G = self.G
+        pr = networkx.pagerank_batch(G, [{1: 1}, {3: 1}], tol=1.e-08)
+        # starting from the solution converges in one iteration
+        warm = networkx.pagerank_batch(G, [{1: 1}, {3: 1}], tol=1.e-08,
+                                       nstart=pr, max_iter=1)
+        assert_true(numpy.allclose(warm, pr))
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      [{1: 1}, {3: 1}], max_iter=1)
+        p = networkx.pagerank_scipy(G, tol=1.e-08)
+        q = networkx.pagerank_scipy(G, tol=1.e-08, nstart=p, max_iter=1)
+        for n in G:
+            assert_almost_equal(p[n], q[n], places=6)
+
+    def test_extra_keys(self):
+        G = self.G
+        p = networkx.pagerank_scipy(G, alpha=0.9, tol=1.e-08)
+        extra = dict((n, 1) for n in G)
+        extra['not a node'] = 3
+        for pagerank in (networkx.pagerank, networkx.pagerank_scipy):
+            q = pagerank(G, alpha=0.9, tol=1.e-08, personalization=extra,
+                         dangling=extra, nstart=extra)
+            for n in G:
+                assert_almost_equal(p[n], q[n], places=6)
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      [{1: 1}, {1: 1, 'not a node': 1}])
+
+    def test_csrgraph_cache(self):
+        G = networkx.CSRDiGraph(self.G)
+        p = networkx.pagerank(G, alpha=0.9, tol=1.e-08)
+        q = networkx.pagerank(self.G, alpha=0.9, tol=1.e-08)
+        for n in G:
+            assert_almost_equal(p[n], q[n], places=6)
+        assert_equal(networkx.pagerank(G, alpha=0.9, tol=1.e-08), p)
+        # changing the weights invalidates the transition matrix
+        weights = dict(((u, v), 1 + u * v) for u, v in self.G.edges())
+        networkx.set_edge_attributes(G, 'weight', weights)
+        networkx.set_edge_attributes(self.G, 'weight', weights)
+        p = networkx.pagerank(G, alpha=0.9, tol=1.e-08)
+        q = networkx.pagerank(self.G, alpha=0.9, tol=1.e-08)
+        for n in G:
+            assert_almost_equal(p[n], q[n], places=6)
+
+
+class TestApproximatePageRank(object):
+
+    def test_forward_push(self):
+        G = networkx.gnp_random_graph(50, 0.1, seed=1)
+        for u, v in G.edges():
+            G[u][v]['weight'] = random.random()
+        seeds = {0: 1, 3: 2}
+        personalization = dict((n, seeds.get(n, 0)) for n in G)
+        p = networkx.pagerank(G, tol=1.e-10, max_iter=1000,
+                              personalization=personalization)
+        for epsilon in (1e-2, 1e-4):
+            ap = networkx.approximate_personalized_pagerank(G, seeds,
+                                                            epsilon)
+            for n in G:
+                assert_true(0 <= p[n] - ap.get(n, 0) <=
+                            epsilon * G.degree(n, weight='weight'))
+
+    def test_forward_push_weighted(self):
+        # the bound is in the weighted degree, here far from the number
+        # of neighbors of the hub 0
+        G = networkx.star_graph(59)
+        for u, v in G.edges():
+            G[u][v]['weight'] = 0.001
+        G[0][1]['weight'] = 100
+        seeds = dict((n, 1) for n in range(2, 60))
+        personalization = dict((n, seeds.get(n, 0)) for n in G)
+        p = networkx.pagerank(G, tol=1.e-12, max_iter=1000,
+                              personalization=personalization)
+        for epsilon in (1e-2, 1e-4):
+            ap = networkx.approximate_personalized_pagerank(G, seeds,
+                                                            epsilon)
+            for n in G:
+                assert_true(-1e-12 <= p[n] - ap.get(n, 0) <=
+                            epsilon * G.degree(n, weight='weight'))
+
+    def test_dangling(self):
+        G = networkx.DiGraph([(0, 1), (1, 2), (1, 3), (3, 0)])
+        p = networkx.pagerank(G, tol=1.e-10, max_iter=1000,
+                              personalization={0: 1, 1: 0, 2: 0, 3: 0})
+        ap = networkx.approximate_personalized_pagerank(G, [0], 1e-10)
+        for n in G:
+            assert_almost_equal(p[n], ap[n], places=6)
+
+    def test_reverse_push(self):
+        G = networkx.gnp_random_graph(50, 0.1, seed=2, directed=True)
+        G.add_edges_from((n, (n + 1) % 50) for n in range(50))
+        ap = networkx.approximate_personalized_pagerank(G, [7], 1e-4,
+                                                        reverse=True)
+        for s in G:
+            p = networkx.pagerank(G, tol=1.e-10, max_iter=1000,
+                                  personalization=dict((n, int(n == s))
+                                                       for n in G))
+            assert_true(0 <= p[7] - ap.get(s, 0) <= 1e-4)
+
+    def test_local(self):
+        G = networkx.path_graph(1000)
+        ap = networkx.approximate_personalized_pagerank(G, [0], 1e-3)
+        assert_true(len(ap) < 20)
+
+    def test_bad_seeds(self):
+        G = networkx.path_graph(4)
+        assert_raises(networkx.NetworkXError,
+                      networkx.approximate_personalized_pagerank, G, [7])
+        assert_raises(networkx.NetworkXError,
+                      networkx.approximate_personalized_pagerank, G, {0: 0})
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+import random
+
+import networkx
+from nose.tools import *
+
+
+class TestPageRankTracker(object):
+
+    def check(self, tracker, G, **kwds):
+        p = tracker.pagerank()
+        q = networkx.pagerank(G, tol=1.e-12, max_iter=1000, **kwds)
+        assert_equal(set(p), set(G))
+        for n in G:
+            assert_almost_equal(p[n], q[n], places=8)
+
+    def updates(self, tracker, G, rng):
+        n = len(G)
+        for i in range(10):
+            edges = [(rng.randrange(n + 5), rng.randrange(n + 5),
+                      {'weight': rng.random()}) for j in range(4)]
+            tracker.add_edges_from(edges)
+            tracker.remove_edges_from(rng.sample(G.edges(), 3))
+
+    def test_directed(self):
+        rng = random.Random(1)
+        G = networkx.gnp_random_graph(40, 0.05, seed=1, directed=True)
+        for u, v in G.edges():
+            G[u][v]['weight'] = rng.random()
+        tracker = networkx.PageRankTracker(G, tol=1.e-12)
+        self.check(tracker, G)
+        self.updates(tracker, G, rng)
+        self.check(tracker, G)
+
+    def test_undirected(self):
+        rng = random.Random(2)
+        G = networkx.gnp_random_graph(40, 0.05, seed=2)
+        tracker = networkx.PageRankTracker(G, weight=None, tol=1.e-12)
+        self.updates(tracker, G, rng)
+        self.check(tracker, G, weight=None)
+
+    def test_personalization_dangling(self):
+        rng = random.Random(3)
+        G = networkx.gnp_random_graph(40, 0.05, seed=3, directed=True)
+        personalization = dict((n, rng.random()) for n in range(20))
+        dangling = dict((n, rng.random()) for n in range(10, 40))
+        tracker = networkx.PageRankTracker(G, personalization=personalization,
+                                           dangling=dangling, tol=1.e-12)
+        self.updates(tracker, G, rng)
+        personalization = dict((n, personalization.get(n, 0)) for n in G)
+        dangling = dict((n, dangling.get(n, 0)) for n in G)
+        self.check(tracker, G, personalization=personalization,
+                   dangling=dangling)
+
+    def test_empty(self):
+        G = networkx.DiGraph()
+        tracker = networkx.PageRankTracker(G, tol=1.e-12)
+        assert_equal(tracker.pagerank(), {})
+        tracker.add_edge(0, 1)
+        tracker.add_edge(1, 2)
+        self.check(tracker, G)
+        tracker.remove_edge(0, 1)
+        self.check(tracker, G)
+
+    def test_errors(self):
+        G = networkx.path_graph(4)
+        tracker = networkx.PageRankTracker(G)
+        assert_raises(networkx.NetworkXError, tracker.remove_edge, 0, 2)
+        assert_raises(networkx.NetworkXError, tracker.remove_edges_from,
+                      [(0, 1), (0, 3)])
+        assert_true(G.has_edge(0, 1))
+        assert_raises(networkx.NetworkXNotImplemented,
+                      networkx.PageRankTracker, networkx.MultiGraph())
@@ -76,16 +76,41 @@ def minimum_spanning_edges(G, weight='weight', data=True):
             "Mimimum spanning tree not defined for directed graphs.")
 
     subtrees = UnionFind()
-    edges = sorted(G.edges(data=True), key=lambda t: t[2].get(weight, 1))
+    if isinstance(G, nx.CSRGraph):
+        edges = _csr_edges_by_weight(G, weight)
+        edge_data = G.adj._edge_data
+    else:
+        edges = sorted(G.edges(data=True), key=lambda t: t[2].get(weight, 1))
+        edge_data = None
     for u, v, d in edges:
         if subtrees[u] != subtrees[v]:
             if data:
-                yield (u, v, d)
+                yield (u, v, d if edge_data is None else edge_data(d))
             else:
                 yield (u, v)
             subtrees.union(u, v)
 
 
+def _csr_edges_by_weight(G, weight):
+    """Return the edges (u, v, pos) of the CSRGraph G in the order of
+    sorted(G.edges(data=True)) by weight, where pos is the position of
+    the entry u->v in G.indices.
+
+    The edges are sorted on the column G.edge_columns[weight], so that
+    an edge data dict is only built for the edges in the tree.
+    """
+    import numpy as np
+    rows = G._rows()
+    # each edge once, as it comes in G.edges()
+    pos = np.flatnonzero(rows <= G.indices)
+    column = G.edge_columns.get(weight)
+    if column is not None:
+        pos = pos[np.argsort(column[pos], kind='mergesort')]
+    labels = G.node._labels
+    return [(labels[u], labels[v], p) for u, v, p in
+            zip(rows[pos].tolist(), G.indices[pos].tolist(), pos.tolist())]
+
+
 def minimum_spanning_tree(G, weight='weight'):
     """Return a minimum spanning tree or forest of an undirected
     weighted graph.
@@ -4,3 +4,5 @@ from networkx.algorithms.shortest_paths.weighted import *
 from networkx.algorithms.shortest_paths.astar import *
 from networkx.algorithms.shortest_paths.dense import *
 
+from networkx.algorithms.shortest_paths.contraction_hierarchy import *
+from networkx.algorithms.shortest_paths.parallel import *
@@ -11,12 +11,13 @@
 
 from heapq import heappush, heappop
 from itertools import count
+import random
 from networkx import NetworkXError
 import networkx as nx
 
 __author__ = "\n".join(["Salim Fadhley <salimfadhley@gmail.com>",
                         "Matteo Dell'Amico <matteodellamico@gmail.com>"])
-__all__ = ['astar_path', 'astar_path_length']
+__all__ = ['astar_path', 'astar_path_length', 'landmark_heuristic']
 
 
 def astar_path(G, source, target, heuristic=None, weight='weight'):
@@ -64,7 +65,7 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
 
     See Also
     --------
-    shortest_path, dijkstra_path
+    shortest_path, dijkstra_path, landmark_heuristic
 
     """
     if G.is_multigraph():
@@ -157,8 +158,145 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
 
     See Also
     --------
-    astar_path
+    astar_path, landmark_heuristic
 
     """
     path = astar_path(G, source, target, heuristic, weight)
     return sum(G[u][v].get(weight, 1) for u, v in zip(path[:-1], path[1:]))
+
+
+def landmark_heuristic(G, k=8, landmarks=None, weight='weight', seed=None):
+    """Return an A* heuristic based on distances to a few landmark nodes.
+
+    The shortest path lengths from (and, for directed graphs, to) each
+    landmark are computed once.  By the triangle inequality, for every
+    landmark `L` the distance from `u` to `v` is at least
+    `d(L, v) - d(L, u)` and `d(u, L) - d(v, L)`, so the largest of these
+    bounds is an admissible heuristic for astar_path() [1]_.  It needs no
+    node coordinates.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       A graph with nonnegative edge weights.
+
+    k : integer, optional (default=8)
+       Number of landmarks to select.  Ignored if landmarks is given.
+
+    landmarks : iterable of nodes, optional
+       The landmarks to use.  If None, k landmarks are selected: the
+       first at random and each following one as the node farthest from
+       the landmarks selected so far.  Nodes that no landmark reaches are
+       selected first, so each connected part of G gets a landmark.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.  Use the same
+       weight for the search.
+
+    seed : integer, optional
+       Seed for the random selection of the first landmark.
+
+    Returns
+    -------
+    heuristic : function
+       A function h(u, v) giving a lower bound on the distance from u to
+       v in G.  Its `landmarks` attribute holds the list of landmarks.
+       The bound is only valid while G is unchanged.
+
+    Examples
+    --------
+    >>> G=nx.grid_2d_graph(5,5)
+    >>> h=nx.landmark_heuristic(G,k=2,seed=1)
+    >>> len(h.landmarks)
+    2
+    >>> nx.astar_path_length(G,(0,0),(4,4),h)
+    8
+
+    Notes
+    -----
+    Computing the heuristic takes one single-source Dijkstra search per
+    landmark (two for directed graphs), so it pays off when many
+    searches are run on the same graph.
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and C. Harrelson, Computing the shortest path:
+       A* search meets graph theory. In Proceedings of the 16th ACM-SIAM
+       Symposium on Discrete Algorithms (SODA), pp. 156-165, 2005.
+
+    See Also
+    --------
+    astar_path, astar_path_length
+    """
+    length = nx.single_source_dijkstra_path_length
+    if G.is_directed():
+        # distances to a landmark are distances from it in the reversed
+        # graph; reverse a copy that shares the edge data with G
+        R = G.copy(attr='share').reverse(copy=False)
+    else:
+        R = None
+    from_landmark = []
+    to_landmark = []
+
+    def add_landmark(L):
+        from_landmark.append(length(G, L, weight=weight))
+        if R is not None:
+            to_landmark.append(length(R, L, weight=weight))
+
+    if landmarks is None:
+        landmarks = []
+        if seed is not None:
+            random.seed(seed)
+        nodes = G.nodes()
+        k = min(k, len(nodes))
+        # distance of each node to or from the nearest landmark,
+        # -1 for landmarks
+        nearest = dict.fromkeys(nodes, float('inf'))
+        while len(landmarks) < k:
+            if landmarks:
+                L = max(nearest, key=nearest.get)
+            else:
+                L = random.choice(nodes)
+            landmarks.append(L)
+            add_landmark(L)
+            for dist in [from_landmark[-1]] + to_landmark[-1:]:
+                for n, d in dist.items():
+                    if d < nearest[n]:
+                        nearest[n] = d
+            nearest[L] = -1
+    else:
+        landmarks = list(landmarks)
+        for L in landmarks:
+            add_landmark(L)
+    if R is None:
+        to_landmark = from_landmark
+    return _LandmarkHeuristic(G, landmarks, from_landmark, to_landmark)
+
+
+class _LandmarkHeuristic(object):
+    """A* heuristic from landmark distances, see landmark_heuristic()."""
+
+    def __init__(self, G, landmarks, from_landmark, to_landmark):
+        self.landmarks = landmarks
+        # per node, the distance from (to) each landmark or None
+        self._from = dict((n, tuple(dist.get(n) for dist in from_landmark))
+                          for n in G)
+        self._to = dict((n, tuple(dist.get(n) for dist in to_landmark))
+                        for n in G)
+
+    def __call__(self, u, v):
+        h = 0
+        try:
+            fu, fv = self._from[u], self._from[v]
+            tu, tv = self._to[u], self._to[v]
+        except KeyError:
+            return h
+        for a, b in zip(fu, fv):
+            # d(L, v) <= d(L, u) + d(u, v)
+            if a is not None and b is not None and b - a > h:
+                h = b - a
+        for a, b in zip(tu, tv):
+            # d(u, L) <= d(u, v) + d(v, L)
+            if a is not None and b is not None and a - b > h:
+                h = a - b
+        return h
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""Contraction hierarchies for repeated point-to-point shortest path queries.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+from heapq import heappush, heappop
+from itertools import count
+import networkx as nx
+
+__all__ = ['ContractionHierarchy']
+
+
+class ContractionHierarchy(object):
+    """Index of a weighted graph for fast shortest path queries.
+
+    The nodes of the graph are contracted one at a time in order of
+    importance.  When a node is contracted, shortcut edges are added
+    between its remaining neighbors where they are needed to preserve
+    shortest path lengths.  A query then runs a bidirectional Dijkstra
+    search that only follows edges towards more important nodes, which
+    visits far fewer nodes than a search in the original graph.
+
+    Building the index takes much longer than a single query, so it pays
+    off when many queries are answered on a graph that does not change.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       A graph or directed graph with nonnegative edge weights.  For
+       multigraphs the lightest of the parallel edges is used.
+
+    weight : string, optional (default='weight')
+       Edge data key corresponding to the edge weight.  Edges without
+       this key have weight 1.
+
+    max_settled : integer, optional (default=100)
+       Number of nodes a witness search settles before it gives up and
+       a shortcut is added.  Lower values build the index faster but
+       may add unneeded shortcuts, which make the queries slower.
+
+    Raises
+    ------
+    NetworkXError
+       If G has an edge with negative weight.
+
+    Examples
+    --------
+    >>> G=nx.grid_2d_graph(4,4)
+    >>> CH=nx.ContractionHierarchy(G)
+    >>> CH.shortest_path_length((0,0),(3,3))
+    6
+    >>> path=CH.shortest_path((0,0),(3,3))
+    >>> len(path)
+    7
+
+    The index can be stored in a graph, and so saved with the functions
+    in ``networkx.readwrite``:
+
+    >>> H=CH.to_graph()
+    >>> CH2=nx.ContractionHierarchy.from_graph(H)
+    >>> CH2.shortest_path_length((0,0),(3,3))
+    6
+
+    Notes
+    -----
+    The nodes are ordered with the edge difference heuristic (the number
+    of shortcuts added minus the number of edges removed) plus the number
+    of contracted neighbors, and the order is updated lazily [1]_.
+
+    References
+    ----------
+    .. [1] R. Geisberger, P. Sanders, D. Schultes and D. Delling,
+       Contraction hierarchies: faster and simpler hierarchical routing in
+       road networks. In Proceedings of the 7th Workshop on Experimental
+       Algorithms (WEA), pp. 319-333, 2008.
+    """
+
+    def __init__(self, G, weight='weight', max_settled=100):
+        # remaining graph as dicts of out- and in-edge weights
+        out = dict((n, {}) for n in G)
+        inn = dict((n, {}) for n in G)
+        if G.is_multigraph():
+            edges = ((u, v, min(d.get(weight, 1) for d in kd.values()))
+                     for u, v, kd in self._edges(G))
+        else:
+            edges = ((u, v, d.get(weight, 1))
+                     for u, v, d in self._edges(G))
+        for u, v, w in edges:
+            if w < 0:
+                raise nx.NetworkXError('Contraction hierarchies need '
+                                       'nonnegative edge weights.')
+            if u == v:
+                continue
+            if w < out[u].get(v, w + 1):
+                out[u][v] = w
+                inn[v][u] = w
+        self._contract(out, inn, max_settled)
+
+    @staticmethod
+    def _edges(G):
+        # every arc u->v, in both directions for undirected graphs
+        adj = G.succ if G.is_directed() else G.adj
+        for u, nbrs in adj.items():
+            for v, d in nbrs.items():
+                yield u, v, d
+
+    def _contract(self, out, inn, max_settled):
+        self._rank = rank = {}
+        self._up = up = {}  # v: [(x, weight)] for edges v->x up the order
+        self._down = down = {}  # v: [(u, weight)] for edges u->v down
+        self._via = via = {}  # (u, x): contracted node of a shortcut
+        deleted = dict.fromkeys(out, 0)
+
+        def priority(v):
+            shortcuts = self._shortcuts(out, inn, v, max_settled)
+            return (len(shortcuts) - len(out[v]) - len(inn[v]) +
+                    deleted[v], shortcuts)
+
+        c = count()
+        queue = []
+        for v in out:
+            heappush(queue, (priority(v)[0], next(c), v))
+        while queue:
+            _, _, v = heappop(queue)
+            p, shortcuts = priority(v)
+            if queue and p > queue[0][0]:
+                # lazy update: v is no longer the least important node
+                heappush(queue, (p, next(c), v))
+                continue
+            rank[v] = len(rank)
+            up[v] = list(out[v].items())
+            down[v] = list(inn[v].items())
+            for x in out[v]:
+                del inn[x][v]
+                deleted[x] += 1
+            for u in inn[v]:
+                del out[u][v]
+                deleted[u] += 1
+            del out[v], inn[v]
+            for u, x, w in shortcuts:
+                if w < out[u].get(x, w + 1):
+                    out[u][x] = w
+                    inn[x][u] = w
+                    via[u, x] = v
+
+    @staticmethod
+    def _shortcuts(out, inn, v, max_settled):
+        """Return the shortcuts (u, x, weight) needed to contract v."""
+        shortcuts = []
+        outs = out[v]
+        for u, wu in inn[v].items():
+            targets = dict((x, wu + wx) for x, wx in outs.items() if x != u)
+            if not targets:
+                continue
+            # witness search: shortest paths from u that avoid v
+            limit = max(targets.values())
+            dist = {}
+            seen = {u: 0}
+            c = count()
+            fringe = [(0, next(c), u)]
+            while fringe and len(dist) < max_settled:
+                d, _, y = heappop(fringe)
+                if y in dist:
+                    continue
+                dist[y] = d
+                if d > limit:
+                    break
+                for z, wz in out[y].items():
+                    dz = d + wz
+                    if z != v and z not in dist and dz < seen.get(z, dz + 1):
+                        seen[z] = dz
+                        heappush(fringe, (dz, next(c), z))
+            for x, w in targets.items():
+                if seen.get(x, w + 1) > w:
+                    shortcuts.append((u, x, w))
+        return shortcuts
+
+    def to_graph(self):
+        """Return the index as a directed graph.
+
+        The graph holds the edges of the original graph that are used by
+        queries and the shortcut edges.  Each node has a 'rank' attribute
+        (its position in the contraction order), each edge a 'weight'
+        attribute and each shortcut a 'via' attribute (the contracted
+        node it bypasses).
+
+        Returns
+        -------
+        H : DiGraph
+           The index, to be restored with from_graph().
+
+        See Also
+        --------
+        from_graph
+        """
+        H = nx.DiGraph()
+        for v, r in self._rank.items():
+            H.add_node(v, rank=r)
+        via = self._via
+        for v in self._rank:
+            for x, w in self._up[v]:
+                H.add_edge(v, x, weight=w)
+            for u, w in self._down[v]:
+                H.add_edge(u, v, weight=w)
+        for (u, x), v in via.items():
+            if H.has_edge(u, x):
+                H[u][x]['via'] = v
+        return H
+
+    @classmethod
+    def from_graph(cls, H):
+        """Return the contraction hierarchy stored in graph H.
+
+        Parameters
+        ----------
+        H : DiGraph
+           A graph created by to_graph(), possibly after it was written
+           and read back with the functions in ``networkx.readwrite``.
+
+        Returns
+        -------
+        CH : ContractionHierarchy
+           The index.
+
+        See Also
+        --------
+        to_graph
+        """
+        CH = cls.__new__(cls)
+        CH._rank = rank = dict((v, d['rank']) for v, d in H.nodes_iter(True))
+        CH._up = up = dict((v, []) for v in H)
+        CH._down = down = dict((v, []) for v in H)
+        CH._via = via = {}
+        for u, x, d in H.edges_iter(data=True):
+            if rank[u] < rank[x]:
+                up[u].append((x, d['weight']))
+            else:
+                down[x].append((u, d['weight']))
+            if 'via' in d:
+                via[u, x] = d['via']
+        return CH
+
+    def __len__(self):
+        return len(self._rank)
+
+    def __contains__(self, n):
+        try:
+            return n in self._rank
+        except TypeError:
+            return False
+
+    def _search(self, source, target):
+        """Bidirectional upward search; return the length, the meeting
+        node and the parents of both searches.
+        """
+        for n in (source, target):
+            if n not in self:
+                raise nx.NetworkXError('Node %s is not in the graph.' % n)
+        up = self._up
+        down = self._down
+        dists = [{}, {}]  # settled distances, forward and backward
+        seen = [{source: 0}, {target: 0}]
+        parents = [{source: None}, {target: None}]
+        c = count()
+        fringes = [[(0, next(c), source)], [(0, next(c), target)]]
+        best = None
+        meet = None
+        while fringes[0] or fringes[1]:
+            # advance the search with the smaller fringe key
+            if not fringes[1] or (fringes[0] and
+                                  fringes[0][0][0] <= fringes[1][0][0]):
+                i = 0
+            else:
+                i = 1
+            d, _, v = heappop(fringes[i])
+            if best is not None and d >= best:
+                fringes[i] = []
+                continue
+            dist = dists[i]
+            if v in dist:
+                continue
+            dist[v] = d
+            other = seen[1 - i]
+            if v in other and (best is None or d + other[v] < best):
+                best = d + other[v]
+                meet = v
+            vseen = seen[i]
+            parent = parents[i]
+            for w, vw in (up if i == 0 else down)[v]:
+                dw = d + vw
+                if w not in dist and (w not in vseen or dw < vseen[w]):
+                    vseen[w] = dw
+                    parent[w] = v
+                    heappush(fringes[i], (dw, next(c), w))
+        if best is None:
+            raise nx.NetworkXNoPath('Node %s not reachable from %s'
+                                    % (target, source))
+        return best, meet, parents
+
+    def shortest_path_length(self, source, target):
+        """Return the length of a shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+           Starting node for path
+
+        target : node
+           Ending node for path
+
+        Returns
+        -------
+        length : number
+           Shortest path length.
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between source and target.
+        """
+        return self._search(source, target)[0]
+
+    def shortest_path(self, source, target):
+        """Return a shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+           Starting node for path
+
+        target : node
+           Ending node for path
+
+        Returns
+        -------
+        path : list
+           List of nodes in a shortest path in the original graph.
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between source and target.
+        """
+        _, meet, (forward, backward) = self._search(source, target)
+        # nodes of the path in the index, from source to target
+        nodes = [meet]
+        while forward[nodes[-1]] is not None:
+            nodes.append(forward[nodes[-1]])
+        nodes.reverse()
+        while backward[nodes[-1]] is not None:
+            nodes.append(backward[nodes[-1]])
+        # replace shortcuts by the edges they bypass
+        via = self._via
+        path = [source]
+        stack = list(zip(nodes[:-1], nodes[1:]))
+        stack.reverse()
+        while stack:
+            u, x = stack.pop()
+            if (u, x) in via:
+                v = via[u, x]
+                stack.append((v, x))
+                stack.append((u, v))
+            else:
+                path.append(x)
+        return path
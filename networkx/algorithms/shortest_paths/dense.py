@@ -11,7 +11,8 @@ import networkx as nx
 __author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
 __all__ = ['floyd_warshall',
            'floyd_warshall_predecessor_and_distance',
-           'floyd_warshall_numpy']
+           'floyd_warshall_numpy',
+           'floyd_warshall_blocked']
 
 def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -51,12 +52,203 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     # nonedges are not given the value 0 as well.
     A = nx.to_numpy_matrix(G, nodelist=nodelist, multigraph_weight=min,
                               weight=weight, nonedge=np.inf)
-    n,m = A.shape
-    I = np.identity(n)
-    A[I==1] = 0 # diagonal elements should be zero
-    for i in range(n):
-        A = np.minimum(A, A[i,:] + A[:,i])
-    return A
+    A = np.asarray(A)
+    np.fill_diagonal(A, 0) # diagonal elements should be zero
+    _floyd_warshall_blocks(A, None, 256)
+    return np.asmatrix(A)
+
+
+def floyd_warshall_blocked(G, nodelist=None, weight='weight', dtype=None,
+                           block_size=256, out=None, pred_out=None):
+    """Find all-pairs shortest path lengths and predecessors using a
+    blocked Floyd's algorithm on NumPy arrays.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    weight: string, optional (default= 'weight')
+       Edge data key corresponding to the edge weight.
+
+    dtype : NumPy floating point data-type, optional (default=numpy.float64)
+       Data type of the distance matrix.  numpy.float32 halves the
+       memory at the cost of precision.
+
+    block_size : integer, optional (default=256)
+       Number of rows processed together.  See Notes.
+
+    out : string, optional
+       Name of a file to create.  If given, the distance matrix is a
+       memory-mapped NumPy array stored in this file in .npy format,
+       and only `block_size` rows of it are held in memory at a time.
+
+    pred_out : string, optional
+       Like `out`, for the predecessor matrix.
+
+    Returns
+    -------
+    predecessor, distance : NumPy arrays
+       Entry [i, j] of distance is the shortest path distance from
+       nodelist[i] to nodelist[j], inf if there is no path.  Entry
+       [i, j] of predecessor is the index in nodelist of the node before
+       nodelist[j] on that path, -9999 if i == j or if there is no path.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> pred, dist = nx.floyd_warshall_blocked(G)
+    >>> dist[0, 3]
+    3.0
+    >>> pred[0, 3]
+    2
+
+    Notes
+    ------
+    Floyd's algorithm is appropriate for finding shortest paths in
+    dense graphs or graphs with negative weights when Dijkstra's
+    algorithm fails.  This algorithm can still fail if there are
+    negative cycles.  It has running time O(n^3) with running space of
+    O(n^2).
+
+    The intermediate nodes are taken in blocks of `block_size`.  The
+    rows of the current block are updated first and kept in memory,
+    then every other block of rows is read, updated with all of them
+    and written back once.  So each row is read once per block instead
+    of once per node, which is what keeps `out` usable on graphs with
+    tens of thousands of nodes: 40000 nodes need 6.4 GB on disk with
+    float32 distances, and 6.4 GB more for the predecessors.
+
+    The path from nodelist[i] to nodelist[j] is found by following
+    pred[i, j] back to i.
+
+    See Also
+    --------
+    floyd_warshall_numpy
+    floyd_warshall_predecessor_and_distance
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "floyd_warshall_blocked() requires numpy: http://scipy.org/ ")
+    if nodelist is None:
+        nodelist = G.nodes()
+    index = dict(zip(nodelist, range(len(nodelist))))
+    n = len(index)
+    if n != len(nodelist):
+        msg = "Ambiguous ordering: `nodelist` contained duplicates."
+        raise nx.NetworkXError(msg)
+    if dtype is None:
+        dtype = np.float64
+    pred_dtype = np.int32 if n < 2 ** 31 else np.int64
+    if out is None:
+        dist = np.empty((n, n), dtype=dtype)
+    else:
+        from numpy.lib.format import open_memmap
+        dist = open_memmap(out, mode='w+', dtype=dtype, shape=(n, n))
+    if pred_out is None:
+        pred = np.empty((n, n), dtype=pred_dtype)
+    else:
+        from numpy.lib.format import open_memmap
+        pred = open_memmap(pred_out, mode='w+', dtype=pred_dtype,
+                           shape=(n, n))
+    dist.fill(np.inf)
+    pred.fill(-9999)
+
+    rows = []
+    cols = []
+    weights = []
+    undirected = not G.is_directed()
+    for u, v, d in G.edges(nodelist, data=True):
+        if v not in index or u == v:
+            continue
+        rows.append(index[u])
+        cols.append(index[v])
+        weights.append(d.get(weight, 1))
+    rows = np.array(rows, dtype=np.intp)
+    cols = np.array(cols, dtype=np.intp)
+    weights = np.array(weights, dtype=dtype)
+    if undirected:
+        rows, cols = np.r_[rows, cols], np.r_[cols, rows]
+        weights = np.r_[weights, weights]
+    # parallel edges of multigraphs keep the smallest weight
+    np.minimum.at(dist, (rows, cols), weights)
+    pred[rows, cols] = rows
+    np.fill_diagonal(dist, 0)
+
+    _floyd_warshall_blocks(dist, pred, block_size)
+    return pred, dist
+
+
+def _floyd_warshall_blocks(dist, pred, block_size):
+    """Run Floyd's algorithm in place on the distance matrix dist and,
+    unless it is None, the predecessor matrix pred.
+
+    For each block of intermediate nodes k, the rows k are relaxed
+    first, so they hold the final values for the block when the other
+    blocks of rows are relaxed with them.  Memory-mapped matrices are
+    read and written one block of rows at a time.
+    """
+    import numpy as np
+    n = dist.shape[0]
+    block_size = max(1, min(block_size, n))
+    on_disk = isinstance(dist, np.memmap) or isinstance(pred, np.memmap)
+    tmp = np.empty((block_size, n), dtype=dist.dtype)
+    mask = np.empty((block_size, n), dtype=bool)
+
+    def relax(D, P, K, PK, kstart):
+        # relax the rows D with the rows K of the intermediate nodes
+        # kstart, kstart + 1, ...
+        m = D.shape[0]
+        t = tmp[:m]
+        c = mask[:m]
+        for i in range(K.shape[0]):
+            k = kstart + i
+            col = D[:, k, None]
+            if not (col < np.inf).any():
+                continue
+            np.add(col, K[i], out=t)
+            if P is None:
+                np.minimum(D, t, out=D)
+                continue
+            np.less(t, D, out=c)
+            np.copyto(D, t, where=c)
+            np.copyto(P, PK[i], where=c)
+
+    def load(A, block):
+        if A is None:
+            return None
+        return np.array(A[block]) if on_disk else A[block]
+
+    def store(A, block, B):
+        if on_disk and A is not None:
+            A[block] = B
+
+    starts = range(0, n, block_size)
+    for kstart in starts:
+        kblock = slice(kstart, kstart + block_size)
+        K = load(dist, kblock)
+        PK = load(pred, kblock)
+        relax(K, PK, K, PK, kstart)
+        store(dist, kblock, K)
+        store(pred, kblock, PK)
+        for start in starts:
+            if start == kstart:
+                continue
+            block = slice(start, start + block_size)
+            D = load(dist, block)
+            P = load(pred, block)
+            relax(D, P, K, PK, kstart)
+            store(dist, block, D)
+            store(pred, block, P)
+    if isinstance(dist, np.memmap):
+        dist.flush()
+    if isinstance(pred, np.memmap):
+        pred.flush()
 
 def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -107,10 +299,14 @@ def floyd_warshall_predecessor_and_distance(G, weight='weight'):
             dist[v][u] = min(e_weight, dist[v][u])
             pred[v][u] = v
     for w in G:
+        dist_w = dist[w]
         for u in G:
+            dist_u = dist[u]
+            dist_uw = dist_u[w]
             for v in G:
-                if dist[u][v] > dist[u][w] + dist[w][v]:
-                    dist[u][v] = dist[u][w] + dist[w][v]
+                d = dist_uw + dist_w[v]
+                if dist_u[v] > d:
+                    dist_u[v] = d
                     pred[u][v] = pred[w][v]
     return dict(pred),dict(dist)
 
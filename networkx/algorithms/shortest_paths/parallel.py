@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+All-pairs shortest path lengths computed by a pool of processes.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from functools import partial
+import networkx as nx
+
+__all__ = ['parallel_all_pairs_path_length']
+
+
+def parallel_all_pairs_path_length(G, weight=None, cutoff=None, n_jobs=None,
+                                   chunksize=16, out=None, nodelist=None,
+                                   dtype=None):
+    """Generate the shortest path lengths from every node, computed by a
+    pool of worker processes.
+
+    The sources are split into chunks that are handed to the workers.
+    The lengths from each source are yielded as soon as its chunk is
+    done, so the dict of dicts of all lengths is never built.  With
+    `out`, each row is written to a NumPy array file on disk and only
+    that file holds all lengths.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight: string or None, optional (default=None)
+       Edge data key corresponding to the edge weight.  If None, every
+       edge has length 1 and breadth-first search is used, otherwise
+       Dijkstra's algorithm.
+
+    cutoff : integer or float, optional
+       Depth to stop the search. Only paths of length <= cutoff are returned.
+
+    n_jobs : integer, optional (default=number of CPUs)
+       Number of worker processes.  With 1 the lengths are computed in
+       this process.
+
+    chunksize : integer, optional (default=16)
+       Number of sources handed to a worker at a time.
+
+    out : string, optional
+       Name of a file to create.  If given, the lengths are stored in it
+       as an n by n NumPy array in .npy format, with row and column i
+       for nodelist[i] and inf for unreachable nodes.  The workers write
+       the rows directly to the file.  Load the file with
+       ``numpy.load(out, mmap_mode='r')``.  Requires NumPy.
+
+    nodelist : list, optional
+       The sources and, with `out`, the order of the rows and columns
+       (default: G.nodes()).
+
+    dtype : NumPy floating point data-type, optional (default=numpy.float64)
+       Data type of the array in `out`.
+
+    Returns
+    -------
+    lengths : generator
+       Generator of (source, lengths) pairs, in the order in which the
+       sources finish.  Without `out`, lengths is a dictionary of
+       shortest path lengths keyed by target.  With `out`, it is the row
+       of the memory-mapped array for the source.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> lengths = dict(nx.parallel_all_pairs_path_length(G, n_jobs=1))
+    >>> lengths[1][4]
+    3
+
+    Notes
+    -----
+    Each worker gets its own copy of G, so the memory used for the graph
+    grows with n_jobs.  The pool is shut down when the generator is
+    exhausted or closed.
+
+    See Also
+    --------
+    all_pairs_shortest_path_length, all_pairs_dijkstra_path_length
+    """
+    nodelist = G.nodes() if nodelist is None else list(nodelist)
+    if out is not None:
+        import numpy as np
+        from numpy.lib.format import open_memmap
+        if dtype is None:
+            dtype = np.float64
+        n = len(nodelist)
+        matrix = open_memmap(out, mode='w+', dtype=dtype, shape=(n, n))
+        del matrix  # flush the header, workers open the file themselves
+        row_of = dict(zip(nodelist, range(n)))
+    args = (G, weight, cutoff, nodelist, out)
+    chunks = (nodelist[i:i + chunksize]
+              for i in range(0, len(nodelist), chunksize))
+    if n_jobs == 1:
+        # the state is bound here, not kept in _worker, so that several
+        # generators can be iterated at the same time
+        run = partial(_run_chunk_with, *_worker_state(*args))
+        results = (run(chunk) for chunk in chunks)
+        pool = None
+    else:
+        from multiprocessing import Pool
+        pool = Pool(n_jobs, initializer=_init_worker, initargs=args)
+        results = pool.imap_unordered(_run_chunk, chunks)
+    try:
+        if out is None:
+            for result in results:
+                for source_lengths in result:
+                    yield source_lengths
+        else:
+            matrix = np.load(out, mmap_mode='r+')
+            for result in results:
+                for source in result:
+                    yield source, matrix[row_of[source]]
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+_worker = {}  # state of a pool worker process, set by _init_worker
+
+
+def _worker_state(G, weight, cutoff, nodelist, out):
+    """Return the arguments of _run_chunk_with before the sources."""
+    if out is None:
+        return G, weight, cutoff, None, None
+    import numpy as np
+    matrix = np.load(out, mmap_mode='r+')
+    index = dict(zip(nodelist, range(len(nodelist))))
+    return G, weight, cutoff, matrix, index
+
+
+def _init_worker(G, weight, cutoff, nodelist, out):
+    _worker['state'] = _worker_state(G, weight, cutoff, nodelist, out)
+
+
+def _run_chunk(sources):
+    return _run_chunk_with(*(_worker['state'] + (sources,)))
+
+
+def _run_chunk_with(G, weight, cutoff, matrix, index, sources):
+    if weight is None:
+        lengths = [(s, nx.single_source_shortest_path_length(G, s, cutoff))
+                   for s in sources]
+    else:
+        lengths = [(s, nx.single_source_dijkstra_path_length(G, s, cutoff,
+                                                              weight))
+                   for s in sources]
+    if matrix is None:
+        return lengths
+    import numpy as np
+    for s, dist in lengths:
+        row = matrix[index[s]]
+        row[:] = np.inf
+        cols = np.fromiter((index[v] for v in dist if v in index),
+                           dtype=np.intp)
+        vals = np.fromiter((d for v, d in dist.items() if v in index),
+                           dtype=row.dtype)
+        row[cols] = vals
+    matrix.flush()
+    return sources
@@ -135,3 +135,34 @@ class TestAStar:
         path=nx.algorithms.shortest_paths.astar.astar_path(G, node_1, node_4)
 
 
+
+    def test_landmark_heuristic(self):
+        h = nx.landmark_heuristic(self.XG, k=2, seed=1)
+        assert_equal(len(h.landmarks), 2)
+        length = nx.all_pairs_dijkstra_path_length(self.XG)
+        for u in self.XG:
+            for v in self.XG:
+                assert_true(h(u, v) <= length[u][v])
+                assert_equal(nx.astar_path_length(self.XG, u, v, h),
+                             length[u][v])
+        # the graph is not changed
+        assert_equal(self.XG.successors('s'), ['u', 'x'])
+        assert_equal(h('s', 'moon'), 0)
+
+    def test_landmark_heuristic_random_graph(self):
+        G = nx.gnm_random_graph(100, 300, seed=3)
+        for u, v in G.edges():
+            G[u][v]['cost'] = 1 + (u * v) % 7
+        G.add_edge(100, 101)  # a second component
+        h = nx.landmark_heuristic(G, k=3, weight='cost', seed=1)
+        assert_true(100 in h.landmarks or 101 in h.landmarks)
+        for v in G:
+            length = nx.single_source_dijkstra_path_length(G, v,
+                                                           weight='cost')
+            for u in length:
+                assert_true(h(u, v) <= length[u])
+        h = nx.landmark_heuristic(G, landmarks=[0, 5], weight='cost')
+        assert_equal(h.landmarks, [0, 5])
+        assert_equal(h(0, 5), nx.dijkstra_path_length(G, 0, 5, weight='cost'))
+        h = nx.landmark_heuristic(nx.path_graph(3), k=5)
+        assert_equal(sorted(h.landmarks), [0, 1, 2])
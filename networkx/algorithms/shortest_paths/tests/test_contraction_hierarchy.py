@@ -0,0 +1,81 @@
+import os
+import random
+import tempfile
+from nose.tools import *
+import networkx as nx
+
+
+class TestContractionHierarchy:
+
+    def setUp(self):
+        random.seed(42)
+        self.G = nx.gnm_random_graph(60, 200, seed=42)
+        self.D = nx.gnm_random_graph(60, 300, seed=42, directed=True)
+        for G in (self.G, self.D):
+            for u, v in G.edges():
+                G[u][v]['weight'] = random.randint(1, 10)
+
+    def check(self, G, CH):
+        for s in G:
+            length = nx.single_source_dijkstra_path_length(G, s)
+            for t in G:
+                if t not in length:
+                    assert_raises(nx.NetworkXNoPath,
+                                  CH.shortest_path_length, s, t)
+                    assert_raises(nx.NetworkXNoPath, CH.shortest_path, s, t)
+                    continue
+                assert_equal(CH.shortest_path_length(s, t), length[t])
+                path = CH.shortest_path(s, t)
+                assert_equal(path[0], s)
+                assert_equal(path[-1], t)
+                assert_equal(sum(min(d.get('weight', 1) for d in
+                                     (G[u][v].values() if G.is_multigraph()
+                                      else [G[u][v]]))
+                                 for u, v in zip(path, path[1:])),
+                             length[t])
+
+    def test_graph(self):
+        self.check(self.G, nx.ContractionHierarchy(self.G))
+
+    def test_digraph(self):
+        self.check(self.D, nx.ContractionHierarchy(self.D))
+
+    def test_multigraph(self):
+        G = nx.MultiGraph(self.G)
+        G.add_edge(0, 1, weight=0.5)
+        G.add_edge(2, 3)
+        self.check(G, nx.ContractionHierarchy(G))
+
+    def test_max_settled(self):
+        CH = nx.ContractionHierarchy(self.D, max_settled=1)
+        self.check(self.D, CH)
+
+    def test_weight(self):
+        G = nx.cycle_graph(5)
+        G[0][4]['cost'] = 10
+        CH = nx.ContractionHierarchy(G, weight='cost')
+        assert_equal(CH.shortest_path_length(0, 4), 4)
+        assert_equal(CH.shortest_path(0, 4), [0, 1, 2, 3, 4])
+        assert_equal(CH.shortest_path(2, 2), [2])
+        assert_equal(len(CH), 5)
+        assert_true(4 in CH)
+        assert_false([] in CH)
+
+    def test_serialize(self):
+        CH = nx.ContractionHierarchy(self.D)
+        fd, fname = tempfile.mkstemp()
+        try:
+            nx.write_gpickle(CH.to_graph(), fname)
+            CH2 = nx.ContractionHierarchy.from_graph(nx.read_gpickle(fname))
+        finally:
+            os.close(fd)
+            os.unlink(fname)
+        self.check(self.D, CH2)
+
+    def test_raise(self):
+        G = nx.path_graph(3)
+        G[0][1]['weight'] = -1
+        assert_raises(nx.NetworkXError, nx.ContractionHierarchy, G)
+        CH = nx.ContractionHierarchy(nx.path_graph(3))
+        assert_raises(nx.NetworkXError, CH.shortest_path, 0, 5)
+        assert_raises(nx.NetworkXError, CH.shortest_path_length, 5, 0)
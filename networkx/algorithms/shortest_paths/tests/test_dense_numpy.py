@@ -65,3 +65,64 @@ class TestFloydNumpy(object):
         dist = nx.floyd_warshall_numpy(G)
         assert_equal(int(numpy.min(dist)), -14)
 
+
+    def test_blocked(self):
+        G = nx.gnm_random_graph(30, 120, seed=3, directed=True)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = (5 * i) % 7
+        G.add_node('isolated')
+        nodelist = G.nodes()
+        pred, dist = nx.floyd_warshall_predecessor_and_distance(G)
+        D = nx.utils.dict_to_numpy_array(dist, mapping=dict(
+            zip(nodelist, range(len(nodelist)))))
+        for block_size in (1, 4, 7, 256):
+            P, A = nx.floyd_warshall_blocked(G, block_size=block_size)
+            assert_equal(A, D)
+            for i in range(len(nodelist)):
+                for j in range(len(nodelist)):
+                    if i == j or A[i, j] == numpy.inf:
+                        assert_equal(P[i, j], -9999)
+                        continue
+                    # following pred back to i gives a path of length A[i, j]
+                    length = 0
+                    v = j
+                    while v != i:
+                        u = P[i, v]
+                        length += G[nodelist[u]][nodelist[v]]['weight']
+                        v = u
+                    assert_equal(length, A[i, j])
+
+    def test_blocked_undirected_multigraph(self):
+        G = nx.MultiGraph()
+        G.add_weighted_edges_from([(0, 1, 3), (0, 1, 1), (1, 2, 1), (2, 2, 5)])
+        P, A = nx.floyd_warshall_blocked(G, nodelist=[2, 1, 0],
+                                         block_size=2)
+        assert_equal(A, [[0, 1, 2], [1, 0, 1], [2, 1, 0]])
+        assert_equal(P, [[-9999, 0, 1], [1, -9999, 1], [1, 2, -9999]])
+        assert_equal(nx.floyd_warshall_numpy(G, nodelist=[2, 1, 0]), A)
+
+    def test_blocked_float32_out(self):
+        import os
+        import shutil
+        import tempfile
+        G = nx.grid_2d_graph(5, 6)
+        expected = nx.floyd_warshall_numpy(G)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            out = os.path.join(tmpdir, 'dist.npy')
+            pred_out = os.path.join(tmpdir, 'pred.npy')
+            P, A = nx.floyd_warshall_blocked(G, dtype=numpy.float32,
+                                             block_size=4, out=out,
+                                             pred_out=pred_out)
+            assert_equal(A.dtype, numpy.float32)
+            assert_equal(A, expected)
+            del A
+            assert_equal(numpy.load(out), expected)
+            assert_equal(numpy.load(pred_out), P)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_blocked_duplicates(self):
+        G = nx.path_graph(3)
+        assert_raises(nx.NetworkXError, nx.floyd_warshall_blocked, G,
+                      nodelist=[0, 1, 1])
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+
+class TestParallelAllPairs:
+
+    def setUp(self):
+        self.G = nx.gnm_random_graph(40, 80, seed=1)
+        self.G.add_node('isolated')
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1 + (hash((u, v)) % 5)
+
+    def test_unweighted(self):
+        expected = nx.all_pairs_shortest_path_length(self.G)
+        for n_jobs in (1, 2):
+            lengths = nx.parallel_all_pairs_path_length(self.G, n_jobs=n_jobs,
+                                                        chunksize=7)
+            assert_equal(dict(lengths), expected)
+
+    def test_weighted(self):
+        expected = nx.all_pairs_dijkstra_path_length(self.G, cutoff=4)
+        lengths = nx.parallel_all_pairs_path_length(self.G, weight='weight',
+                                                    cutoff=4, n_jobs=2)
+        assert_equal(dict(lengths), expected)
+
+    def test_nodelist(self):
+        lengths = nx.parallel_all_pairs_path_length(self.G, nodelist=[0, 1],
+                                                    n_jobs=1)
+        assert_equal(sorted(s for s, d in lengths), [0, 1])
+
+    def test_close(self):
+        lengths = nx.parallel_all_pairs_path_length(self.G, n_jobs=2,
+                                                    chunksize=1)
+        source, dist = next(lengths)
+        lengths.close()
+        assert_equal(dist, nx.single_source_shortest_path_length(self.G,
+                                                                 source))
+
+    def test_interleaved(self):
+        P = nx.path_graph(40)
+        K = nx.complete_graph(40)
+        a = nx.parallel_all_pairs_path_length(P, n_jobs=1, chunksize=4)
+        b = nx.parallel_all_pairs_path_length(K, n_jobs=1, chunksize=4)
+        first = [next(a), next(b)]
+        b.close()
+        assert_equal(dict([first[0]] + list(a)),
+                     nx.all_pairs_shortest_path_length(P))
+        assert_equal(first[1][1], nx.single_source_shortest_path_length(
+            K, first[1][0]))
+
+    def test_memmap(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        expected = nx.all_pairs_dijkstra_path_length(self.G)
+        nodelist = self.G.nodes()
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tmpdir, 'lengths.npy')
+            for n_jobs in (1, 2):
+                lengths = nx.parallel_all_pairs_path_length(
+                    self.G, weight='weight', n_jobs=n_jobs, out=fname,
+                    dtype=np.float32)
+                for source, row in lengths:
+                    assert_equal(row.dtype, np.float32)
+                    assert_equal(len(row), len(nodelist))
+                M = np.load(fname, mmap_mode='r')
+                for i, u in enumerate(nodelist):
+                    for j, v in enumerate(nodelist):
+                        assert_equal(M[i, j],
+                                     expected[u].get(v, float('inf')))
+                del M, row
+        finally:
+            shutil.rmtree(tmpdir)
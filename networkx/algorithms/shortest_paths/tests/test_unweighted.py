@@ -66,6 +66,17 @@ class TestUnweightedPath:
         l=nx.all_pairs_shortest_path_length(self.grid)
         assert_equal(l[1][16],6)
 
+    def test_fastpath(self):
+        G=nx.grid_2d_graph(4,4)
+        for f in (nx.single_source_shortest_path,
+                  nx.single_source_shortest_path_length):
+            assert_equal(f(G,(1,2),fastpath=True),f(G,(1,2)))
+            assert_equal(f(G,(1,2),cutoff=2,fastpath=True),
+                         f(G,(1,2),cutoff=2))
+        for f in (nx.all_pairs_shortest_path,
+                  nx.all_pairs_shortest_path_length):
+            assert_equal(f(G,fastpath=True),f(G))
+
     def test_predecessor(self):
         G=nx.path_graph(4)
         assert_equal(nx.predecessor(G,0),{0: [], 1: [0], 2: [1], 3: [2]})
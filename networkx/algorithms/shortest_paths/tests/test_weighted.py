@@ -168,6 +168,96 @@ class TestWeightedPath:
         spl = pl(self.MXG4, 0, cutoff=2)
         assert_false(2 in spl)
 
+    def test_multi_source_dijkstra(self):
+        G = self.XG4
+        D, P = nx.multi_source_dijkstra(G, [0, 4])
+        for v in G:
+            d0 = nx.dijkstra_path_length(G, 0, v)
+            d4 = nx.dijkstra_path_length(G, 4, v)
+            assert_equal(D[v], min(d0, d4))
+            validate_path(G, P[v][0], v, D[v], P[v])
+            assert_true(P[v][0] in (0, 4))
+        assert_equal(nx.multi_source_dijkstra_path_length(G, [0, 4]), D)
+        # a single source gives the same answer as single_source_dijkstra
+        D, P = nx.multi_source_dijkstra(self.MXG, ['s'])
+        assert_equal((D, P), nx.single_source_dijkstra(self.MXG, 's'))
+        D = nx.multi_source_dijkstra_path_length(self.XG, iter(['s']),
+                                                 cutoff=8)
+        assert_equal(D, nx.single_source_dijkstra_path_length(self.XG, 's',
+                                                              cutoff=8))
+
+    def test_multi_source_dijkstra_targets(self):
+        G = nx.path_graph(10)
+        D, P = nx.multi_source_dijkstra(G, [0, 9], targets=[2, 7])
+        assert_equal((D[2], P[2]), (2, [0, 1, 2]))
+        assert_equal((D[7], P[7]), (2, [9, 8, 7]))
+        assert_false(4 in D or 5 in D)
+        D = nx.multi_source_dijkstra_path_length(G, [0], targets=[0])
+        assert_equal(D, {0: 0})
+
+    def test_multi_source_dijkstra_raise(self):
+        G = nx.path_graph(10)
+        assert_raises(ValueError, nx.multi_source_dijkstra, G, [])
+        assert_raises(nx.NetworkXError, nx.multi_source_dijkstra, G, [20])
+        assert_raises(nx.NetworkXError, nx.multi_source_dijkstra_path_length,
+                      nx.star_graph(10), [0], max_size=5)
+        D = nx.multi_source_dijkstra_path_length(nx.star_graph(10), [1],
+                                                 max_size=10)
+        assert_equal(len(D), 11)
+
+    def test_dijkstra_fastpath(self):
+        XG = self.XG
+        for f in (nx.single_source_dijkstra_path,
+                  nx.single_source_dijkstra_path_length):
+            assert_equal(f(XG, 's', fastpath=True), f(XG, 's'))
+        for f in (nx.all_pairs_dijkstra_path,
+                  nx.all_pairs_dijkstra_path_length):
+            assert_equal(f(self.MXG4, fastpath=True), f(self.MXG4))
+
+    def test_dijkstra_methods(self):
+        G = nx.grid_2d_graph(6, 6)
+        for i, (u, v) in enumerate(sorted(G.edges())):
+            G[u][v]['weight'] = (7 * i) % 11
+        G.add_edge((0, 0), (5, 5), weight=2 ** 70)
+        for method in ('dial', 'radix'):
+            for H in (G, self.XG, self.MXG4, self.G):
+                for s in H:
+                    D, P = nx.single_source_dijkstra(H, s, method=method)
+                    assert_equal(D, nx.single_source_dijkstra_path_length(H, s))
+                    for v in H:
+                        if v in D:
+                            validate_path(H, s, v, D[v], P[v])
+            D, P = nx.single_source_dijkstra(self.XG, 's', 'v', method=method)
+            validate_length_path(self.XG, 's', 'v', 9, D['v'], P['v'])
+            D = nx.single_source_dijkstra_path_length(self.XG, 's', cutoff=8,
+                                                      method=method)
+            assert_equal(D, nx.single_source_dijkstra_path_length(self.XG, 's',
+                                                                  cutoff=8))
+            D = nx.all_pairs_dijkstra_path_length(self.XG3, method=method,
+                                                  fastpath=True)
+            assert_equal(D, nx.all_pairs_dijkstra_path_length(self.XG3))
+
+    def test_dijkstra_methods_float_weights(self):
+        G = nx.grid_2d_graph(4, 4)
+        for i, (u, v) in enumerate(sorted(G.edges())):
+            G[u][v]['weight'] = float((7 * i) % 11)
+        D = nx.single_source_dijkstra_path_length(G, (0, 0))
+        for H in (G, nx.CSRGraph(G)):
+            for method in ('dial', 'radix'):
+                assert_equal(nx.single_source_dijkstra_path_length(
+                    H, (0, 0), method=method), D)
+
+    def test_dijkstra_methods_raise(self):
+        G = nx.path_graph(3)
+        f = nx.single_source_dijkstra
+        assert_raises(nx.NetworkXError, f, G, 0, method='fibonacci')
+        G[1][2]['weight'] = 1.5
+        assert_raises(nx.NetworkXError, f, G, 0, method='dial')
+        G[1][2]['weight'] = float('inf')
+        assert_raises(nx.NetworkXError, f, G, 0, method='radix')
+        G[1][2]['weight'] = -1
+        assert_raises(nx.NetworkXError, f, G, 0, method='radix')
+
     def test_bidirectional_dijkstra_multigraph(self):
         G = nx.MultiGraph()
         G.add_edge('a', 'b', weight=10)
@@ -19,8 +19,10 @@ __all__ = ['bidirectional_shortest_path',
 
 
 import networkx as nx
+from networkx.utils import integer_fastpath
 
-def single_source_shortest_path_length(G,source,cutoff=None):
+@integer_fastpath('node_dict', 'source')
+def single_source_shortest_path_length(G,source,cutoff=None, fastpath=False):
     """Compute the shortest path lengths from source to all reachable nodes.
 
     Parameters
@@ -33,6 +35,9 @@ def single_source_shortest_path_length(G,source,cutoff=None):
     cutoff : integer, optional
         Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     lengths : dictionary
@@ -66,7 +71,8 @@ def single_source_shortest_path_length(G,source,cutoff=None):
     return seen  # return all path lengths as dictionary
 
 
-def all_pairs_shortest_path_length(G, cutoff=None):
+@integer_fastpath('node_dict_of_dicts')
+def all_pairs_shortest_path_length(G, cutoff=None, fastpath=False):
     """Computes the shortest path lengths between all nodes in ``G``.
 
     Parameters
@@ -77,6 +83,9 @@ def all_pairs_shortest_path_length(G, cutoff=None):
         Depth at which to stop the search. Only paths of length at most
         ``cutoff`` are returned.
 
+    fastpath : bool, optional (default=False)
+        If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     lengths : dictionary
@@ -201,7 +210,8 @@ def _bidirectional_pred_succ(G, source, target):
     raise nx.NetworkXNoPath("No path between %s and %s." % (source, target))
 
 
-def single_source_shortest_path(G,source,cutoff=None):
+@integer_fastpath('path_dict', 'source')
+def single_source_shortest_path(G,source,cutoff=None, fastpath=False):
     """Compute shortest path between source
     and all other nodes reachable from source.
 
@@ -215,6 +225,9 @@ def single_source_shortest_path(G,source,cutoff=None):
     cutoff : integer, optional
         Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     lengths : dictionary
@@ -256,7 +269,8 @@ def single_source_shortest_path(G,source,cutoff=None):
     return paths
 
 
-def all_pairs_shortest_path(G, cutoff=None):
+@integer_fastpath('path_dict_of_dicts')
+def all_pairs_shortest_path(G, cutoff=None, fastpath=False):
     """Compute shortest paths between all nodes.
 
     Parameters
@@ -267,6 +281,9 @@ def all_pairs_shortest_path(G, cutoff=None):
         Depth at which to stop the search. Only paths of length at most
         ``cutoff`` are returned.
 
+    fastpath : bool, optional (default=False)
+        If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     lengths : dictionary
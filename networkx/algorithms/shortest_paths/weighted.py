@@ -18,6 +18,8 @@ __all__ = ['dijkstra_path',
            'single_source_dijkstra',
            'single_source_dijkstra_path',
            'single_source_dijkstra_path_length',
+           'multi_source_dijkstra',
+           'multi_source_dijkstra_path_length',
            'all_pairs_dijkstra_path',
            'all_pairs_dijkstra_path_length',
            'dijkstra_predecessor_and_distance',
@@ -29,9 +31,10 @@ __all__ = ['dijkstra_path',
 from collections import deque
 from heapq import heappush, heappop
 from itertools import count
+from operator import index as _index
 import uuid
 import networkx as nx
-from networkx.utils import generate_unique_node
+from networkx.utils import generate_unique_node, integer_fastpath
 
 
 def dijkstra_path(G, source, target, weight='weight'):
@@ -134,7 +137,9 @@ def dijkstra_path_length(G, source, target, weight='weight'):
             "node %s not reachable from %s" % (source, target))
 
 
-def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
+@integer_fastpath('path_dict', 'source')
+def single_source_dijkstra_path(G, source, cutoff=None, weight='weight',
+                                fastpath=False):
     """Compute shortest path between source and all other reachable
     nodes for a weighted graph.
 
@@ -151,6 +156,9 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     paths : dictionary
@@ -178,8 +186,10 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
     return path
 
 
+@integer_fastpath('node_dict', 'source')
 def single_source_dijkstra_path_length(G, source, cutoff=None,
-                                       weight='weight'):
+                                       weight='weight', fastpath=False,
+                                       method='heap'):
     """Compute the shortest path length between source and all other
     reachable nodes for a weighted graph.
 
@@ -196,6 +206,15 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
+    method : string, optional (default='heap')
+       Priority queue that holds the search frontier: 'heap' for a
+       binary heap, 'dial' for a bucket queue (Dial's algorithm) or
+       'radix' for a radix heap.  'dial' and 'radix' need nonnegative
+       integer edge weights.  See Notes of single_source_dijkstra().
+
     Returns
     -------
     length : dictionary
@@ -220,45 +239,12 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
     single_source_dijkstra()
 
     """
-    push = heappush
-    pop = heappop
-    dist = {}  # dictionary of final distances
-    seen = {source: 0}
-    c = count()
-    fringe = []  # use heapq with (distance,label) tuples
-    push(fringe, (0, next(c), source))
-    while fringe:
-        (d, _, v) = pop(fringe)
-        if v in dist:
-            continue  # already searched this node.
-        dist[v] = d
-        # for ignore,w,edgedata in G.edges_iter(v,data=True):
-        # is about 30% slower than the following
-        if G.is_multigraph():
-            edata = []
-            for w, keydata in G[v].items():
-                minweight = min((dd.get(weight, 1)
-                                 for k, dd in keydata.items()))
-                edata.append((w, {weight: minweight}))
-        else:
-            edata = iter(G[v].items())
-
-        for w, edgedata in edata:
-            vw_dist = dist[v] + edgedata.get(weight, 1)
-            if cutoff is not None:
-                if vw_dist > cutoff:
-                    continue
-            if w in dist:
-                if vw_dist < dist[w]:
-                    raise ValueError('Contradictory paths found:',
-                                     'negative weights?')
-            elif w not in seen or vw_dist < seen[w]:
-                seen[w] = vw_dist
-                push(fringe, (vw_dist, next(c), w))
-    return dist
+    return _dijkstra_multisource(G, [source], weight, cutoff=cutoff,
+                                 method=method)
 
 
-def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight'):
+def single_source_dijkstra(G, source, target=None, cutoff=None,
+                           weight='weight', method='heap'):
     """Compute shortest paths and lengths in a weighted graph G.
 
     Uses Dijkstra's algorithm for shortest paths.
@@ -276,6 +262,15 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    method : string, optional (default='heap')
+       Priority queue that holds the search frontier: 'heap' for a
+       binary heap, 'dial' for a bucket queue (Dial's algorithm) or
+       'radix' for a radix heap.  'dial' and 'radix' need nonnegative
+       integer edge weights, which may be floats such as 2.0.
+
     Returns
     -------
     distance,path : dictionaries
@@ -307,6 +302,14 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
     are negative or are floating point numbers
     (overflows and roundoff errors can cause problems).
 
+    With small integer weights, such as latencies in milliseconds,
+    the bucket queue of method='dial' is usually the fastest; it skips
+    over empty buckets, so its running time grows with the largest
+    weight.  The radix heap of method='radix' does not depend on the
+    size of the weights.  Neither is faster than the binary heap
+    for large weights.  Among paths of the same length, the methods can
+    return different paths.
+
     See Also
     --------
     single_source_dijkstra_path()
@@ -314,24 +317,207 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
     """
     if source == target:
         return ({source: 0}, {source: [source]})
+    targets = None if target is None else [target]
+    paths = {source: [source]}  # dictionary of paths
+    dist = _dijkstra_multisource(G, [source], weight, paths=paths,
+                                 cutoff=cutoff, targets=targets,
+                                 method=method)
+    return (dist, paths)
+
+
+def multi_source_dijkstra(G, sources, targets=None, cutoff=None,
+                          weight='weight', max_size=None):
+    """Compute shortest paths and lengths from the nearest of several
+    sources in a weighted graph G.
+
+    A single search is started from all sources at once, so every node
+    is reached from its nearest source.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty iterable of nodes
+       Starting nodes for paths.
+
+    targets : iterable of nodes, optional
+       Stop the search as soon as the shortest paths to all of these
+       nodes are known.
+
+    cutoff : integer or float, optional
+       Depth to stop the search. Only paths of length <= cutoff are returned.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    max_size : integer, optional
+       Maximum number of entries in the heap that holds the search
+       frontier.  If the search needs more, a NetworkXError is raised.
+       Use it with targets or cutoff to bound the memory used by
+       a search.
+
+    Returns
+    -------
+    distance,path : dictionaries
+       Returns a tuple of two dictionaries keyed by node.
+       The first dictionary stores distance from the nearest source.
+       The second stores the path from the nearest source to that node.
+
+    Raises
+    ------
+    ValueError
+       If sources is empty.
+
+    NetworkXError
+       If a source is not in G or the frontier grows beyond max_size.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(5)
+    >>> length,path=nx.multi_source_dijkstra(G,[0,4])
+    >>> sorted(length.items())
+    [(0, 0), (1, 1), (2, 2), (3, 1), (4, 0)]
+    >>> path[3]
+    [4, 3]
+    >>> length,path=nx.multi_source_dijkstra(G,[0,4],targets=[1])
+    >>> path[1]
+    [0, 1]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    With targets, the path dictionary can also hold paths to nodes
+    that were reached but not settled when the search stopped; those
+    paths are not necessarily shortest.
+
+    See Also
+    --------
+    multi_source_dijkstra_path_length()
+    single_source_dijkstra()
+    """
+    sources = _check_sources(G, sources)
+    paths = dict((source, [source]) for source in sources)
+    dist = _dijkstra_multisource(G, sources, weight, paths=paths,
+                                 cutoff=cutoff, targets=targets,
+                                 max_size=max_size)
+    return (dist, paths)
+
+
+def multi_source_dijkstra_path_length(G, sources, targets=None, cutoff=None,
+                                      weight='weight', max_size=None):
+    """Compute the shortest path length from the nearest of several
+    sources to all other reachable nodes for a weighted graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty iterable of nodes
+       Starting nodes for paths.
+
+    targets : iterable of nodes, optional
+       Stop the search as soon as the distances to all of these
+       nodes are known.
+
+    cutoff : integer or float, optional
+       Depth to stop the search. Only paths of length <= cutoff are returned.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    max_size : integer, optional
+       Maximum number of entries in the heap that holds the search
+       frontier.  If the search needs more, a NetworkXError is raised.
+
+    Returns
+    -------
+    length : dictionary
+       Dictionary of shortest lengths from the nearest source keyed by
+       target.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(5)
+    >>> length=nx.multi_source_dijkstra_path_length(G,[0,4])
+    >>> sorted(length.items())
+    [(0, 0), (1, 1), (2, 2), (3, 1), (4, 0)]
+    >>> length=nx.multi_source_dijkstra_path_length(G,[0,4],targets=[4,1])
+    >>> length[1]
+    1
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    See Also
+    --------
+    multi_source_dijkstra()
+    single_source_dijkstra_path_length()
+    """
+    sources = _check_sources(G, sources)
+    return _dijkstra_multisource(G, sources, weight, cutoff=cutoff,
+                                 targets=targets, max_size=max_size)
+
+
+def _check_sources(G, sources):
+    sources = list(sources)
+    if not sources:
+        raise ValueError('sources must not be empty')
+    for source in sources:
+        if source not in G:
+            raise nx.NetworkXError("Node %s is not in the graph." % source)
+    return sources
+
+
+def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
+                          cutoff=None, targets=None, max_size=None,
+                          method='heap'):
+    """Dijkstra's algorithm from one or more sources.
+
+    Returns the dictionary of distances from the nearest source.  If
+    pred (or paths) is a dictionary, it is updated with the
+    predecessors of (or the paths to) the nodes that are reached.  The
+    search stops once all nodes in targets are settled.  The fringe is
+    kept in a binary heap unless method is 'dial' or 'radix'.
+    """
+    if method != 'heap':
+        try:
+            queue = _monotone_queues[method]
+        except KeyError:
+            raise nx.NetworkXError("unknown method '%s'." % method)
+        return _dijkstra_monotone(G, sources, weight, queue(), pred, paths,
+                                  cutoff, targets, max_size, method)
+    if isinstance(G, nx.CSRGraph):
+        return _dijkstra_csr(G, sources, weight, pred, paths, cutoff,
+                             targets, max_size)
     push = heappush
     pop = heappop
     dist = {}  # dictionary of final distances
-    paths = {source: [source]}  # dictionary of paths
-    seen = {source: 0}
+    seen = {}  # tentative distances of the nodes in the fringe
     c = count()
     fringe = []  # use heapq with (distance,label) tuples
-    push(fringe, (0, next(c), source))
+    for source in sources:
+        if source not in seen:
+            seen[source] = 0
+            push(fringe, (0, next(c), source))
+    remaining = None if targets is None else set(targets)
+    multigraph = G.is_multigraph()
     while fringe:
         (d, _, v) = pop(fringe)
         if v in dist:
             continue  # already searched this node.
         dist[v] = d
-        if v == target:
-            break
+        del seen[v]
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
         # for ignore,w,edgedata in G.edges_iter(v,data=True):
         # is about 30% slower than the following
-        if G.is_multigraph():
+        if multigraph:
             edata = []
             for w, keydata in G[v].items():
                 minweight = min((dd.get(weight, 1)
@@ -341,7 +527,7 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
             edata = iter(G[v].items())
 
         for w, edgedata in edata:
-            vw_dist = dist[v] + edgedata.get(weight, 1)
+            vw_dist = d + edgedata.get(weight, 1)
             if cutoff is not None:
                 if vw_dist > cutoff:
                     continue
@@ -352,8 +538,249 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
             elif w not in seen or vw_dist < seen[w]:
                 seen[w] = vw_dist
                 push(fringe, (vw_dist, next(c), w))
-                paths[w] = paths[v] + [w]
-    return (dist, paths)
+                if paths is not None:
+                    paths[w] = paths[v] + [w]
+                if pred is not None:
+                    pred[w] = [v]
+            elif vw_dist == seen[w]:
+                if pred is not None:
+                    pred[w].append(v)
+        if max_size is not None and len(fringe) > max_size:
+            raise nx.NetworkXError('Search frontier exceeded max_size=%s.'
+                                   % max_size)
+    return dist
+
+
+def _dijkstra_csr(G, sources, weight, pred, paths, cutoff, targets,
+                  max_size):
+    """_dijkstra_multisource for a CSRGraph or a CSRDiGraph G.
+
+    The search runs on the node indices of G.  The neighbors and the
+    edge weights of a node are read from slices of G.indices and of the
+    column G.edge_columns[weight], instead of from the edge data dicts
+    that G[v].items() builds for every edge.
+    """
+    labels = G.node._labels
+    index = G.node._index
+    indptr = G.indptr
+    indices = G.indices
+    column = G.edge_columns.get(weight)
+    push = heappush
+    pop = heappop
+    dist = {}  # dictionary of final distances, keyed by node index
+    seen = {}  # tentative distances of the nodes in the fringe
+    c = count()
+    fringe = []  # use heapq with (distance,index) tuples
+    for source in sources:
+        i = index[source]
+        if i not in seen:
+            seen[i] = 0
+            push(fringe, (0, next(c), i))
+    # targets not in G are never settled, as in _dijkstra_multisource
+    remaining = None if targets is None else set(index.get(t, -1)
+                                                 for t in targets)
+    while fringe:
+        (d, _, v) = pop(fringe)
+        if v in dist:
+            continue  # already searched this node.
+        dist[v] = d
+        del seen[v]
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
+        start, stop = indptr[v], indptr[v + 1]
+        nbrs = indices[start:stop].tolist()
+        if column is None:
+            weights = [1] * len(nbrs)
+        else:
+            weights = column[start:stop].tolist()
+        for w, vw in zip(nbrs, weights):
+            vw_dist = d + vw
+            if cutoff is not None:
+                if vw_dist > cutoff:
+                    continue
+            if w in dist:
+                if vw_dist < dist[w]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif w not in seen or vw_dist < seen[w]:
+                seen[w] = vw_dist
+                push(fringe, (vw_dist, next(c), w))
+                if paths is not None:
+                    paths[labels[w]] = paths[labels[v]] + [labels[w]]
+                if pred is not None:
+                    pred[labels[w]] = [labels[v]]
+            elif vw_dist == seen[w]:
+                if pred is not None:
+                    pred[labels[w]].append(labels[v])
+        if max_size is not None and len(fringe) > max_size:
+            raise nx.NetworkXError('Search frontier exceeded max_size=%s.'
+                                   % max_size)
+    return dict((labels[v], d) for v, d in dist.items())
+
+
+def _dial_queue():
+    """Return a bucket queue (Dial's algorithm) as a push function and
+    a generator of the popped (distance, node) pairs.
+
+    There is one list of nodes for every pending distance.  pop()
+    scans the distances upwards from the last one popped, so with edge
+    weights of at most C it skips at most C empty buckets per node.
+    After more empty buckets than there are pending ones, it jumps to
+    the smallest pending distance instead.
+    """
+    buckets = {}
+
+    def push(d, v):
+        try:
+            buckets[d].append(v)
+        except KeyError:
+            buckets[d] = [v]
+
+    def pop():
+        d = 0
+        skipped = 0
+        while buckets:
+            bucket = buckets.pop(d, None)
+            if bucket is None:
+                skipped += 1
+                if skipped > len(buckets):
+                    d = min(buckets)
+                    skipped = 0
+                else:
+                    d += 1
+                continue
+            skipped = 0
+            # edges of weight 0 add a new bucket for d, popped next
+            while bucket:
+                yield d, bucket.pop()
+
+    return push, pop()
+
+
+def _radix_queue():
+    """Return a radix heap as a push function and a generator of the
+    popped (distance, node) pairs.
+
+    An entry with distance d is kept in bucket i, where i is the number
+    of bits of d XOR the last distance popped.  When bucket 0 is empty,
+    the lowest nonempty bucket is split into the buckets below it, so
+    every entry moves down at most once per bit.
+    """
+    buckets = [[] for i in range(65)]
+    last = [0]
+
+    def push(d, v):
+        i = (d ^ last[0]).bit_length()
+        try:
+            buckets[i].append((d, v))
+        except IndexError:
+            buckets.extend([] for j in range(len(buckets), i + 1))
+            buckets[i].append((d, v))
+
+    def pop():
+        low = buckets[0]
+        while True:
+            while low:
+                yield low.pop()
+            for i in range(1, len(buckets)):
+                if buckets[i]:
+                    break
+            else:
+                return
+            bucket = buckets[i]
+            buckets[i] = []
+            last[0] = m = min(d for d, v in bucket)
+            for d, v in bucket:
+                buckets[(d ^ m).bit_length()].append((d, v))
+
+    return push, pop()
+
+
+_monotone_queues = {'dial': _dial_queue, 'radix': _radix_queue}
+
+
+def _dijkstra_monotone(G, sources, weight, queue, pred, paths, cutoff,
+                       targets, max_size, method):
+    """Dijkstra's algorithm with a monotone integer priority queue.
+
+    Same as _dijkstra_multisource but the fringe is kept in the
+    (push, pop) pair of queue, which needs nonnegative integer weights.
+    Weights that are floats with an integer value are converted to int.
+    """
+    push, pop = queue
+    dist = {}  # dictionary of final distances
+    seen = {}  # tentative distances of the nodes in the fringe
+    for source in sources:
+        if source not in seen:
+            seen[source] = 0
+            push(0, source)
+    size = len(seen)  # number of entries in the queue
+    remaining = None if targets is None else set(targets)
+    multigraph = G.is_multigraph()
+    for d, v in pop:
+        size -= 1
+        if v in dist:
+            continue  # already searched this node.
+        dist[v] = d
+        del seen[v]
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
+        if multigraph:
+            edata = []
+            for w, keydata in G[v].items():
+                minweight = min((dd.get(weight, 1)
+                                 for k, dd in keydata.items()))
+                edata.append((w, {weight: minweight}))
+        else:
+            edata = iter(G[v].items())
+
+        for w, edgedata in edata:
+            vw = edgedata.get(weight, 1)
+            if vw.__class__ is not int:
+                vw = _integer_weight(vw)
+            if vw < 0:
+                raise nx.NetworkXError("method '%s' needs nonnegative integer"
+                                       " edge weights." % method)
+            vw_dist = d + vw
+            if cutoff is not None:
+                if vw_dist > cutoff:
+                    continue
+            if w in dist:
+                continue
+            elif w not in seen or vw_dist < seen[w]:
+                seen[w] = vw_dist
+                push(vw_dist, w)
+                size += 1
+                if paths is not None:
+                    paths[w] = paths[v] + [w]
+                if pred is not None:
+                    pred[w] = [v]
+            elif vw_dist == seen[w]:
+                if pred is not None:
+                    pred[w].append(v)
+        if max_size is not None and size > max_size:
+            raise nx.NetworkXError('Search frontier exceeded max_size=%s.'
+                                   % max_size)
+    return dist
+
+
+def _integer_weight(w):
+    """Return the weight w as an int if it is an integer, such as 2 or
+    2.0 (the weights of a CSRGraph are floats), and -1 otherwise."""
+    try:
+        return _index(w)
+    except TypeError:
+        pass
+    try:
+        if w == int(w):
+            return int(w)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return -1
 
 
 def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
@@ -387,46 +814,15 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
     The list of predecessors contains more than one element only when
     there are more than one shortest paths to the key node.
     """
-    push = heappush
-    pop = heappop
-    dist = {}  # dictionary of final distances
     pred = {source: []}  # dictionary of predecessors
-    seen = {source: 0}
-    c = count()
-    fringe = []  # use heapq with (distance,label) tuples
-    push(fringe, (0, next(c), source))
-    while fringe:
-        (d, _, v) = pop(fringe)
-        if v in dist:
-            continue  # already searched this node.
-        dist[v] = d
-        if G.is_multigraph():
-            edata = []
-            for w, keydata in G[v].items():
-                minweight = min((dd.get(weight, 1)
-                                 for k, dd in keydata.items()))
-                edata.append((w, {weight: minweight}))
-        else:
-            edata = iter(G[v].items())
-        for w, edgedata in edata:
-            vw_dist = dist[v] + edgedata.get(weight, 1)
-            if cutoff is not None:
-                if vw_dist > cutoff:
-                    continue
-            if w in dist:
-                if vw_dist < dist[w]:
-                    raise ValueError('Contradictory paths found:',
-                                     'negative weights?')
-            elif w not in seen or vw_dist < seen[w]:
-                seen[w] = vw_dist
-                push(fringe, (vw_dist, next(c), w))
-                pred[w] = [v]
-            elif vw_dist == seen[w]:
-                pred[w].append(v)
+    dist = _dijkstra_multisource(G, [source], weight, pred=pred,
+                                 cutoff=cutoff)
     return (pred, dist)
 
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
+@integer_fastpath('node_dict_of_dicts')
+def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight',
+                                   fastpath=False, method='heap'):
     """ Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -439,6 +835,15 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
+    method : string, optional (default='heap')
+       Priority queue that holds the search frontier: 'heap' for a
+       binary heap, 'dial' for a bucket queue (Dial's algorithm) or
+       'radix' for a radix heap.  'dial' and 'radix' need nonnegative
+       integer edge weights.  See Notes of single_source_dijkstra().
+
     Returns
     -------
     distance : dictionary
@@ -462,10 +867,13 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
     """
     length = single_source_dijkstra_path_length
     # TODO This can be trivially parallelized.
-    return {n: length(G, n, cutoff=cutoff, weight=weight) for n in G}
+    return {n: length(G, n, cutoff=cutoff, weight=weight, method=method)
+            for n in G}
 
 
-def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
+@integer_fastpath('path_dict_of_dicts')
+def all_pairs_dijkstra_path(G, cutoff=None, weight='weight',
+                            fastpath=False):
     """ Compute shortest paths between all nodes in a weighted graph.
 
     Parameters
@@ -478,6 +886,9 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     distance : dictionary
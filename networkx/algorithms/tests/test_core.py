@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 class TestCore:
@@ -72,6 +73,15 @@ class TestCore:
         k_core_subgraph=nx.k_core(self.H,k=2)
         assert_equal(sorted(k_core_subgraph.nodes()),[2,4,5,6])
 
+    def test_k_core_view(self):
+        k_core_view=nx.k_core(self.H,k=2,copy=False)
+        assert_true(nx.is_frozen(k_core_view))
+        assert_equal(sorted(k_core_view.nodes()),[2,4,5,6])
+        assert_equal(sorted(k_core_view.edges()),
+                     sorted(nx.k_core(self.H,k=2).edges()))
+        k_shell_view=nx.k_shell(self.H,k=1,copy=False)
+        assert_equal(sorted(k_shell_view.nodes()),[1,3])
+
     def test_main_crust(self):
         main_crust_subgraph=nx.k_crust(self.H)
         assert_equal(sorted(main_crust_subgraph.nodes()),[0,1,3])
@@ -112,3 +122,60 @@ class TestCore:
         # k=2
         k_corona_subgraph=nx.k_corona(self.H,k=0)
         assert_equal(sorted(k_corona_subgraph.nodes()),[0])
+
+    def test_peeling(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        for G in (self.G, self.H, nx.Graph()):
+            assert_equal(nx.core_number(G, method='peeling'),
+                         nx.core_number(G))
+
+    def test_weighted(self):
+        G = self.G.copy()
+        for u, v in G.edges():
+            G[u][v]['weight'] = 2
+        cores = nx.core_number(self.G)
+        for method in ('bz', 'peeling'):
+            weighted = nx.core_number(G, weight='weight', method=method)
+            assert_equal(weighted, dict((v, 2 * c) for v, c in cores.items()))
+        # the triangle is in the 4-core and the heavy edge between 3 and
+        # 4 in the 5-core
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 2), (1, 2, 2), (2, 0, 2),
+                                   (2, 3, 1), (3, 4, 5)])
+        for method in ('bz', 'peeling'):
+            assert_equal(nx.core_number(G, weight='weight', method=method),
+                         {0: 4, 1: 4, 2: 4, 3: 5, 4: 5})
+
+    def test_directed(self):
+        # 0 and 1 point to each other and to 2, 2 points to 3
+        G = nx.DiGraph([(0, 1), (1, 0), (0, 2), (1, 2), (2, 3)])
+        for method in ('bz', 'peeling'):
+            assert_equal(nx.core_number(G, direction='in', method=method),
+                         {0: 1, 1: 1, 2: 1, 3: 1})
+            assert_equal(nx.core_number(G, direction='out', method=method),
+                         {0: 1, 1: 1, 2: 0, 3: 0})
+            assert_equal(nx.core_number(G, method=method),
+                         {0: 2, 1: 2, 2: 2, 3: 1})
+
+    def test_csrgraph(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        H = nx.CSRGraph(self.H)
+        assert_equal(nx.core_number(H), nx.core_number(self.H))
+        cores = H._cache[('core_number', None, None)]
+        assert_equal(sorted(nx.k_core(H).nodes()), [2, 4, 5, 6])
+        assert_true(H._cache[('core_number', None, None)] is cores)
+        G = nx.DiGraph([(0, 1), (1, 0), (0, 2), (1, 2), (2, 3)])
+        for direction in ('in', 'out', 'in+out'):
+            assert_equal(nx.core_number(nx.CSRDiGraph(G), direction=direction),
+                         nx.core_number(G, direction=direction))
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXError, nx.core_number, self.H, method='x')
+        assert_raises(nx.NetworkXError, nx.core_number, self.H,
+                      direction='x')
@@ -6,11 +6,13 @@ Breadth-first search
 Basic algorithms for breadth-first searching the nodes of a graph.
 """
 import networkx as nx
+from networkx.utils import integer_fastpath
 from collections import defaultdict, deque
 __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>'])
 __all__ = ['bfs_edges', 'bfs_tree', 'bfs_predecessors', 'bfs_successors']
 
-def bfs_edges(G, source, reverse=False):
+@integer_fastpath('edge_iter', 'source')
+def bfs_edges(G, source, reverse=False, fastpath=False):
     """Produce edges in a breadth-first-search starting at source.
 
     Parameters
@@ -24,6 +26,9 @@ def bfs_edges(G, source, reverse=False):
     reverse : bool, optional
        If True traverse a directed graph in the reverse direction
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     edges: generator
@@ -9,6 +9,7 @@ Based on http://www.ics.uci.edu/~eppstein/PADS/DFS.py
 by D. Eppstein, July 2004.
 """
 import networkx as nx
+from networkx.utils import integer_fastpath
 from collections import defaultdict
 __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>'])
 __all__ = ['dfs_edges', 'dfs_tree',
@@ -16,7 +17,8 @@ __all__ = ['dfs_edges', 'dfs_tree',
            'dfs_preorder_nodes','dfs_postorder_nodes',
            'dfs_labeled_edges']
 
-def dfs_edges(G, source=None):
+@integer_fastpath('edge_iter', 'source')
+def dfs_edges(G, source=None, fastpath=False):
     """Produce edges in a depth-first-search (DFS).
 
     Parameters
@@ -27,6 +29,9 @@ def dfs_edges(G, source=None):
        Specify starting node for depth-first search and return edges in
        the component reachable from source.
 
+    fastpath : bool, optional (default=False)
+       If True, run on integer node labels, see integer_fastpath.
+
     Returns
     -------
     edges: generator
@@ -27,6 +27,11 @@ class TestBFS:
         edges=nx.bfs_edges(self.G,source=0)
         assert_equal(list(edges),[(0, 1), (1, 2), (1, 3), (2, 4)])
 
+    def test_bfs_edges_fastpath(self):
+        G=nx.relabel_nodes(self.G,lambda n: str(n))
+        edges=nx.bfs_edges(G,source='0',fastpath=True)
+        assert_equal(list(edges),[('0','1'),('1','2'),('1','3'),('2','4')])
+
     def test_bfs_tree_isolates(self):
         G = nx.Graph()
         G.add_node(1)
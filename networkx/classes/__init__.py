@@ -5,3 +5,5 @@ from .multidigraph import MultiDiGraph
 from .ordered import *
 
 from .function import *
+from .csrgraph import *
+from .subgraphview import *
@@ -0,0 +1,825 @@
+"""Compact read-only graph classes stored as compressed sparse rows.
+
+CSRGraph and CSRDiGraph keep the structure of a graph in three NumPy
+arrays (row offsets, neighbor indices and optional edge weights) plus a
+list of node labels.  They provide the read-only part of the Graph and
+DiGraph interface, so algorithms that only inspect ``G[n]``, ``G.adj``,
+``G.nodes_iter()``, ``G.edges_iter()`` or ``G.degree_iter()`` run on them
+unchanged while using a fraction of the memory of the dict-of-dicts
+structure.
+
+Numeric edge attributes are kept in a columnar store, ``G.edge_columns``,
+that maps each attribute name to an array aligned with ``G.indices``.
+set_edge_attributes and get_edge_attributes read and write these columns
+in bulk.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+import networkx as nx
+from networkx.exception import NetworkXError
+from networkx.classes.graph import Graph, _attr_copier
+from networkx.classes.digraph import DiGraph
+from networkx.classes.function import frozen
+
+__all__ = ['CSRGraph', 'CSRDiGraph']
+
+
+class _EdgeData(dict):
+    """Edge data dict created on access from the edge columns.
+
+    Changes to it would not reach the columns, so they raise an error as
+    the methods that add or remove edges do.
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = frozen
+    clear = pop = popitem = setdefault = update = frozen
+
+    def __reduce__(self):
+        # copies are plain dicts that can be changed
+        return (dict, (dict(self),))
+
+
+class _CSRAtlas(Mapping):
+    """Read-only neighbor dict of a single node stored as one CSR row.
+
+    Edge data dicts are created on access from the edge columns and
+    hold one key per column, except for the attributes that the edge
+    does not have.
+    """
+    __slots__ = ('_adj', '_start', '_stop')
+
+    def __init__(self, adj, start, stop):
+        self._adj = adj
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __iter__(self):
+        labels = self._adj._labels
+        for j in self._adj._indices[self._start:self._stop].tolist():
+            yield labels[j]
+
+    def _position(self, nbr):
+        try:
+            j = self._adj._index[nbr]
+        except (KeyError, TypeError):
+            return -1
+        indices = self._adj._indices
+        start, stop = self._start, self._stop
+        pos = start + int(indices[start:stop].searchsorted(j))
+        if pos < stop and indices[pos] == j:
+            return pos
+        return -1
+
+    def __contains__(self, nbr):
+        return self._position(nbr) >= 0
+
+    def __getitem__(self, nbr):
+        pos = self._position(nbr)
+        if pos < 0:
+            raise KeyError(nbr)
+        return self._adj._edge_data(pos)
+
+    def items(self):
+        adj = self._adj
+        labels = adj._labels
+        nbrs = adj._indices[self._start:self._stop].tolist()
+        if not adj._columns:
+            return ((labels[j], _EdgeData()) for j in nbrs)
+        if adj._missing:
+            return ((labels[j], adj._edge_data(pos))
+                    for j, pos in zip(nbrs, range(self._start, self._stop)))
+        names = list(adj._columns)
+        vals = [adj._column_slice(name, self._start, self._stop)
+                for name in names]
+        if len(names) == 1:
+            name = names[0]
+            return ((labels[j], _EdgeData({name: w}))
+                    for j, w in zip(nbrs, vals[0]))
+        return ((labels[j], _EdgeData(zip(names, d)))
+                for j, d in zip(nbrs, zip(*vals)))
+
+    def values(self):
+        return (d for nbr, d in self.items())
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only adjacency dict keyed by node label built on CSR arrays.
+
+    Edge attribute values are read from columns, a dict of arrays shared
+    with the graph, and missing, a dict of boolean arrays marking the
+    edges that do not have the attribute of a column.  If perm is not
+    None, entry j of this adjacency holds the values at position perm[j]
+    of the columns.
+    """
+
+    def __init__(self, labels, index, indptr, indices, columns, perm=None,
+                 missing=None):
+        self._labels = labels
+        self._index = index
+        self._indptr = indptr
+        self._indices = indices
+        self._columns = columns
+        self._perm = perm
+        self._missing = {} if missing is None else missing
+
+    def _column_slice(self, name, start, stop):
+        col = self._columns[name]
+        if self._perm is None:
+            return col[start:stop].tolist()
+        return col[self._perm[start:stop]].tolist()
+
+    def _edge_data(self, pos):
+        if self._perm is not None:
+            pos = self._perm[pos]
+        missing = self._missing
+        return _EdgeData((name, col[pos].item())
+                         for name, col in self._columns.items()
+                         if name not in missing or not missing[name][pos])
+
+    def _atlas(self, i):
+        indptr = self._indptr
+        return _CSRAtlas(self, int(indptr[i]), int(indptr[i + 1]))
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        return self._atlas(self._index[n])
+
+    def items(self):
+        return ((n, self._atlas(i)) for i, n in enumerate(self._labels))
+
+    def values(self):
+        return (self._atlas(i) for i in range(len(self._labels)))
+
+    def __repr__(self):
+        return repr(dict((n, nbrs.copy()) for n, nbrs in self.items()))
+
+
+class _CSRNodeView(Mapping):
+    """Read-only node attribute dict.
+
+    Only nodes that carry attributes are stored; all other nodes map to
+    a new empty dict.
+    """
+
+    def __init__(self, labels, index, attr):
+        self._labels = labels
+        self._index = index
+        self._attr = attr
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n not in self._index:
+            raise KeyError(n)
+        return self._attr.get(n, {})
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _compress(n, src, dst, dedupe=True):
+    """Return CSR arrays (indptr, indices, order) for the entries src->dst.
+
+    Entries are sorted by (src, dst) and order holds the position in the
+    input of each entry, so that data[order] is the data aligned with
+    indices.  If dedupe is True, only the last of repeated (src, dst)
+    entries is kept, matching the behavior of adding the same edge twice
+    to a Graph.
+    """
+    import numpy as np
+    order = np.lexsort((dst, src))
+    src = src[order]
+    dst = dst[order]
+    if dedupe and len(src) > 1:
+        keep = np.ones(len(src), dtype=bool)
+        keep[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        if not keep.all():
+            src = src[keep]
+            dst = dst[keep]
+            order = order[keep]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    itype = np.int32 if n < 2**31 else np.int64
+    return indptr, dst.astype(itype), order
+
+
+def _names(weight):
+    """Return the list of edge attribute names given by weight."""
+    if weight is None:
+        return []
+    if isinstance(weight, (list, tuple)):
+        return list(weight)
+    return [weight]
+
+
+class CSRGraph(Graph):
+    """Compact read-only undirected graph stored as compressed sparse rows.
+
+    The adjacency structure is kept in integer-indexed NumPy arrays:
+    ``indptr`` holds the offset of each node's neighbors in ``indices``.
+    Numeric edge attributes are kept in ``edge_columns``, a dict mapping
+    each attribute name to an array of values aligned with ``indices``,
+    and ``data`` is the column of the first (weight) attribute.  Node
+    labels are mapped to the integers 0..n-1 in the order of ``nodes()``.
+
+    The graph structure cannot be modified after construction.  It
+    supports the read interface of Graph (``G[n]``, ``G.adj``,
+    ``G.nodes_iter()``, ``G.edges_iter()``, ``G.degree_iter()``, ...),
+    so algorithms that only read the graph accept a CSRGraph in place
+    of a Graph.  Edge attribute columns can be changed in bulk with
+    set_edge_attributes.
+
+    Parameters
+    ----------
+    data : input graph, optional (default=None)
+        Data to initialize the graph.  This can be a NetworkX graph,
+        a SciPy sparse matrix (for example the output of
+        to_scipy_sparse_matrix) or an edge array.  An edge array is a
+        tuple (src, dst, col1, col2, ...) of equal length arrays, or an
+        array of shape (m, 2 + k), where src and dst hold integer
+        indices into nodelist and the optional columns hold the values
+        of the stored edge attributes, in the order given by weight.
+    nodelist : list, optional
+        The node labels.  For a NetworkX graph this selects and orders
+        the nodes that are kept (default: all nodes in G.nodes() order).
+        For matrices and edge arrays, row/index i is labeled
+        nodelist[i] (default: the integers 0..n-1).
+    weight : string, list of strings or None, optional (default='weight')
+        Names of the numeric edge attributes that are stored as columns.
+        Edges without an attribute get the value 1 in its column, and
+        their data dicts do not hold it.  Attributes that no edge has
+        are not stored.  If None, no attributes are stored and
+        edge data dicts are empty.
+    dtype : NumPy data-type, optional (default=numpy.float64)
+        Data type of the stored attribute values.
+    attr : keyword arguments, optional
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRDiGraph
+    Graph
+    to_scipy_sparse_matrix
+    set_edge_attributes
+
+    Notes
+    -----
+    Node and edge attribute dicts are created on access.  Changing a node
+    attribute dict does not change the graph, and changing an edge data
+    dict raises a NetworkXError.  Only the attributes named in weight are
+    kept for edges.  Node attributes are kept for nodes that have any.
+
+    Each undirected edge is stored in the rows of both of its nodes,
+    so the memory used is about ``8 * (n + 1) + (4 + 8 * k) * 2 * m``
+    bytes for n nodes, m edges and k stored attributes, plus the node
+    labels.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> G.add_edge(2, 3, weight=5)
+    >>> H = nx.CSRGraph(G)
+    >>> H[2][3]
+    {'weight': 5.0}
+    >>> sorted(H.edges_iter())
+    [(0, 1), (1, 2), (2, 3)]
+    >>> nx.shortest_path_length(H, 0, 3, weight='weight')
+    7.0
+
+    Store several attributes and change them in bulk
+
+    >>> G.add_edge(0, 1, capacity=2)
+    >>> H = nx.CSRGraph(G, weight=['weight', 'capacity'])
+    >>> nx.set_edge_attributes(H, 'capacity', 3)
+    >>> sorted(nx.get_edge_attributes(H, 'capacity').values())
+    [3.0, 3.0, 3.0]
+
+    Build directly from an edge array
+
+    >>> import numpy as np
+    >>> H = nx.CSRGraph((np.array([0, 1]), np.array([1, 2])),
+    ...                 nodelist=['a', 'b', 'c'])
+    >>> sorted(H['b'])
+    ['a', 'c']
+    """
+    add_node = frozen
+    add_nodes_from = frozen
+    remove_node = frozen
+    remove_nodes_from = frozen
+    add_edge = frozen
+    add_edges_from = frozen
+    add_weighted_edges_from = frozen
+    add_edges_from_arrays = frozen
+    remove_edge = frozen
+    remove_edges_from = frozen
+    clear = frozen
+    frozen = True
+
+    def __init__(self, data=None, nodelist=None, weight='weight',
+                 dtype=None, **attr):
+        import numpy as np
+        names = _names(weight)
+        self._weight = names[0] if names else None
+        self._dtype = np.float64 if dtype is None else dtype
+        self.graph = {}
+        if data is None:
+            labels = [] if nodelist is None else list(nodelist)
+            empty = np.zeros(0, dtype=np.int64)
+            self._set_edges(labels, empty, empty, {})
+        elif hasattr(data, 'adj'):
+            self._from_graph(data, nodelist, names)
+        elif hasattr(data, 'format'):
+            self._from_scipy(data, nodelist, names)
+        else:
+            self._from_edge_array(data, nodelist, names)
+        self.graph.update(attr)
+
+    @property
+    def data(self):
+        """The array of weights aligned with indices, or None."""
+        return self.edge_columns.get(self._weight)
+
+    def _from_graph(self, G, nodelist, names):
+        import numpy as np
+        if G.is_multigraph():
+            raise NetworkXError("%s cannot be built from a multigraph."
+                                % self.__class__.__name__)
+        if G.is_directed() != self.is_directed():
+            raise NetworkXError("G must be %s." % ('directed'
+                                if self.is_directed() else 'undirected'))
+        if nodelist is None:
+            labels = list(G)
+        else:
+            labels = list(nodelist)
+            if len(set(labels)) != len(labels):
+                raise NetworkXError("nodelist contains duplicate nodes.")
+        index = dict(zip(labels, range(len(labels))))
+        self.graph.update(G.graph)
+        node_attr = dict((n, dict(G.node[n])) for n in labels if G.node[n])
+        # every stored entry, in both directions for undirected graphs
+        entries = [(index[u], index[v], d) for u in labels
+                   for v, d in G.adj[u].items() if v in index]
+        src = np.fromiter((u for u, v, d in entries), dtype=np.int64,
+                          count=len(entries))
+        dst = np.fromiter((v for u, v, d in entries), dtype=np.int64,
+                          count=len(entries))
+        columns = {}
+        missing = {}
+        for name in names:
+            has = np.fromiter((name in d for u, v, d in entries),
+                              dtype=bool, count=len(entries))
+            if has.any():
+                columns[name] = np.fromiter((d.get(name, 1)
+                                             for u, v, d in entries),
+                                            dtype=self._dtype,
+                                            count=len(entries))
+                if not has.all():
+                    missing[name] = ~has
+        del entries
+        self._set_csr(labels, index, src, dst, columns, node_attr, missing)
+
+    def _from_scipy(self, A, nodelist, names):
+        n, m = A.shape
+        if n != m:
+            raise NetworkXError("Adjacency matrix is not square. "
+                                "nx,ny=%s" % (A.shape,))
+        A = A.tocoo()
+        labels = list(range(n)) if nodelist is None else list(nodelist)
+        if len(labels) != n:
+            raise NetworkXError("nodelist must have one node per row of A.")
+        columns = {names[0]: A.data} if names else {}
+        self._set_edges(labels, A.row, A.col, columns)
+
+    def _from_edge_array(self, edges, nodelist, names):
+        import numpy as np
+        if isinstance(edges, tuple):
+            cols = [np.asarray(c) for c in edges]
+        else:
+            arr = np.asarray(edges)
+            if arr.ndim != 2:
+                raise NetworkXError("Input is not a valid edge array.")
+            cols = list(arr.T)
+        if len(cols) < 2:
+            raise NetworkXError("Edge array must have at least 2 columns.")
+        if len(cols) > 2 + max(len(names), 1):
+            raise NetworkXError("Edge array has more columns than "
+                                "attribute names in weight.")
+        src = cols[0].astype(np.int64)
+        dst = cols[1].astype(np.int64)
+        if any(len(c) != len(src) for c in cols):
+            raise NetworkXError("Edge array columns have different lengths.")
+        columns = dict(zip(names, cols[2:]))
+        if nodelist is None:
+            n = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+            labels = list(range(n))
+        else:
+            labels = list(nodelist)
+        if len(src) and (min(src.min(), dst.min()) < 0 or
+                         max(src.max(), dst.max()) >= len(labels)):
+            raise NetworkXError("Edge array refers to a node index that "
+                                "is not in nodelist.")
+        self._set_edges(labels, src, dst, columns)
+
+    def _set_edges(self, labels, src, dst, columns):
+        """Store the edges src[i]-dst[i], each given once."""
+        import numpy as np
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        # canonical orientation so that (u, v) and (v, u) are duplicates
+        u = np.minimum(src, dst)
+        v = np.maximum(src, dst)
+        indptr, v, order = _compress(len(labels), u, v)
+        u = np.repeat(np.arange(len(labels), dtype=np.int64),
+                      np.diff(indptr))
+        v = v.astype(np.int64)
+        loop = u != v
+        src = np.concatenate((u, v[loop]))
+        dst = np.concatenate((v, u[loop]))
+        order = np.concatenate((order, order[loop]))
+        columns = dict((name, np.asarray(col, dtype=self._dtype)[order])
+                       for name, col in columns.items())
+        index = dict(zip(labels, range(len(labels))))
+        if len(index) != len(labels):
+            raise NetworkXError("nodelist contains duplicate nodes.")
+        self._set_csr(labels, index, src, dst, columns, {})
+
+    def _set_csr(self, labels, index, src, dst, columns, node_attr,
+                 missing=None):
+        """Compress entries src->dst, already stored in both directions.
+
+        missing maps column names to boolean arrays aligned with the
+        columns that mark the entries without the attribute.
+        """
+        indptr, indices, order = _compress(len(labels), src, dst,
+                                           dedupe=False)
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_columns = dict((name, col[order])
+                                 for name, col in columns.items())
+        self._missing = dict((name, mask[order])
+                             for name, mask in (missing or {}).items())
+        self.node = _CSRNodeView(labels, index, node_attr)
+        self._set_adjacency()
+
+    def _set_adjacency(self):
+        node = self.node
+        self.adj = _CSRAdjacency(node._labels, node._index, self.indptr,
+                                 self.indices, self.edge_columns,
+                                 missing=self._missing)
+        self.edge = self.adj
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            loops = int((self.indices == self._rows()).sum())
+            return (len(self.indices) + loops) // 2
+        return super(CSRGraph, self).number_of_edges(u, v)
+    number_of_edges.__doc__ = Graph.number_of_edges.__doc__
+
+    def _rows(self):
+        import numpy as np
+        indptr = self.indptr
+        return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+    def _edge_positions(self, edges):
+        """Return the positions in indices of the entries u->v for the
+        edges (u, v), and for undirected graphs also of the entries v->u.
+        """
+        import numpy as np
+        index = self.node._index
+        try:
+            pairs = [(index[u], index[v]) for u, v in edges]
+        except KeyError as e:
+            raise NetworkXError("The edge %s is not in the graph." % (e,))
+        u = np.array([i for i, j in pairs], dtype=np.int64)
+        v = np.array([j for i, j in pairs], dtype=np.int64)
+        if not self.is_directed():
+            u, v = np.concatenate((u, v)), np.concatenate((v, u))
+        # entries are sorted by (row, index), so the keys are sorted
+        n = len(self.indptr) - 1
+        keys = self._rows() * n + self.indices
+        pos = np.searchsorted(keys, u * n + v)
+        bad = (pos >= len(keys))
+        bad[~bad] = keys[pos[~bad]] != (u * n + v)[~bad]
+        if bad.any():
+            k = int(bad.nonzero()[0][0]) % len(pairs)
+            raise NetworkXError("The edge %s-%s is not in the graph."
+                                % tuple(edges[k]))
+        return pos
+
+    def _set_edge_column(self, name, values):
+        """Set the column name from a dict keyed by edge, an array aligned
+        with indices or a single value.  Used by set_edge_attributes.
+        """
+        import numpy as np
+        columns = self.edge_columns
+        missing = self._missing
+        m = len(self.indices)
+        if name in columns:
+            col = columns[name]
+        else:
+            col = np.ones(m, dtype=self._dtype)
+        if hasattr(values, 'items'):
+            edges = list(values)
+            pos = self._edge_positions(edges)
+            vals = np.fromiter(values.values(), dtype=col.dtype,
+                               count=len(edges))
+            if not self.is_directed():
+                vals = np.concatenate((vals, vals))
+            col[pos] = vals
+            if name not in columns:
+                missing[name] = np.ones(m, dtype=bool)
+            if name in missing:
+                missing[name][pos] = False
+                if not missing[name].any():
+                    del missing[name]
+        else:
+            vals = np.asarray(values, dtype=col.dtype)
+            if vals.ndim and len(vals) != m:
+                raise NetworkXError("The array of values must have one "
+                                    "value per entry of indices.")
+            col[:] = vals
+            missing.pop(name, None)
+        # store the column in place so adjacency views see it
+        columns[name] = col
+        self.__dict__.pop('_cache', None)
+        if self._weight is None:
+            self._weight = name
+
+    def _get_edge_column(self, name):
+        """Return a dict of the values of column name keyed by edge."""
+        col = self.edge_columns.get(name)
+        if col is None:
+            return {}
+        labels = self.node._labels
+        rows = self._rows()
+        indices = self.indices
+        keep = None
+        if not self.is_directed():
+            keep = rows <= indices
+        if name in self._missing:
+            has = ~self._missing[name]
+            keep = has if keep is None else keep & has
+        if keep is not None:
+            rows, indices, col = rows[keep], indices[keep], col[keep]
+        return dict(zip(((labels[u], labels[v]) for u, v in
+                         zip(rows.tolist(), indices.tolist())),
+                        col.tolist()))
+
+    def copy(self, attr='deep'):
+        """Return a copy of the graph.
+
+        The structure arrays are read-only, so the copy shares them with
+        the graph.  The graph and node attributes and the edge columns
+        are copied.
+
+        Parameters
+        ----------
+        attr : 'deep', 'shallow' or 'share' (default='deep')
+            How the graph and node attribute dicts are copied,
+            see Graph.copy.  With 'share' the edge columns are shared
+            too.
+
+        Returns
+        -------
+        G : CSRGraph
+            A copy of the graph.
+        """
+        copy_attr = _attr_copier(attr, {})
+        node = self.node
+        H = self.__class__.__new__(self.__class__)
+        H.__dict__.update(self.__dict__)
+        H.__dict__.pop('_cache', None)
+        H.graph = copy_attr(self.graph)
+        H.node = _CSRNodeView(node._labels, node._index,
+                              dict((n, copy_attr(d))
+                                   for n, d in node._attr.items()))
+        if attr != 'share':
+            H.edge_columns = dict((name, col.copy())
+                                  for name, col in self.edge_columns.items())
+            H._missing = dict((name, mask.copy())
+                              for name, mask in self._missing.items())
+        H._set_adjacency()
+        return H
+
+    def subgraph(self, nbunch):
+        """Return the subgraph induced on nodes in nbunch.
+
+        Parameters
+        ----------
+        nbunch : list, iterable
+            A container of nodes which will be iterated through once.
+
+        Returns
+        -------
+        G : CSRGraph
+            A new compact graph holding the nodes in nbunch and the
+            edges between them.
+
+        Examples
+        --------
+        >>> H = nx.CSRGraph(nx.path_graph(4))
+        >>> sorted(H.subgraph([0, 1, 2]).edges())
+        [(0, 1), (1, 2)]
+        """
+        import numpy as np
+        labels = list(self.nbunch_iter(nbunch))
+        index = self.node._index
+        old = np.fromiter((index[n] for n in labels), dtype=np.int64,
+                          count=len(labels))
+        new = np.empty(len(index), dtype=np.int64)
+        new.fill(-1)
+        new[old] = np.arange(len(labels))
+        src = new[self._rows()]
+        dst = new[self.indices]
+        keep = (src >= 0) & (dst >= 0)
+        columns = dict((name, col[keep])
+                       for name, col in self.edge_columns.items())
+        missing = dict((name, mask[keep])
+                       for name, mask in self._missing.items())
+        attr = self.node._attr
+        H = self.__class__.__new__(self.__class__)
+        H._weight = self._weight
+        H._dtype = self._dtype
+        H.graph = self.graph
+        H._set_csr(labels, dict(zip(labels, range(len(labels)))),
+                   src[keep], dst[keep], columns,
+                   dict((n, attr[n]) for n in labels if n in attr), missing)
+        return H
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """Compact read-only directed graph stored as compressed sparse rows.
+
+    The successors of each node are stored as compressed sparse rows and
+    the predecessors as compressed sparse columns, so both ``G.succ`` and
+    ``G.pred`` are available without building dicts.  The edge columns
+    are stored once, aligned with the successor arrays.
+
+    Parameters
+    ----------
+    data : input graph, optional (default=None)
+        Data to initialize the graph.  This can be a NetworkX DiGraph,
+        a SciPy sparse matrix (for example the output of
+        to_scipy_sparse_matrix) or an edge array.  An edge array is a
+        tuple (src, dst, col1, col2, ...) of equal length arrays, or an
+        array of shape (m, 2 + k), where src and dst hold integer
+        indices into nodelist and the optional columns hold the values
+        of the stored edge attributes, in the order given by weight.
+    nodelist : list, optional
+        The node labels.  For a NetworkX graph this selects and orders
+        the nodes that are kept (default: all nodes in G.nodes() order).
+        For matrices and edge arrays, row/index i is labeled
+        nodelist[i] (default: the integers 0..n-1).
+    weight : string, list of strings or None, optional (default='weight')
+        Names of the numeric edge attributes that are stored as columns.
+        Edges without an attribute get the value 1 in its column, and
+        their data dicts do not hold it.  Attributes that no edge has
+        are not stored.  If None, no attributes are stored and
+        edge data dicts are empty.
+    dtype : NumPy data-type, optional (default=numpy.float64)
+        Data type of the stored attribute values.
+    attr : keyword arguments, optional
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRGraph
+    DiGraph
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> H = nx.CSRDiGraph(G)
+    >>> H.successors(0), H.predecessors(0)
+    ([1], [2])
+    >>> R = H.reverse()
+    >>> R.successors(0)
+    [2]
+    """
+
+    def _set_edges(self, labels, src, dst, columns):
+        import numpy as np
+        index = dict(zip(labels, range(len(labels))))
+        if len(index) != len(labels):
+            raise NetworkXError("nodelist contains duplicate nodes.")
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        columns = dict((name, np.asarray(col, dtype=self._dtype))
+                       for name, col in columns.items())
+        self._set_csr(labels, index, src, dst, columns, {})
+
+    def _set_csr(self, labels, index, src, dst, columns, node_attr,
+                 missing=None):
+        import numpy as np
+        indptr, indices, order = _compress(len(labels), src, dst)
+        rows = np.repeat(np.arange(len(labels), dtype=np.int64),
+                         np.diff(indptr))
+        pindptr, pindices, perm = _compress(len(labels),
+                                            indices.astype(np.int64),
+                                            rows, dedupe=False)
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_columns = dict((name, col[order])
+                                 for name, col in columns.items())
+        self._missing = dict((name, mask[order])
+                             for name, mask in (missing or {}).items())
+        self._pindptr = pindptr
+        self._pindices = pindices
+        self._perm = perm
+        self.node = _CSRNodeView(labels, index, node_attr)
+        self._set_adjacency()
+
+    def _set_adjacency(self):
+        node = self.node
+        columns = self.edge_columns
+        self.succ = _CSRAdjacency(node._labels, node._index, self.indptr,
+                                  self.indices, columns,
+                                  missing=self._missing)
+        self.pred = _CSRAdjacency(node._labels, node._index, self._pindptr,
+                                  self._pindices, columns, self._perm,
+                                  self._missing)
+        self.adj = self.succ
+        self.edge = self.adj
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            return len(self.indices)
+        return DiGraph.number_of_edges(self, u, v)
+    number_of_edges.__doc__ = DiGraph.number_of_edges.__doc__
+
+    def reverse(self, copy=True):
+        """Return the reverse of the graph.
+
+        The reverse is a graph with the same nodes and edges
+        but with the directions of the edges reversed.
+
+        Parameters
+        ----------
+        copy : bool (default=True)
+            Ignored.  The reverse always shares the (read-only) structure
+            arrays of this graph, so it is created without copying the
+            edges.  Only the edge columns are reordered.
+        """
+        import numpy as np
+        H = self.__class__.__new__(self.__class__)
+        H.__dict__.update(self.__dict__)
+        H.__dict__.pop('_cache', None)
+        H.indptr, H._pindptr = self._pindptr, self.indptr
+        H.indices, H._pindices = self._pindices, self.indices
+        H.edge_columns = dict((name, col[self._perm])
+                              for name, col in self.edge_columns.items())
+        H._missing = dict((name, mask[self._perm])
+                          for name, mask in self._missing.items())
+        H._perm = np.argsort(self._perm)
+        H._set_adjacency()
+        return H
+
+
+def _cache(G):
+    """Return the dict in which algorithms keep data computed from the
+    CSR graph G, such as sparse matrices, or None if G is not a CSRGraph.
+
+    The structure of a CSRGraph cannot change and the dict is dropped
+    when an edge column is set, so the data kept in it stays valid.
+    """
+    if not isinstance(G, CSRGraph):
+        return None
+    return G.__dict__.setdefault('_cache', {})
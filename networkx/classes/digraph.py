@@ -6,8 +6,9 @@
 #    All rights reserved.
 #    BSD license.
 from copy import deepcopy
+import itertools
 import networkx as nx
-from networkx.classes.graph import Graph
+from networkx.classes.graph import Graph, _deepcopy_attr, _edge_columns
 from networkx.exception import NetworkXError
 import networkx.convert as convert
 __author__ = """\n""".join(['Aric Hagberg (hagberg@lanl.gov)',
@@ -656,6 +657,69 @@ class DiGraph(Graph):
             self.succ[u][v] = datadict
             self.pred[v][u] = datadict
 
+    def add_edges_from_arrays(self, src, dst, attr_dict=None, **attr):
+        """Add the edges src[i] -> dst[i] with attributes given by columns.
+
+        This is a fast way to add many edges at once, for example from
+        NumPy arrays.  The nodes of all edges are added first and the
+        edges are then added in a single pass without per-edge argument
+        checking.
+
+        Parameters
+        ----------
+        src, dst : sequences of nodes
+            Equal length sequences holding the tail and head of each
+            edge.  NumPy arrays, lists and other objects supporting the
+            buffer protocol (like array.array) are accepted.  Array items
+            are converted to the corresponding Python objects.
+        attr_dict : dictionary, optional (default= no attributes)
+            Dictionary of edge attribute columns keyed by attribute name.
+            Each column is a sequence, of the same length as src, holding
+            the attribute value of each edge.
+        attr : keyword arguments, optional
+            Edge attribute columns can also be given as keyword arguments.
+
+        Raises
+        ------
+        NetworkXError
+            If src, dst and the attribute columns have different lengths.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = nx.DiGraph()
+        >>> G.add_edges_from_arrays(np.array([0, 1]), np.array([1, 0]),
+        ...                         weight=np.array([0.5, 2.0]))
+        >>> G[1][0]
+        {'weight': 2.0}
+        """
+        src, dst, rows = _edge_columns(src, dst, attr_dict, attr)
+        node = self.node
+        succ = self.succ
+        pred = self.pred
+        factory = self.adjlist_dict_factory
+        for n in itertools.chain(src, dst):
+            if n not in node:
+                succ[n] = factory()
+                pred[n] = factory()
+                node[n] = {}
+        factory = self.edge_attr_dict_factory
+        new_dict = factory is not dict
+        for u, v, dd in zip(src, dst, rows):
+            nbrs = succ[u]
+            if v in nbrs:
+                nbrs[v].update(dd)
+            else:
+                if new_dict:
+                    datadict = factory()
+                    datadict.update(dd)
+                    dd = datadict
+                nbrs[v] = pred[v][u] = dd
+
 
     def remove_edge(self, u, v):
         """Remove the edge between u and v.
@@ -1141,6 +1205,10 @@ class DiGraph(Graph):
         self.graph.clear()
 
 
+    def _copy_adjacency(self, G, copy_attr, memo):
+        self._copy_adj(self.succ, G.succ, copy_attr, memo)
+        self._copy_adj(self.pred, G.pred, copy_attr, memo)
+
     def is_multigraph(self):
         """Return True if graph is a multigraph, False otherwise."""
         return False
@@ -1186,7 +1254,7 @@ class DiGraph(Graph):
         >>> H.edges()
         [(0, 1)]
         """
-        return deepcopy(self)
+        return self.copy()
 
     def to_undirected(self, reciprocal=False):
         """Return an undirected representation of the digraph.
@@ -1235,12 +1303,12 @@ class DiGraph(Graph):
         H.name=self.name
         H.add_nodes_from(self)
         if reciprocal is True:
-            H.add_edges_from( (u,v,deepcopy(d))
+            H.add_edges_from( (u,v,_deepcopy_attr(d))
                               for u,nbrs in self.adjacency_iter()
                               for v,d in nbrs.items()
                               if v in self.pred[u])
         else:
-            H.add_edges_from( (u,v,deepcopy(d))
+            H.add_edges_from( (u,v,_deepcopy_attr(d))
                               for u,nbrs in self.adjacency_iter()
                               for v,d in nbrs.items() )
         H.graph=deepcopy(self.graph)
@@ -1264,7 +1332,7 @@ class DiGraph(Graph):
         if copy:
             H = self.__class__(name="Reverse of (%s)"%self.name)
             H.add_nodes_from(self)
-            H.add_edges_from( (v,u,deepcopy(d)) for u,v,d
+            H.add_edges_from( (v,u,_deepcopy_attr(d)) for u,v,d
                               in self.edges(data=True) )
             H.graph=deepcopy(self.graph)
             H.node=deepcopy(self.node)
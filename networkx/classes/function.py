@@ -192,6 +192,7 @@ def freeze(G):
     G.remove_nodes_from=frozen
     G.add_edge=frozen
     G.add_edges_from=frozen
+    G.add_edges_from_arrays=frozen
     G.remove_edge=frozen
     G.remove_edges_from=frozen
     G.clear=frozen
@@ -375,6 +376,12 @@ def set_edge_attributes(G, name, values):
        dictionary, then it is treated as a single attribute value that is then
        applied to every edge in `G`.
 
+    Notes
+    -----
+    For graphs that store edge attributes in columns, such as CSRGraph,
+    the values are written into the column `name` in one pass.  Such
+    graphs also accept an array with one value per entry of `G.indices`.
+
     Examples
     --------
     >>> G = nx.path_graph(3)
@@ -384,6 +391,9 @@ def set_edge_attributes(G, name, values):
     2.0
 
     """
+    if getattr(G, 'edge_columns', None) is not None:
+        G._set_edge_column(name, values)
+        return
     try:
         values.items
     except AttributeError:
@@ -418,6 +428,12 @@ def get_edge_attributes(G, name):
     2-tuples of the form: (u,v). For multi(di)graphs, the keys are 3-tuples of
     the form: (u, v, key).
 
+    Notes
+    -----
+    For graphs that store edge attributes in columns, such as CSRGraph,
+    the dictionary is built from the column `name` without creating
+    the edge data dicts.
+
     Examples
     --------
     >>> G=nx.Graph()
@@ -426,6 +442,8 @@ def get_edge_attributes(G, name):
     >>> color[(1,2)]
     'red'
     """
+    if getattr(G, 'edge_columns', None) is not None:
+        return G._get_edge_column(name)
     if G.is_multigraph():
         edges = G.edges(keys=True, data=True)
     else:
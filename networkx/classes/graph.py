@@ -14,6 +14,7 @@ For directed graphs see DiGraph and MultiDiGraph.
 #    All rights reserved.
 #    BSD license.
 from copy import deepcopy
+import itertools
 import networkx as nx
 from networkx.exception import NetworkXError
 import networkx.convert as convert
@@ -22,6 +23,108 @@ __author__ = """\n""".join(['Aric Hagberg (hagberg@lanl.gov)',
                             'Pieter Swart (swart@lanl.gov)',
                             'Dan Schult(dschult@colgate.edu)'])
 
+# attribute values that deepcopy returns unchanged
+_ATOMIC_TYPES = set([type(None), bool, int, float, complex, str, bytes])
+try:
+    _ATOMIC_TYPES.update([long, unicode])
+except NameError:  # Python 3
+    pass
+
+
+def _deepcopy_attr(d, memo=None):
+    """Return a deep copy of the attribute dict d.
+
+    Dicts whose keys and values are all atomic (numbers, strings, None)
+    are copied with d.copy(), which gives the same result as deepcopy
+    in a fraction of the time.
+    """
+    atomic = _ATOMIC_TYPES
+    for k, v in d.items():
+        if type(k) not in atomic or type(v) not in atomic:
+            return deepcopy(d, memo)
+    return d.copy()
+
+
+def _share_attr(d):
+    return d
+
+
+def _attr_copier(attr, memo):
+    """Return a function that copies attribute dicts for Graph.copy().
+
+    The function records each copy in the deepcopy memo dict memo, so
+    a dict that is reached more than once is copied only once and other
+    objects deep copied with memo refer to the copies.  For 'share' it
+    is _share_attr, which returns the dict itself.
+    """
+    if attr == 'share':
+        return _share_attr
+    if attr == 'deep':
+        def copy_attr(d):
+            i = id(d)
+            if i in memo:
+                return memo[i]
+            c = memo[i] = _deepcopy_attr(d, memo)
+            return c
+    elif attr == 'shallow':
+        def copy_attr(d):
+            i = id(d)
+            if i in memo:
+                return memo[i]
+            c = memo[i] = d.copy()
+            return c
+    else:
+        raise NetworkXError("Unknown attribute copy mode: %s.  Use 'deep', "
+                            "'shallow' or 'share'." % (attr,))
+    return copy_attr
+
+
+def _as_list(a):
+    """Return the items of the sequence a as a list of Python objects."""
+    if isinstance(a, list):
+        return a
+    try:
+        return a.tolist()  # NumPy arrays, pandas Series, array.array
+    except AttributeError:
+        pass
+    try:
+        return memoryview(a).tolist()
+    except TypeError:
+        return list(a)
+
+
+def _edge_columns(src, dst, attr_dict, attr):
+    """Return src, dst and an iterator of edge data dicts as used by
+    add_edges_from_arrays().
+    """
+    columns = {}
+    if attr_dict is not None:
+        try:
+            columns.update(attr_dict)
+        except (TypeError, ValueError):
+            raise NetworkXError(
+                "The attr_dict argument must be a dictionary.")
+    columns.update(attr)
+    src = _as_list(src)
+    dst = _as_list(dst)
+    m = len(src)
+    if len(dst) != m:
+        raise NetworkXError("src and dst must have the same length.")
+    names = list(columns)
+    cols = [_as_list(columns[name]) for name in names]
+    for name, col in zip(names, cols):
+        if len(col) != m:
+            raise NetworkXError("Attribute column %r must have the same "
+                                "length as src." % (name,))
+    # each row is a new dict, so it can be used as the edge data dict
+    if not names:
+        rows = ({} for i in itertools.repeat(None, m))
+    elif len(names) == 1:
+        rows = ({names[0]: x} for x in cols[0])
+    else:
+        rows = (dict(zip(names, vals)) for vals in zip(*cols))
+    return src, dst, rows
+
 
 class Graph(object):
     """
@@ -907,6 +1010,79 @@ class Graph(object):
         """
         self.add_edges_from(((u, v, {weight: d}) for u, v, d in ebunch), **attr)
 
+    def add_edges_from_arrays(self, src, dst, attr_dict=None, **attr):
+        """Add the edges (src[i], dst[i]) with attributes given by columns.
+
+        This is a fast way to add many edges at once, for example from
+        NumPy arrays.  The nodes of all edges are added first and the
+        edges are then added in a single pass without per-edge argument
+        checking.
+
+        Parameters
+        ----------
+        src, dst : sequences of nodes
+            Equal length sequences holding the two nodes of each edge.
+            NumPy arrays, lists and other objects supporting the buffer
+            protocol (like array.array) are accepted.  Array items are
+            converted to the corresponding Python objects.
+        attr_dict : dictionary, optional (default= no attributes)
+            Dictionary of edge attribute columns keyed by attribute name.
+            Each column is a sequence, of the same length as src, holding
+            the attribute value of each edge.
+        attr : keyword arguments, optional
+            Edge attribute columns can also be given as keyword arguments.
+
+        Raises
+        ------
+        NetworkXError
+            If src, dst and the attribute columns have different lengths.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Notes
+        -----
+        Adding the same edge twice has no effect but the edge data
+        will be updated when each duplicate edge is added.  For
+        MultiGraph/MultiDiGraph, duplicate edges are stored.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = nx.Graph()   # or DiGraph, MultiGraph, MultiDiGraph, etc
+        >>> G.add_edges_from_arrays(np.array([0, 1]), np.array([1, 2]),
+        ...                         weight=np.array([0.5, 2.0]))
+        >>> G[1][2]
+        {'weight': 2.0}
+
+        Lists work too
+
+        >>> G.add_edges_from_arrays([2], [3], color=['red'])
+        >>> G.edges(data=True)[-1]
+        (2, 3, {'color': 'red'})
+        """
+        src, dst, rows = _edge_columns(src, dst, attr_dict, attr)
+        node = self.node
+        adj = self.adj
+        factory = self.adjlist_dict_factory
+        for n in itertools.chain(src, dst):
+            if n not in node:
+                adj[n] = factory()
+                node[n] = {}
+        factory = self.edge_attr_dict_factory
+        new_dict = factory is not dict
+        for u, v, dd in zip(src, dst, rows):
+            nbrs = adj[u]
+            if v in nbrs:
+                nbrs[v].update(dd)
+            else:
+                if new_dict:
+                    datadict = factory()
+                    datadict.update(dd)
+                    dd = datadict
+                nbrs[v] = adj[v][u] = dd
+
     def remove_edge(self, u, v):
         """Remove the edge between u and v.
 
@@ -1415,22 +1591,47 @@ class Graph(object):
         self.node.clear()
         self.graph.clear()
 
-    def copy(self):
+    def copy(self, attr='deep'):
         """Return a copy of the graph.
 
+        Parameters
+        ----------
+        attr : 'deep', 'shallow' or 'share' (default='deep')
+            How the graph, node and edge attribute dicts are copied.
+            'deep' makes a deep copy of the attributes, as copy.deepcopy
+            would.  'shallow' makes new attribute dicts that hold the same
+            attribute values.  'share' makes the copy use the attribute
+            dicts of the graph, so changes to attributes in either graph
+            show up in both.
+
         Returns
         -------
         G : Graph
             A copy of the graph.
 
+        Raises
+        ------
+        NetworkXError
+            If attr is not one of 'deep', 'shallow' or 'share'.
+
         See Also
         --------
         to_directed: return a directed copy of the graph.
 
         Notes
         -----
-        This makes a complete copy of the graph including all of the
-        node or edge attributes.
+        The node and adjacency dicts are always new, so adding or removing
+        nodes or edges in the copy does not change the graph.  An attribute
+        dict shared by several edges, like the two directions of an
+        undirected edge, is copied once and stays shared in the copy.
+        Other instance attributes, such as those added by subclasses, are
+        deep copied.
+
+        The default makes a complete copy of the graph including all of
+        the node or edge attributes.  It is much faster than
+        copy.deepcopy(G) because attribute dicts holding only numbers,
+        strings and None are copied with dict.copy().  Use 'shallow' or
+        'share' to avoid copying attribute values altogether.
 
         Examples
         --------
@@ -1438,8 +1639,56 @@ class Graph(object):
         >>> G.add_path([0,1,2,3])
         >>> H = G.copy()
 
+        Share the attribute dicts with the original graph
+
+        >>> G.add_edge(0, 1, weight=4)
+        >>> H = G.copy(attr='share')
+        >>> H.remove_edge(2, 3)
+        >>> H[0][1]['weight'] = 7
+        >>> G[0][1]['weight'], G.has_edge(2, 3)
+        (7, True)
+
         """
-        return deepcopy(self)
+        G = self.__class__()
+        memo = {id(self): G}
+        copy_attr = _attr_copier(attr, memo)
+        G.graph = copy_attr(self.graph)
+        G.node.update((n, copy_attr(d)) for n, d in self.node.items())
+        self._copy_adjacency(G, copy_attr, memo)
+        # other instance attributes (e.g. set by freeze() or a subclass)
+        # are deep copied; memo makes them refer to the new attribute dicts
+        built = ('graph', 'node', 'adj', 'edge', 'succ', 'pred')
+        extra = [key for key, value in self.__dict__.items()
+                 if key not in built and
+                 (key not in G.__dict__ or G.__dict__[key] is not value)]
+        if extra and copy_attr is _share_attr:
+            memo[id(self.graph)] = self.graph
+            memo.update((id(d), d) for d in self.node.values())
+            memo.update((id(e[-1]), e[-1])
+                        for e in self.edges_iter(data=True))
+        for key in extra:
+            G.__dict__[key] = deepcopy(self.__dict__[key], memo)
+        return G
+
+    def _copy_adjacency(self, G, copy_attr, memo):
+        """Fill the adjacency of the new graph G with a copy of ours."""
+        self._copy_adj(self.adj, G.adj, copy_attr, memo)
+
+    def _copy_adj(self, adj, G_adj, copy_attr, memo):
+        """Copy the adjacency dict adj into G_adj.
+
+        Each neighbor dict is new; edge attribute dicts are copied by
+        copy_attr.  Multigraphs use memo to keep shared key dicts shared.
+        """
+        factory = self.adjlist_dict_factory
+        share = copy_attr is _share_attr
+        for u, nbrs in adj.items():
+            G_nbrs = factory()
+            if share:
+                G_nbrs.update(nbrs)
+            else:
+                G_nbrs.update((v, copy_attr(d)) for v, d in nbrs.items())
+            G_adj[u] = G_nbrs
 
     def is_multigraph(self):
         """Return True if graph is a multigraph, False otherwise."""
@@ -1497,7 +1746,7 @@ class Graph(object):
         G = DiGraph()
         G.name = self.name
         G.add_nodes_from(self)
-        G.add_edges_from(((u, v, deepcopy(data))
+        G.add_edges_from(((u, v, _deepcopy_attr(data))
             for u, nbrs in self.adjacency_iter()
             for v, data in nbrs.items()))
         G.graph = deepcopy(self.graph)
@@ -1539,7 +1788,7 @@ class Graph(object):
         >>> G2.edges()
         [(0, 1)]
         """
-        return deepcopy(self)
+        return self.copy()
 
     def subgraph(self, nbunch):
         """Return the subgraph induced on nodes in nbunch.
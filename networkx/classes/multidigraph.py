@@ -7,7 +7,7 @@
 #    BSD license.
 from copy import deepcopy
 import networkx as nx
-from networkx.classes.graph import Graph  # for doctests
+from networkx.classes.graph import Graph, _deepcopy_attr
 from networkx.classes.digraph import DiGraph
 from networkx.classes.multigraph import MultiGraph
 from networkx.exception import NetworkXError
@@ -796,7 +796,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
         >>> H.edges()
         [(0, 1)]
         """
-        return deepcopy(self)
+        return self.copy()
 
     def to_undirected(self, reciprocal=False):
         """Return an undirected representation of the digraph.
@@ -840,13 +840,13 @@ class MultiDiGraph(MultiGraph,DiGraph):
         H.name = self.name
         H.add_nodes_from(self)
         if reciprocal is True:
-            H.add_edges_from((u, v, key, deepcopy(data))
+            H.add_edges_from((u, v, key, _deepcopy_attr(data))
                             for u, nbrs in self.adjacency_iter()
                             for v, keydict in nbrs.items()
                             for key, data in keydict.items()
                             if self.has_edge(v, u, key))
         else:
-            H.add_edges_from((u, v, key, deepcopy(data))
+            H.add_edges_from((u, v, key, _deepcopy_attr(data))
                             for u, nbrs in self.adjacency_iter()
                             for v, keydict in nbrs.items()
                             for key, data in keydict.items())
@@ -937,7 +937,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
         if copy:
             H = self.__class__(name="Reverse of (%s)"%self.name)
             H.add_nodes_from(self)
-            H.add_edges_from((v, u, k, deepcopy(d)) for u, v, k, d
+            H.add_edges_from((v, u, k, _deepcopy_attr(d)) for u, v, k, d
                               in self.edges(keys=True, data=True))
             H.graph = deepcopy(self.graph)
             H.node = deepcopy(self.node)
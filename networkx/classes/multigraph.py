@@ -7,7 +7,8 @@
 #    BSD license.
 from copy import deepcopy
 import networkx as nx
-from networkx.classes.graph import Graph
+from networkx.classes.graph import Graph, _deepcopy_attr, _share_attr, \
+    _edge_columns
 from networkx import NetworkXError
 __author__ = """\n""".join(['Aric Hagberg (hagberg@lanl.gov)',
                             'Pieter Swart (swart@lanl.gov)',
@@ -418,6 +419,46 @@ class MultiGraph(Graph):
             ddd.update(dd)
             self.add_edge(u, v, key, ddd)
 
+    def add_edges_from_arrays(self, src, dst, attr_dict=None, **attr):
+        """Add the edges (src[i], dst[i]) with attributes given by columns.
+
+        Every pair adds a new edge with a new integer key.
+
+        Parameters
+        ----------
+        src, dst : sequences of nodes
+            Equal length sequences holding the two nodes of each edge.
+            NumPy arrays, lists and other objects supporting the buffer
+            protocol (like array.array) are accepted.  Array items are
+            converted to the corresponding Python objects.
+        attr_dict : dictionary, optional (default= no attributes)
+            Dictionary of edge attribute columns keyed by attribute name.
+            Each column is a sequence, of the same length as src, holding
+            the attribute value of each edge.
+        attr : keyword arguments, optional
+            Edge attribute columns can also be given as keyword arguments.
+
+        Raises
+        ------
+        NetworkXError
+            If src, dst and the attribute columns have different lengths.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Examples
+        --------
+        >>> G = nx.MultiGraph()   # or MultiDiGraph
+        >>> G.add_edges_from_arrays([0, 0], [1, 1], weight=[3, 4])
+        >>> G[0][1]
+        {0: {'weight': 3}, 1: {'weight': 4}}
+        """
+        src, dst, rows = _edge_columns(src, dst, attr_dict, attr)
+        add_edge = self.add_edge
+        for u, v, dd in zip(src, dst, rows):
+            add_edge(u, v, attr_dict=dd)
+
     def remove_edge(self, u, v, key=None):
         """Remove an edge between u and v.
 
@@ -833,6 +874,27 @@ class MultiGraph(Graph):
                                 for key, d in nbrs[n].items()])
                 yield (n, deg)
 
+    def _copy_adj(self, adj, G_adj, copy_attr, memo):
+        # key dicts are shared by both directions of an edge; keep them so
+        adj_factory = self.adjlist_dict_factory
+        key_factory = self.edge_key_dict_factory
+        share = copy_attr is _share_attr
+        for u, nbrs in adj.items():
+            G_nbrs = adj_factory()
+            for v, keydict in nbrs.items():
+                i = id(keydict)
+                if i in memo:
+                    G_nbrs[v] = memo[i]
+                    continue
+                G_keydict = key_factory()
+                if share:
+                    G_keydict.update(keydict)
+                else:
+                    G_keydict.update((k, copy_attr(d))
+                                     for k, d in keydict.items())
+                G_nbrs[v] = memo[i] = G_keydict
+            G_adj[u] = G_nbrs
+
     def is_multigraph(self):
         """Return True if graph is a multigraph, False otherwise."""
         return True
@@ -888,7 +950,7 @@ class MultiGraph(Graph):
         from networkx.classes.multidigraph import MultiDiGraph
         G = MultiDiGraph()
         G.add_nodes_from(self)
-        G.add_edges_from((u, v, key, deepcopy(datadict))
+        G.add_edges_from((u, v, key, _deepcopy_attr(datadict))
                             for u, nbrs in self.adjacency_iter()
                             for v, keydict in nbrs.items()
                             for key, datadict in keydict.items())
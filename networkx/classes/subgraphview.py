@@ -0,0 +1,406 @@
+"""Read-only subgraph views.
+
+A subgraph view shows the nodes and edges of a graph that pass a node
+filter and an edge filter.  It holds no copy of the graph structure: the
+node and adjacency dicts of the view filter the dicts of the underlying
+graph each time they are accessed.  Creating a view of the subgraph
+induced by ``nbunch`` costs O(len(nbunch)) time and memory and no memory
+is allocated per edge.
+
+Changes to the underlying graph, including its node, edge and graph
+attributes, are reflected in the view.
+"""
+#    Copyright (C) 2004-2015 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+from copy import deepcopy
+import networkx as nx
+from networkx.classes.graph import Graph, _attr_copier
+from networkx.classes.digraph import DiGraph
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.multidigraph import MultiDiGraph
+from networkx.classes.function import frozen
+
+__all__ = ['SubGraphView', 'SubDiGraphView', 'SubMultiGraphView',
+           'SubMultiDiGraphView', 'subgraph_view']
+
+
+def _no_filter(*args):
+    return True
+
+
+class _FilterAtlas(Mapping):
+    """Read-only dict showing the items of atlas whose key passes ok(key).
+
+    If keys is not None only those keys are considered, so iterating
+    costs O(len(keys)) instead of O(len(atlas)).
+    """
+    __slots__ = ('_atlas', '_ok', '_keys')
+
+    def __init__(self, atlas, ok, keys=None):
+        self._atlas = atlas
+        self._ok = ok
+        self._keys = keys
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+    def __iter__(self):
+        atlas = self._atlas
+        ok = self._ok
+        if self._keys is None:
+            return (n for n in atlas if ok(n))
+        return (n for n in self._keys if n in atlas and ok(n))
+
+    def __contains__(self, n):
+        try:
+            return n in self._atlas and self._ok(n)
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n in self:
+            return self._value(n)
+        raise KeyError(n)
+
+    def _value(self, n):
+        return self._atlas[n]
+
+    def items(self):
+        return ((n, self._value(n)) for n in self)
+
+    def values(self):
+        return (self._value(n) for n in self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __deepcopy__(self, memo):
+        return dict((n, deepcopy(d, memo)) for n, d in self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _FilterAdjacency(_FilterAtlas):
+    """Read-only adjacency dict of the nodes and edges passing filters.
+
+    Parameters
+    ----------
+    adj : dict
+        The adjacency (succ or pred) dict of the underlying graph.
+    node_ok : function
+        node_ok(n) is True for nodes in the view.
+    edge_ok : function
+        edge_ok(n, nbr) is True for edges in the view.
+    keys : container, optional
+        Candidate nodes of the view.
+    """
+    __slots__ = ('_edge_ok',)
+
+    def __init__(self, adj, node_ok, edge_ok, keys=None):
+        super(_FilterAdjacency, self).__init__(adj, node_ok, keys)
+        self._edge_ok = edge_ok
+
+    def _value(self, n):
+        node_ok = self._ok
+        edge_ok = self._edge_ok
+        if edge_ok is _no_filter:
+            return _FilterAtlas(self._atlas[n], node_ok)
+        return _FilterAtlas(self._atlas[n],
+                            lambda nbr: node_ok(nbr) and edge_ok(n, nbr))
+
+
+class _FilterMultiAtlas(_FilterAdjacency):
+    """Read-only neighbor dict of one node of a multigraph view.
+
+    A neighbor is shown if it passes the node filter and at least one of
+    the parallel edges to it passes the edge filter edge_ok(nbr, key).
+    """
+    __slots__ = ()
+
+    def __init__(self, atlas, node_ok, edge_ok):
+        if edge_ok is _no_filter:
+            ok = node_ok
+        else:
+            def ok(nbr):
+                return node_ok(nbr) and any(edge_ok(nbr, k)
+                                            for k in atlas[nbr])
+        super(_FilterMultiAtlas, self).__init__(atlas, ok, edge_ok)
+
+    def _value(self, nbr):
+        edge_ok = self._edge_ok
+        if edge_ok is _no_filter:
+            return self._atlas[nbr]
+        return _FilterAtlas(self._atlas[nbr], lambda k: edge_ok(nbr, k))
+
+
+class _FilterMultiAdjacency(_FilterAdjacency):
+    """Read-only adjacency dict of a multigraph view."""
+    __slots__ = ()
+
+    def _value(self, n):
+        edge_ok = self._edge_ok
+        if edge_ok is _no_filter:
+            return _FilterMultiAtlas(self._atlas[n], self._ok, edge_ok)
+        return _FilterMultiAtlas(self._atlas[n], self._ok,
+                                 lambda nbr, k: edge_ok(n, nbr, k))
+
+
+class SubGraphView(Graph):
+    """Read-only view of the subgraph of an undirected graph.
+
+    The view shows the nodes of G that are in nbunch and pass
+    filter_node, and the edges of G between those nodes that pass
+    filter_edge.  Nothing is copied: node, edge and graph attribute
+    dicts are those of G and changes to G are reflected in the view.
+
+    Parameters
+    ----------
+    G : graph
+        The underlying graph.
+    nbunch : iterable container, optional (default=all nodes)
+        The nodes of the view.  Nodes not in G are ignored.
+    filter_node : function, optional
+        A function filter_node(n) returning True for nodes in the view.
+    filter_edge : function, optional
+        A function filter_edge(u, v) returning True for edges in the
+        view, or filter_edge(u, v, key) for multigraphs.  For undirected
+        graphs the result must not depend on the order of u and v.
+
+    See Also
+    --------
+    subgraph_view
+    Graph.subgraph
+
+    Notes
+    -----
+    The view cannot be modified; methods that add or remove nodes or
+    edges raise NetworkXError.  Node and edge attributes can be changed
+    through the view and the changes are made to G.
+
+    Creating a view costs O(len(nbunch)).  Operations on the view apply
+    the filters, so for example ``len(H)`` takes O(len(nbunch)) time and
+    iterating over the neighbors of a node takes time proportional to its
+    degree in G.
+
+    Use ``H.copy()`` to obtain an independent graph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> H = nx.SubGraphView(G, [0, 1, 2])
+    >>> sorted(H.edges())
+    [(0, 1), (1, 2)]
+    >>> G.add_edge(0, 2)
+    >>> sorted(H.edges())
+    [(0, 1), (0, 2), (1, 2)]
+    >>> H = nx.SubGraphView(G, filter_edge=lambda u, v: u + v > 3)
+    >>> sorted(H.edges())
+    [(2, 3), (3, 4)]
+    """
+    add_node = frozen
+    add_nodes_from = frozen
+    remove_node = frozen
+    remove_nodes_from = frozen
+    add_edge = frozen
+    add_edges_from = frozen
+    add_weighted_edges_from = frozen
+    add_edges_from_arrays = frozen
+    remove_edge = frozen
+    remove_edges_from = frozen
+    clear = frozen
+    frozen = True
+
+    _adjacency_class = _FilterAdjacency
+
+    def __init__(self, G, nbunch=None, filter_node=None, filter_edge=None):
+        self._graph = G
+        self._root_class = getattr(G, '_root_class', G.__class__)
+        self.graph = G.graph
+        if nbunch is None:
+            nodes = None
+        else:
+            # preserve the order of nbunch while removing duplicates
+            nodes = dict.fromkeys(G.nbunch_iter(nbunch))
+        if filter_node is None:
+            node_ok = _no_filter if nodes is None else nodes.__contains__
+        elif nodes is None:
+            node_ok = filter_node
+        else:
+            def node_ok(n):
+                return n in nodes and filter_node(n)
+        edge_ok = _no_filter if filter_edge is None else filter_edge
+        self.node = _FilterAtlas(G.node, node_ok, nodes)
+        self._set_adjacency(G, node_ok, edge_ok, nodes)
+
+    def _set_adjacency(self, G, node_ok, edge_ok, nodes):
+        self.adj = self._adjacency_class(G.adj, node_ok, edge_ok, nodes)
+        self.edge = self.adj
+
+    def __deepcopy__(self, memo):
+        return self._copy(lambda d: deepcopy(d, memo))
+
+    def _copy(self, copy_attr):
+        H = self._root_class()
+        H.graph = copy_attr(self.graph)
+        H.add_nodes_from((n, copy_attr(d)) for n, d in self.node.items())
+        if self.is_multigraph():
+            H.add_edges_from((u, v, k, copy_attr(d)) for u, v, k, d in
+                             self.edges_iter(keys=True, data=True))
+        else:
+            H.add_edges_from((u, v, copy_attr(d)) for u, v, d in
+                             self.edges_iter(data=True))
+        return H
+
+    def copy(self, attr='deep'):
+        """Return a copy of the subgraph.
+
+        Parameters
+        ----------
+        attr : 'deep', 'shallow' or 'share' (default='deep')
+            How the graph, node and edge attribute dicts are copied,
+            see Graph.copy.
+
+        Returns
+        -------
+        G : Graph
+            An independent graph of the same class as the underlying
+            graph with copies of the node, edge and graph attributes.
+
+        Examples
+        --------
+        >>> G = nx.path_graph(4)
+        >>> H = nx.SubGraphView(G, [0, 1]).copy()
+        >>> H.add_edge(1, 5)
+        >>> sorted(G)
+        [0, 1, 2, 3]
+        """
+        return self._copy(_attr_copier(attr, {}))
+
+    def to_undirected(self):
+        return self.copy()
+    to_undirected.__doc__ = Graph.to_undirected.__doc__
+
+    def subgraph(self, nbunch):
+        """Return a view of the subgraph induced on nodes in nbunch.
+
+        Parameters
+        ----------
+        nbunch : list, iterable
+            A container of nodes which will be iterated through once.
+
+        Returns
+        -------
+        H : view
+            A read-only view of this view.
+        """
+        return self.__class__(self, nbunch)
+
+
+class SubDiGraphView(SubGraphView, DiGraph):
+    """Read-only view of the subgraph of a directed graph.
+
+    See SubGraphView for a description of the parameters.  filter_edge
+    is called as filter_edge(u, v) for the edge from u to v.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> H = nx.SubDiGraphView(G, [1, 2])
+    >>> H.edges(), H.predecessors(2)
+    ([(1, 2)], [1])
+    """
+
+    def _set_adjacency(self, G, node_ok, edge_ok, nodes):
+        cls = self._adjacency_class
+        self.succ = cls(G.succ, node_ok, edge_ok, nodes)
+        if edge_ok is _no_filter:
+            pred_ok = edge_ok
+        elif self.is_multigraph():
+            def pred_ok(u, v, k):
+                return edge_ok(v, u, k)
+        else:
+            def pred_ok(u, v):
+                return edge_ok(v, u)
+        self.pred = cls(G.pred, node_ok, pred_ok, nodes)
+        self.adj = self.edge = self.succ
+
+    def to_undirected(self, reciprocal=False):
+        return self._root_class.to_undirected(self, reciprocal)
+    to_undirected.__doc__ = DiGraph.to_undirected.__doc__
+
+    def reverse(self, copy=True):
+        """Return a reversed copy of the subgraph.
+
+        Parameters
+        ----------
+        copy : bool (default=True)
+            Must be True: a view cannot be reversed in place.
+        """
+        if not copy:
+            frozen()
+        return self.copy().reverse(copy=False)
+
+
+class SubMultiGraphView(SubGraphView, MultiGraph):
+    """Read-only view of the subgraph of an undirected multigraph.
+
+    See SubGraphView for a description of the parameters.  filter_edge
+    is called as filter_edge(u, v, key).
+    """
+    _adjacency_class = _FilterMultiAdjacency
+
+
+class SubMultiDiGraphView(SubDiGraphView, MultiDiGraph):
+    """Read-only view of the subgraph of a directed multigraph.
+
+    See SubGraphView for a description of the parameters.  filter_edge
+    is called as filter_edge(u, v, key) for the edge from u to v.
+    """
+    _adjacency_class = _FilterMultiAdjacency
+
+
+def subgraph_view(G, nbunch=None, filter_node=None, filter_edge=None):
+    """Return a read-only view of a subgraph of G.
+
+    The view class is chosen to match G: SubGraphView, SubDiGraphView,
+    SubMultiGraphView or SubMultiDiGraphView.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph.
+    nbunch : iterable container, optional (default=all nodes)
+        The nodes of the view.  Nodes not in G are ignored.
+    filter_node : function, optional
+        A function filter_node(n) returning True for nodes in the view.
+    filter_edge : function, optional
+        A function filter_edge(u, v) returning True for edges in the
+        view, or filter_edge(u, v, key) for multigraphs.
+
+    Returns
+    -------
+    H : view
+        A read-only view showing the nodes and edges of G that pass
+        the filters.
+
+    Examples
+    --------
+    >>> G = nx.MultiGraph([(0, 1), (0, 1), (1, 2)])
+    >>> H = nx.subgraph_view(G, filter_edge=lambda u, v, k: k == 0)
+    >>> H.number_of_edges()
+    2
+    """
+    if G.is_directed():
+        cls = SubMultiDiGraphView if G.is_multigraph() else SubDiGraphView
+    else:
+        cls = SubMultiGraphView if G.is_multigraph() else SubGraphView
+    return cls(G, nbunch, filter_node, filter_edge)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+from nose import SkipTest
+from nose.tools import *
+import networkx
+
+
+class TestCSRGraph(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        self.Graph=networkx.Graph
+        self.CSRGraph=networkx.CSRGraph
+        self.G=self.Graph()
+        self.G.add_edge('a','b',weight=2)
+        self.G.add_edge('b','c',weight=3)
+        self.G.add_edge('c','c')
+        self.G.add_node('d',color='red')
+
+    def test_read_api(self):
+        G=self.G
+        H=self.CSRGraph(G)
+        assert_equal(len(H),len(G))
+        assert_equal(sorted(H.nodes_iter()),sorted(G.nodes_iter()))
+        assert_equal(sorted(H.nodes(data=True)),sorted(G.nodes(data=True)))
+        assert_true('a' in H)
+        assert_false('z' in H)
+        assert_false({} in H)
+        assert_equal(sorted(H['b']),sorted(G['b']))
+        assert_equal(H['a']['b'],{'weight':2})
+        assert_equal(H.degree(),G.degree())
+        assert_equal(H.degree(weight='weight'),G.degree(weight='weight'))
+        assert_equal(H.number_of_edges(),G.number_of_edges())
+        assert_equal(H.number_of_selfloops(),1)
+        assert_true(H.has_edge('b','a'))
+        assert_false(H.has_edge('a','c'))
+        assert_equal(sorted(map(sorted,H.edges_iter())),
+                     sorted(map(sorted,G.edges_iter())))
+        assert_raises(networkx.NetworkXError,H.neighbors,'z')
+
+    def test_frozen(self):
+        H=self.CSRGraph(self.G)
+        assert_true(networkx.is_frozen(H))
+        assert_raises(networkx.NetworkXError,H.add_edge,1,2)
+        assert_raises(networkx.NetworkXError,H.add_edges_from,[(1,2)])
+        assert_raises(networkx.NetworkXError,H.remove_node,'a')
+        assert_raises(networkx.NetworkXError,H.clear)
+
+    def test_no_weight(self):
+        H=self.CSRGraph(self.G,weight=None)
+        assert_true(H.data is None)
+        assert_equal(H['a']['b'],{})
+        H=self.CSRGraph(self.Graph(networkx.path_graph(3)))
+        assert_true(H.data is None)
+
+    def test_nodelist(self):
+        H=self.CSRGraph(self.G,nodelist=['c','b'])
+        assert_equal(H.nodes(),['c','b'])
+        assert_equal(sorted(H.edges()),[('c','b'),('c','c')])
+        assert_raises(networkx.NetworkXError,self.CSRGraph,self.G,
+                      nodelist=['a','a'])
+
+    def test_edge_array(self):
+        H=self.CSRGraph((np.array([0,1,1]),np.array([1,2,0]),
+                         np.array([1.,2.,5.])))
+        assert_equal(H.nodes(),[0,1,2])
+        assert_equal(H.number_of_edges(),2)
+        # later duplicates update the edge data
+        assert_equal(H[0][1],{'weight':5.})
+        assert_equal(H[1][0],{'weight':5.})
+        H=self.CSRGraph([[0,1],[1,2]],nodelist=['x','y','z'])
+        assert_equal(sorted(H['y']),['x','z'])
+        assert_raises(networkx.NetworkXError,self.CSRGraph,[[0,3]],
+                      nodelist=['x','y'])
+
+    def test_scipy_sparse_matrix(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G=self.Graph(networkx.path_graph(4))
+        G.add_edge(1,2,weight=4)
+        A=networkx.to_scipy_sparse_matrix(G)
+        H=self.CSRGraph(A)
+        assert_equal(H.degree(weight='weight'),G.degree(weight='weight'))
+
+    def test_subgraph(self):
+        H=self.CSRGraph(self.G)
+        S=H.subgraph(['b','c','d'])
+        assert_true(isinstance(S,self.CSRGraph))
+        assert_equal(sorted(S),['b','c','d'])
+        assert_equal(sorted(map(sorted,S.edges())),[['b','c'],['c','c']])
+        assert_equal(S['b']['c'],{'weight':3})
+        assert_equal(S.node['d'],{'color':'red'})
+
+    def test_copy(self):
+        H=self.CSRGraph(self.G)
+        H.graph['foo']=[]
+        C=H.copy()
+        assert_true(C.indices is H.indices)
+        assert_equal(C.node['d'],{'color':'red'})
+        C.node['d']['color']='blue'
+        C.graph['foo'].append(1)
+        assert_equal(H.node['d'],{'color':'red'})
+        assert_equal(H.graph['foo'],[])
+        C=H.copy(attr='share')
+        assert_true(C.node['d'] is H.node['d'])
+
+    def test_edge_columns(self):
+        self.G.add_edge('a','b',capacity=7)
+        H=self.CSRGraph(self.G,weight=['weight','capacity','cost'])
+        assert_equal(sorted(H.edge_columns),['capacity','weight'])
+        assert_true(H.data is H.edge_columns['weight'])
+        assert_equal(H['a']['b'],{'weight':2,'capacity':7})
+        assert_equal(H['c']['c'],{})
+        assert_equal(H['b']['c'],{'weight':3})
+        assert_equal(H.edge_columns['capacity'][H.indptr[2]],1)
+        assert_equal(H.pred['b']['a'] if H.is_directed() else H['b']['a'],
+                     {'weight':2,'capacity':7})
+        assert_equal(networkx.get_edge_attributes(H,'capacity'),
+                     {('a','b'):7})
+        assert_equal(networkx.get_edge_attributes(H,'cost'),{})
+        networkx.set_edge_attributes(H,'capacity',{('b','c'):4})
+        assert_equal(H['b']['c']['capacity'],4)
+        assert_equal(H.pred['c']['b']['capacity'] if H.is_directed()
+                     else H['c']['b']['capacity'],4)
+        networkx.set_edge_attributes(H,'cost',2)
+        assert_equal(H['a']['b']['cost'],2)
+        networkx.set_edge_attributes(H,'cost',np.arange(len(H.indices)))
+        assert_equal(sorted(H.edge_columns['cost']),
+                     list(range(len(H.indices))))
+        assert_raises(networkx.NetworkXError,networkx.set_edge_attributes,
+                      H,'cost',{('a','d'):1})
+        assert_raises(networkx.NetworkXError,networkx.set_edge_attributes,
+                      H,'cost',[1,2])
+
+    def test_edge_data_frozen(self):
+        H=self.CSRGraph(self.G)
+        assert_raises(networkx.NetworkXError,H['a']['b'].__setitem__,
+                      'weight',5)
+        assert_raises(networkx.NetworkXError,H['a']['b'].update,{'x':1})
+        for u,v,d in H.edges(data=True):
+            assert_raises(networkx.NetworkXError,d.__setitem__,'weight',5)
+        d=H['a']['b'].copy()
+        d['weight']=5
+        assert_equal(H['a']['b']['weight'],2)
+        G=self.Graph(H)
+        G['a']['b']['weight']=5
+        assert_equal(G['a']['b'],{'weight':5})
+
+    def test_partial_edge_columns(self):
+        self.G.add_edge('a','b',capacity=7)
+        H=self.CSRGraph(self.G,weight=['weight','capacity'])
+        S=H.subgraph(['a','b','c'])
+        for K in [H,H.copy(),S]:
+            assert_equal(K['a']['b'],{'weight':2,'capacity':7})
+            assert_equal(K['b']['c'],{'weight':3})
+            assert_equal(sorted(K.edges(data=True)),
+                         sorted(self.G.edges(data=True)))
+        networkx.set_edge_attributes(H,'capacity',{('b','c'):4})
+        assert_equal(networkx.get_edge_attributes(H,'capacity'),
+                     {('a','b'):7,('b','c'):4})
+        networkx.set_edge_attributes(H,'cost',{('b','c'):1})
+        assert_equal(H['b']['c'],{'weight':3,'capacity':4,'cost':1})
+        assert_equal(H['a']['b'],{'weight':2,'capacity':7})
+        networkx.set_edge_attributes(H,'capacity',5)
+        assert_equal(H['c']['c'],{'capacity':5})
+
+    def test_partial_capacity_column(self):
+        G=self.Graph()
+        G.add_edge('s','a',capacity=3)
+        G.add_edge('a','t')
+        H=self.CSRGraph(G,weight='capacity')
+        assert_equal(networkx.maximum_flow_value(H,'s','t'),3)
+        assert_equal(networkx.maximum_flow_value(G,'s','t'),3)
+
+    def test_edge_columns_copy(self):
+        H=self.CSRGraph(self.G)
+        C=H.copy()
+        networkx.set_edge_attributes(C,'weight',{('a','b'):9})
+        assert_equal(C['a']['b']['weight'],9)
+        assert_equal(H['a']['b']['weight'],2)
+        C=H.copy(attr='share')
+        networkx.set_edge_attributes(C,'weight',{('a','b'):9})
+        assert_equal(H['a']['b']['weight'],9)
+
+    def test_edge_columns_array(self):
+        H=self.CSRGraph((np.array([0,1]),np.array([1,2]),
+                         np.array([1.,2.]),np.array([5.,6.])),
+                        weight=['weight','capacity'])
+        assert_equal(H[1][2],{'weight':2.,'capacity':6.})
+        assert_raises(networkx.NetworkXError,self.CSRGraph,
+                      [[0,1,2,3]],weight='weight')
+
+    def test_algorithms(self):
+        G=networkx.gnm_random_graph(50,200,seed=42)
+        for u,v in G.edges():
+            G[u][v]['weight']=(u+v)%5+1
+        H=self.CSRGraph(G)
+        assert_equal(networkx.single_source_dijkstra_path_length(H,0),
+                     networkx.single_source_dijkstra_path_length(G,0))
+        assert_equal(networkx.single_source_shortest_path_length(H,0),
+                     networkx.single_source_shortest_path_length(G,0))
+        assert_equal(sorted(map(sorted,networkx.connected_components(H))),
+                     sorted(map(sorted,networkx.connected_components(G))))
+
+    def test_weighted_algorithms(self):
+        directed=self.Graph().is_directed()
+        G=networkx.gnm_random_graph(50,200,seed=42,directed=directed)
+        for u,v in G.edges():
+            G[u][v]['weight']=(u+v)%5+1
+            G[u][v]['capacity']=(u*v)%4
+        H=self.CSRGraph(G,weight=['weight','capacity'])
+        pred,dist=networkx.dijkstra_predecessor_and_distance(H,0)
+        gpred,gdist=networkx.dijkstra_predecessor_and_distance(G,0)
+        assert_equal(dist,gdist)
+        assert_equal(dict((n,sorted(p)) for n,p in pred.items()),
+                     dict((n,sorted(p)) for n,p in gpred.items()))
+        dist,paths=networkx.single_source_dijkstra(H,0,cutoff=4)
+        assert_equal(dist,networkx.single_source_dijkstra_path_length(G,0,4))
+        for n,path in paths.items():
+            assert_equal(path[0],0)
+            assert_equal(sum(G[u][v]['weight']
+                             for u,v in zip(path,path[1:])),dist[n])
+        assert_equal(networkx.single_source_dijkstra_path_length(H,0,
+                                                                 weight='x'),
+                     networkx.single_source_shortest_path_length(G,0))
+        assert_equal(networkx.maximum_flow_value(H,0,1,capacity='capacity'),
+                     networkx.maximum_flow_value(G,0,1,capacity='capacity'))
+        if not directed:
+            T=networkx.minimum_spanning_tree(H)
+            assert_equal(sorted(T),sorted(G))
+            assert_equal(T.size(weight='weight'),
+                         networkx.minimum_spanning_tree(G).size(
+                             weight='weight'))
+            for u,v,d in T.edges(data=True):
+                assert_equal(d,H[u][v])
+
+
+class TestCSRDiGraph(TestCSRGraph):
+    def setUp(self):
+        self.Graph=networkx.DiGraph
+        self.CSRGraph=networkx.CSRDiGraph
+        self.G=self.Graph()
+        self.G.add_edge('a','b',weight=2)
+        self.G.add_edge('b','c',weight=3)
+        self.G.add_edge('c','c')
+        self.G.add_node('d',color='red')
+
+    def test_read_api(self):
+        G=self.G
+        H=self.CSRGraph(G)
+        assert_equal(sorted(H.edges()),sorted(G.edges()))
+        assert_equal(H.successors('b'),['c'])
+        assert_equal(H.predecessors('b'),['a'])
+        assert_equal(H.in_degree(),G.in_degree())
+        assert_equal(H.out_degree(weight='weight'),
+                     G.out_degree(weight='weight'))
+        assert_equal(H.number_of_edges(),3)
+        assert_true(H.has_successor('a','b'))
+        assert_false(H.has_successor('b','a'))
+
+    def test_edge_array(self):
+        H=self.CSRGraph((np.array([0,1,1]),np.array([1,2,0])))
+        assert_equal(sorted(H.edges()),[(0,1),(1,0),(1,2)])
+        assert_equal(H.predecessors(0),[1])
+
+    def test_nodelist(self):
+        H=self.CSRGraph(self.G,nodelist=['c','b'])
+        assert_equal(sorted(H.edges()),[('b','c'),('c','c')])
+
+    def test_subgraph(self):
+        H=self.CSRGraph(self.G)
+        S=H.subgraph(['a','b'])
+        assert_equal(S.edges(data=True),[('a','b',{'weight':2})])
+        assert_equal(S.predecessors('b'),['a'])
+
+    def test_reverse(self):
+        H=self.CSRGraph(self.G)
+        R=H.reverse()
+        assert_equal(sorted(R.edges()),
+                     sorted((v,u) for u,v in self.G.edges()))
+        assert_true(R.indices is H.pred._indices)
+        assert_equal(sorted(H.edges()),sorted(self.G.edges()))
+
+    def test_reverse_partial_edge_columns(self):
+        self.G.add_edge('a','b',capacity=7)
+        R=self.CSRGraph(self.G,weight=['weight','capacity']).reverse()
+        assert_equal(R['b']['a'],{'weight':2,'capacity':7})
+        assert_equal(R['c']['b'],{'weight':3})
+        assert_equal(R.pred['b']['c'],{'weight':3})
+
+    def test_reverse_edge_columns(self):
+        G=networkx.gnm_random_graph(30,120,seed=1,directed=True)
+        for u,v in G.edges():
+            G[u][v]['weight']=u*100+v
+        R=self.CSRGraph(G).reverse()
+        for u,v,d in R.edges(data=True):
+            assert_equal(d['weight'],v*100+u)
+            assert_equal(R.pred[v][u],d)
+
+    def test_algorithms(self):
+        G=networkx.gnm_random_graph(50,200,seed=42,directed=True)
+        H=self.CSRGraph(G)
+        p=networkx.pagerank(G)
+        q=networkx.pagerank(H)
+        for n in G:
+            assert_almost_equal(p[n],q[n])
+        assert_equal(sorted(map(sorted,
+                                networkx.strongly_connected_components(H))),
+                     sorted(map(sorted,
+                                networkx.strongly_connected_components(G))))
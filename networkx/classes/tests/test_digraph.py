@@ -242,6 +242,15 @@ class TestDiGraph(BaseAttrDiGraphTester,TestGraph):
         assert_raises(networkx.NetworkXError, G.add_edges_from,[(0,1,2,3)])  # too many in tuple
         assert_raises(TypeError, G.add_edges_from,[0])  # not a tuple
 
+    def test_add_edges_from_arrays(self):
+        G=self.Graph()
+        G.add_edges_from_arrays([0,0,0],[1,2,1],data=[2,3,4])
+        assert_equal(G.succ,{0: {1: {'data':4}, 2: {'data':3}}, 1: {}, 2: {}})
+        assert_equal(G.pred,{0: {}, 1: {0: {'data':4}}, 2: {0: {'data':3}}})
+        assert_true(G.succ[0][1] is G.pred[1][0])
+        assert_raises(networkx.NetworkXError,
+                      G.add_edges_from_arrays,[0],[1,2])
+
     def test_remove_edge(self):
         G=self.K3
         G.remove_edge(0,1)
@@ -234,6 +234,18 @@ class BaseAttrGraphTester(BaseGraphTester):
         H=G.__class__(G) # just copy
         self.is_shallow_copy(H,G)
 
+    def test_copy_modes(self):
+        G=self.K3
+        self.add_attributes(G)
+        self.is_deepcopy(G.copy(attr='deep'),G)
+        self.is_shallow_copy(G.copy(attr='shallow'),G)
+        H=G.copy(attr='share')
+        self.graphs_equal(H,G)
+        self.same_attrdict(H,G)
+        H.add_edge(5,6)
+        assert_false(G.has_node(5))
+        assert_raises(networkx.NetworkXError,G.copy,attr='bogus')
+
     def is_deepcopy(self,H,G):
         self.graphs_equal(H,G)
         self.different_attrdict(H,G)
@@ -573,6 +585,24 @@ class TestGraph(BaseAttrGraphTester):
                       G.add_edges_from,[(0,1,2,3)])  # too many in tuple
         assert_raises(TypeError, G.add_edges_from,[0])  # not a tuple
 
+    def test_add_edges_from_arrays(self):
+        import array
+        G=self.Graph()
+        G.add_edges_from_arrays(array.array('i',[0,0]),[1,2],weight=[3,4])
+        assert_equal(G.adj,{0: {1:{'weight':3}, 2:{'weight':4}},
+                            1: {0:{'weight':3}}, 2: {0:{'weight':4}}})
+        G.add_edges_from_arrays([2,1],[0,1],{'data':[5,6]})
+        assert_equal(G.adj,{0: {1:{'weight':3}, 2:{'weight':4,'data':5}},
+                            1: {0:{'weight':3}, 1:{'data':6}},
+                            2: {0:{'weight':4,'data':5}}})
+        assert_true(G[0][2] is G[2][0])
+        assert_raises(networkx.NetworkXError,
+                      G.add_edges_from_arrays,[0],[1,2])
+        assert_raises(networkx.NetworkXError,
+                      G.add_edges_from_arrays,[0],[1],weight=[1,2])
+        assert_raises(networkx.NetworkXError,
+                      G.add_edges_from_arrays,[0],[1],attr_dict=5)
+
 
     def test_remove_edge(self):
         G=self.K3
@@ -195,6 +195,15 @@ class TestMultiGraph(BaseMultiGraphTester,TestGraph):
         assert_raises(networkx.NetworkXError, G.add_edges_from,[(0,1,2,3,4)])
         assert_raises(TypeError, G.add_edges_from,[0])  # not a tuple
 
+    def test_add_edges_from_arrays(self):
+        G=self.Graph()
+        G.add_edges_from_arrays([0,0,0],[1,1,1],weight=[1,2,3])
+        assert_equal(sorted(G.edges(keys=True,data=True)),
+                     [(0,1,0,{'weight':1}),(0,1,1,{'weight':2}),
+                      (0,1,2,{'weight':3})])
+        assert_raises(networkx.NetworkXError,
+                      G.add_edges_from_arrays,[0],[1,2])
+
 
     def test_remove_edge(self):
         G=self.K3
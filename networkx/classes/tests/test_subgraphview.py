@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from nose.tools import *
+import networkx as nx
+
+
+class TestSubGraphView(object):
+    def setUp(self):
+        self.G=nx.path_graph(6)
+        self.G.add_edge(2,2,weight=3)
+        self.G.node[1]['color']='red'
+        self.G.graph['name']='path'
+
+    def test_induced(self):
+        H=nx.SubGraphView(self.G,[0,1,2,3,9])
+        assert_equal(sorted(H.nodes()),[0,1,2,3])
+        assert_equal(len(H),4)
+        assert_true(2 in H)
+        assert_false(4 in H)
+        assert_false(9 in H)
+        assert_equal(sorted(H[3]),[2])
+        assert_equal(H.degree(),{0:1,1:2,2:4,3:1})
+        assert_equal(H.number_of_edges(),4)
+        assert_equal(H.selfloop_edges(data='weight'),[(2,2,3)])
+        assert_true(H.has_edge(2,3))
+        assert_false(H.has_edge(3,4))
+        assert_raises(nx.NetworkXError,H.neighbors,4)
+        assert_equal(H.name,'path')
+
+    def test_filters(self):
+        H=nx.SubGraphView(self.G,filter_node=lambda n: n!=3,
+                          filter_edge=lambda u,v: u!=v)
+        assert_equal(sorted(H.nodes()),[0,1,2,4,5])
+        assert_equal(sorted(map(sorted,H.edges())),[[0,1],[1,2],[4,5]])
+        H=nx.SubGraphView(self.G,[1,2,3],filter_node=lambda n: n!=3)
+        assert_equal(sorted(H.nodes()),[1,2])
+
+    def test_shares_data(self):
+        H=nx.SubGraphView(self.G,[0,1,2])
+        assert_true(H.node[1] is self.G.node[1])
+        assert_true(H[1][2] is self.G[1][2])
+        assert_true(H.graph is self.G.graph)
+        H[0][1]['weight']=7
+        assert_equal(self.G[0][1]['weight'],7)
+        self.G.add_edge(0,2)
+        assert_true(H.has_edge(0,2))
+        self.G.remove_node(1)
+        assert_equal(sorted(H.nodes()),[0,2])
+
+    def test_frozen(self):
+        H=nx.SubGraphView(self.G,[0,1])
+        assert_true(nx.is_frozen(H))
+        assert_raises(nx.NetworkXError,H.add_edge,0,1)
+        assert_raises(nx.NetworkXError,H.remove_node,0)
+        assert_raises(nx.NetworkXError,H.add_path,[0,1,2])
+
+    def test_copy(self):
+        H=nx.SubGraphView(self.G,[1,2,3])
+        C=H.copy()
+        assert_equal(type(C),type(self.G))
+        assert_equal(sorted(C.edges(data=True)),
+                     sorted(H.edges(data=True)))
+        assert_equal(C.node[1],{'color':'red'})
+        assert_false(C.node[1] is self.G.node[1])
+        C.add_edge(1,10)
+        assert_false(10 in self.G)
+
+    def test_subgraph(self):
+        H=nx.SubGraphView(self.G,[0,1,2,3])
+        S=H.subgraph([0,1,4])
+        assert_equal(sorted(S.nodes()),[0,1])
+        assert_equal(S.edges(),[(0,1)])
+
+    def test_algorithms(self):
+        H=nx.SubGraphView(self.G,[0,1,2,4,5])
+        assert_equal(sorted(map(sorted,nx.connected_components(H))),
+                     [[0,1,2],[4,5]])
+        assert_equal(nx.shortest_path(H,0,2),[0,1,2])
+        assert_equal(sorted(H.to_directed().edges()),
+                     [(0,1),(1,0),(1,2),(2,1),(2,2),(4,5),(5,4)])
+
+
+class TestSubDiGraphView(object):
+    def setUp(self):
+        self.G=nx.DiGraph([(0,1),(1,2),(2,0),(2,3)])
+
+    def test_directed(self):
+        H=nx.subgraph_view(self.G,filter_edge=lambda u,v: u!=2)
+        assert_true(isinstance(H,nx.SubDiGraphView))
+        assert_equal(sorted(H.edges()),[(0,1),(1,2)])
+        assert_equal(H.predecessors(0),[])
+        assert_equal(H.in_degree(),{0:0,1:1,2:1,3:0})
+        assert_equal(H.out_degree(),{0:1,1:1,2:0,3:0})
+        assert_equal(sorted(H.reverse().edges()),[(1,0),(2,1)])
+        assert_raises(nx.NetworkXError,H.reverse,copy=False)
+        assert_equal(sorted(H.to_undirected().edges()),[(0,1),(1,2)])
+
+    def test_components(self):
+        H=nx.SubDiGraphView(self.G,[0,1,2])
+        assert_equal(sorted(map(sorted,
+                                nx.strongly_connected_components(H))),
+                     [[0,1,2]])
+
+
+class TestSubMultiGraphView(object):
+    def test_multigraph(self):
+        G=nx.MultiGraph([(0,1),(0,1),(1,2)])
+        H=nx.subgraph_view(G,filter_edge=lambda u,v,k: k==0)
+        assert_true(isinstance(H,nx.SubMultiGraphView))
+        assert_equal(H.number_of_edges(),2)
+        assert_equal(sorted(H.edges(keys=True)),[(0,1,0),(1,2,0)])
+        H=nx.subgraph_view(G,[0,1])
+        assert_equal(H.number_of_edges(0,1),2)
+        C=H.copy()
+        assert_equal(type(C),nx.MultiGraph)
+        assert_equal(C.number_of_edges(),2)
+
+    def test_multidigraph(self):
+        G=nx.MultiDiGraph([(0,1),(0,1),(1,2)])
+        H=nx.subgraph_view(G,filter_edge=lambda u,v,k: k==1)
+        assert_true(isinstance(H,nx.SubMultiDiGraphView))
+        assert_equal(H.edges(keys=True),[(0,1,1)])
+        assert_equal(sorted(H.pred[1]),[0])
+        assert_equal(sorted(H.pred[2]),[])
+        assert_equal(H.reverse().edges(keys=True),[(1,0,1)])
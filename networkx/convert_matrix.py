@@ -27,7 +27,6 @@ nx_pygraphviz, nx_pydot
 #    All rights reserved.
 #    BSD license.
 import warnings
-import itertools
 import networkx as nx
 from networkx.convert import _prep_create_using
 from networkx.utils import not_implemented_for
@@ -129,11 +128,9 @@ def from_pandas_dataframe(df, source, target, edge_attr=None,
     zero or more columns of node attributes. Each row will be processed as one
     edge instance.
 
-    Note: This function iterates over DataFrame.values, which is not
-    guaranteed to retain the data type across columns in the row. This is only
-    a problem if your row is entirely numeric and a mix of ints and floats. In
-    that case, all values will be returned as floats. See the
-    DataFrame.iterrows documentation for an example.
+    The edges are added column-wise with ``add_edges_from_arrays``, so each
+    edge attribute keeps the data type of its column, converted to the
+    corresponding Python type.
 
     Parameters
     ----------
@@ -206,15 +203,13 @@ def from_pandas_dataframe(df, source, target, edge_attr=None,
         else:
             edge_i = [(edge_attr, df.columns.get_loc(edge_attr)),]
 
-        # Iteration on values returns the rows as Numpy arrays
-        for row in df.values:
-            g.add_edge(row[src_i], row[tar_i], {i:row[j] for i, j in edge_i})
-    
+        attr_dict = dict((i, df.iloc[:, j]) for i, j in edge_i)
     # If no column names are given, then just return the edges.
     else:
-        for row in df.values:
-            g.add_edge(row[src_i], row[tar_i])
+        attr_dict = None
 
+    # Add all edges at once from the columns
+    g.add_edges_from_arrays(df.iloc[:, src_i], df.iloc[:, tar_i], attr_dict)
     return g
 
 def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
@@ -493,46 +488,36 @@ def from_numpy_matrix(A, parallel_edges=False, create_using=None):
 
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
-    # Get a list of all the entries in the matrix with nonzero entries. These
-    # coordinates will become the edges in the graph.
-    edges = zip(*(np.asarray(A).nonzero()))
+    # Get the coordinates of all the entries in the matrix with nonzero
+    # entries. These coordinates will become the edges in the graph.
+    A = np.asarray(A)
+    u, v = A.nonzero()
+    # If we are creating an undirected multigraph, only add the edges from the
+    # upper triangle of the matrix. Otherwise, add all the edges.
+    #
+    # Without this check, we run into a problem where each edge is added twice
+    # when ``G.add_edges_from_arrays()`` is invoked below.
+    if G.is_multigraph() and not G.is_directed():
+        upper = u <= v
+        u, v = u[upper], v[upper]
+    values = A[u, v]
     # handle numpy constructed data type
     if python_type is 'void':
-        # Sort the fields by their offset, then by dtype, then by name.
-        fields = sorted((offset, dtype, name) for name, (dtype, offset) in
-                        A.dtype.fields.items())
-        triples = ((u, v, {name: kind_to_python_type[dtype.kind](val)
-                           for (_, dtype, name), val in zip(fields, A[u, v])})
-                   for u, v in edges)
+        attr_dict = dict((name, [kind_to_python_type[dtype.kind](val)
+                                 for val in values[name].tolist()])
+                         for name, (dtype, offset) in A.dtype.fields.items())
     # If the entries in the adjacency matrix are integers, the graph is a
     # multigraph, and parallel_edges is True, then create parallel edges, each
     # with weight 1, for each entry in the adjacency matrix. Otherwise, create
     # one edge for each positive entry in the adjacency matrix and set the
     # weight of that edge to be the entry in the matrix.
     elif python_type is int and G.is_multigraph() and parallel_edges:
-        chain = itertools.chain.from_iterable
-        # The following line is equivalent to:
-        #
-        #     for (u, v) in edges:
-        #         for d in range(A[u, v]):
-        #             G.add_edge(u, v, weight=1)
-        #
-        triples = chain(((u, v, dict(weight=1)) for d in range(A[u, v]))
-                        for (u, v) in edges)
+        counts = np.maximum(values, 0)
+        u, v = np.repeat(u, counts), np.repeat(v, counts)
+        attr_dict = {'weight': [1] * len(u)}
     else:  # basic data type
-        triples = ((u, v, dict(weight=python_type(A[u, v])))
-                   for u, v in edges)
-    # If we are creating an undirected multigraph, only add the edges from the
-    # upper triangle of the matrix. Otherwise, add all the edges. This relies
-    # on the fact that the vertices created in the
-    # ``_generated_weighted_edges()`` function are actually the row/column
-    # indices for the matrix ``A``.
-    #
-    # Without this check, we run into a problem where each edge is added twice
-    # when ``G.add_edges_from()`` is invoked below.
-    if G.is_multigraph() and not G.is_directed():
-        triples = ((u, v, d) for u, v, d in triples if u <= v)
-    G.add_edges_from(triples)
+        attr_dict = {'weight': [python_type(val) for val in values.tolist()]}
+    G.add_edges_from_arrays(u, v, attr_dict)
     return G
 
 
@@ -787,6 +772,31 @@ def _generate_weighted_edges(A):
     return _coo_gen_triples(A.tocoo())
 
 
+def _weighted_edge_arrays(A):
+    """Returns arrays (u, v, w) of the row indices, column indices and
+    values of the entries of the SciPy sparse matrix `A`.
+
+    The entries are in the same order as in ``_generate_weighted_edges(A)``.
+
+    """
+    import numpy as np
+    if A.format == 'csr':
+        rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        return rows, A.indices, A.data
+    if A.format == 'csc':
+        cols = np.repeat(np.arange(A.shape[1]), np.diff(A.indptr))
+        return A.indices, cols, A.data
+    if A.format == 'dok':
+        items = list(A.items())
+        u = np.array([r for (r, c), d in items], dtype=int)
+        v = np.array([c for (r, c), d in items], dtype=int)
+        w = np.array([d for (r, c), d in items], dtype=A.dtype)
+        return u, v, w
+    # If A is in any other format (including COO), convert it to COO format.
+    A = A.tocoo()
+    return A.row, A.col, A.data
+
+
 def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
                              edge_attribute='weight'):
     """Creates a new graph from an adjacency matrix given as a SciPy sparse
@@ -852,6 +862,7 @@ def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
     {0: {'weight': 1}, 1: {'weight': 1}}
 
     """
+    import numpy as np
     G = _prep_create_using(create_using)
     n,m = A.shape
     if n != m:
@@ -859,34 +870,29 @@ def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
               "Adjacency matrix is not square. nx,ny=%s"%(A.shape,))
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
-    # Create an iterable over (u, v, w) triples and for each triple, add an
-    # edge from u to v with weight w.
-    triples = _generate_weighted_edges(A)
+    # Get arrays of the row and column indices and the values of the entries
+    # of the matrix.
+    u, v, w = _weighted_edge_arrays(A)
+    # If we are creating an undirected multigraph, only add the edges from the
+    # upper triangle of the matrix. Otherwise, add all the edges. This relies
+    # on the fact that the vertices are the row/column indices for the
+    # matrix ``A``.
+    #
+    # Without this check, we run into a problem where each edge is added twice
+    # when `G.add_edges_from_arrays()` is invoked below.
+    if G.is_multigraph() and not G.is_directed():
+        upper = u <= v
+        u, v, w = u[upper], v[upper], w[upper]
     # If the entries in the adjacency matrix are integers, the graph is a
     # multigraph, and parallel_edges is True, then create parallel edges, each
     # with weight 1, for each entry in the adjacency matrix. Otherwise, create
     # one edge for each positive entry in the adjacency matrix and set the
     # weight of that edge to be the entry in the matrix.
     if A.dtype.kind in ('i', 'u') and G.is_multigraph() and parallel_edges:
-        chain = itertools.chain.from_iterable
-        # The following line is equivalent to:
-        #
-        #     for (u, v) in edges:
-        #         for d in range(A[u, v]):
-        #             G.add_edge(u, v, weight=1)
-        #
-        triples = chain(((u, v, 1) for d in range(w)) for (u, v, w) in triples)
-    # If we are creating an undirected multigraph, only add the edges from the
-    # upper triangle of the matrix. Otherwise, add all the edges. This relies
-    # on the fact that the vertices created in the
-    # ``_generated_weighted_edges()`` function are actually the row/column
-    # indices for the matrix ``A``.
-    #
-    # Without this check, we run into a problem where each edge is added twice
-    # when `G.add_weighted_edges_from()` is invoked below.
-    if G.is_multigraph() and not G.is_directed():
-        triples = ((u, v, d) for u, v, d in triples if u <= v)
-    G.add_weighted_edges_from(triples, weight=edge_attribute)
+        counts = np.maximum(w, 0)
+        u, v = np.repeat(u, counts), np.repeat(v, counts)
+        w = [1] * len(u)
+    G.add_edges_from_arrays(u, v, {edge_attribute: w})
     return G
 
 
@@ -13,7 +13,8 @@ __all__ = ['ego_graph']
 
 import networkx as nx
 
-def ego_graph(G,n,radius=1,center=True,undirected=False,distance=None):
+def ego_graph(G,n,radius=1,center=True,undirected=False,distance=None,
+              copy=True):
     """Returns induced subgraph of neighbors centered at node n within
     a given radius.
     
@@ -39,6 +40,11 @@ def ego_graph(G,n,radius=1,center=True,undirected=False,distance=None):
       distance='weight' will use the edge weight to measure the
       distance from the node n.
 
+    copy : bool, optional
+      If True (default) return an independent copy of the ego graph.
+      If False return a read-only view of G (see subgraph_view), which
+      is created without copying any edges.
+
     Notes
     -----
     For directed graphs D this produces the "out" neighborhood
@@ -46,7 +52,8 @@ def ego_graph(G,n,radius=1,center=True,undirected=False,distance=None):
     first reverse the graph with D.reverse().  If you want both
     directions use the keyword argument undirected=True.
 
-    Node, edge, and graph attributes are copied to the returned subgraph.
+    Node, edge, and graph attributes are copied to the returned subgraph
+    unless copy is False.
     """
     if undirected:
         if distance is not None:
@@ -64,6 +71,10 @@ def ego_graph(G,n,radius=1,center=True,undirected=False,distance=None):
         else:
             sp=nx.single_source_shortest_path_length(G,n,cutoff=radius)
 
+    if not copy:
+        if center:
+            return nx.subgraph_view(G, sp)
+        return nx.subgraph_view(G, (v for v in sp if v != n))
     H=G.subgraph(sp).copy()
     if not center:
         H.remove_node(n)
@@ -25,6 +25,16 @@ class TestGeneratorEgo():
         H=nx.ego_graph(G,0,center=False)
         assert_equal(H.edges(), [])
 
+    def test_ego_view(self):
+        G=nx.path_graph(4)
+        H=nx.ego_graph(G,1,copy=False)
+        assert_equal(sorted(map(sorted,H.edges())), [[0, 1], [1, 2]])
+        G[0][1]['weight']=3
+        assert_equal(H[1][0]['weight'], 3)
+        H=nx.ego_graph(G,1,center=False,copy=False)
+        assert_equal(sorted(H.nodes()), [0, 2])
+        assert_equal(H.edges(), [])
+
 
     def test_ego_distance(self):
         G=nx.Graph()                                                            
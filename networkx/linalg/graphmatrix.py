@@ -8,6 +8,7 @@ Adjacency matrix and incidence matrix of graphs.
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.classes.csrgraph import _cache
 __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Pieter Swart (swart@lanl.gov)',
                         'Dan Schult(dschult@colgate.edu)'])
@@ -161,6 +162,47 @@ def adjacency_matrix(G, nodelist=None, weight='weight'):
 
 adj_matrix=adjacency_matrix
 
+
+def _adjacency_operator(G, weight='weight', dtype=float):
+    """Return the nodes of G and the adjacency matrix of G as a SciPy CSR
+    matrix with the given dtype, in the order of the nodes.
+
+    This is the matrix of adjacency_matrix(G, weight=weight).  The
+    solvers that only multiply by it share it through the cache of a
+    CSRGraph, which keeps it while the graph is unchanged.
+    """
+    import numpy as np
+    import scipy.sparse
+    cache = _cache(G)
+    key = ('adjacency', weight, np.dtype(dtype).str)
+    if cache is not None and key in cache:
+        return cache[key]
+    nodelist = G.nodes()
+    if cache is not None:
+        n = len(nodelist)
+        data = G.edge_columns.get(weight) if weight is not None else None
+        if data is None:
+            data = np.ones(len(G.indices))
+        A = scipy.sparse.csr_matrix((np.asarray(data, dtype=dtype),
+                                     G.indices, G.indptr), shape=(n, n))
+        cache[key] = (nodelist, A)
+    else:
+        A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                      dtype=dtype)
+    return nodelist, A
+
+
+def _block_size(n):
+    """Return the number of vectors of length n to multiply at once by a
+    sparse matrix.
+
+    The product of a sparse matrix with a dense block of vectors is
+    faster per vector than with one vector only while the block stays in
+    the cache, so blocks hold about 2**18 values, and at most 64 vectors.
+    """
+    return max(1, min(64, 2 ** 18 // max(n, 1)))
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -205,3 +205,43 @@ def convert_node_labels_to_integers(G, first_label=0, ordering="default",
         nx.set_node_attributes(H, label_attribute,
                                dict((v,k) for k,v in mapping.items()))
     return H
+
+
+def _integer_relabeled(G):
+    """Return a graph with the structure of G and nodes 0..n-1.
+
+    Node i of the new graph is the i-th node of G.nodes() and the
+    neighbors of each node are kept in the order of G.  Unlike
+    convert_node_labels_to_integers() the graph, node and edge attribute
+    dicts are shared with G, so the new graph must only be read.
+
+    Returns
+    -------
+    H : graph
+       A Graph, DiGraph, MultiGraph or MultiDiGraph matching G.
+
+    labels : list
+       The nodes of G; node i of H is labels[i].
+
+    index : dict
+       The mapping from the nodes of G to the nodes of H.
+    """
+    labels = G.nodes()
+    index = dict(zip(labels, range(len(labels))))
+    if G.is_multigraph():
+        H = nx.MultiDiGraph() if G.is_directed() else nx.MultiGraph()
+    else:
+        H = nx.DiGraph() if G.is_directed() else nx.Graph()
+    H.graph = G.graph
+    H.node = dict((i, G.node[n]) for i, n in enumerate(labels))
+
+    def relabel_adj(adj):
+        return dict((i, dict((index[v], d) for v, d in adj[n].items()))
+                    for i, n in enumerate(labels))
+
+    if G.is_directed():
+        H.succ = H.adj = H.edge = relabel_adj(G.succ)
+        H.pred = relabel_adj(G.pred)
+    else:
+        H.adj = H.edge = relabel_adj(G.adj)
+    return H, labels, index
@@ -82,8 +82,8 @@ if __name__ == "__main__":
 #            'SpecialGraph','SpecialDiGraph','SpecialMultiGraph','SpecialMultiDiGraph']
 #    classes=['Graph','SpecialGraph']
     all_tests=['add_nodes','add_edges','remove_nodes','remove_edges',\
-            'neighbors','edges','degree','dijkstra','shortest path',\
-            'subgraph','edgedata_subgraph','laplacian']
+            'neighbors','edges','degree','dijkstra','dijkstra methods',\
+            'shortest path','subgraph','edgedata_subgraph','laplacian']
     # Choose which tests to run
     tests=all_tests
 #    tests=['edges','laplacian']
@@ -153,6 +153,16 @@ if __name__ == "__main__":
         b=Benchmark(classes,title,test_string,runs=3,reps=10)
         b.run()
 
+    if 'dijkstra methods' in tests:
+        N=500
+        p=0.3
+        setup='import random\ni=6\nrandom.seed(1)\nH=NX.binomial_graph(%s,%s)\nfor (u,v) in H.edges_iter():\n G.add_edge(u,v,weight=random.randint(1,20))'%(N,p)
+        for method in ['heap','dial','radix']:
+            title='dijkstra single source shortest path, method=%r'%method
+            test_string=('p=NX.single_source_dijkstra(G,i,method=%r)'%method,setup)
+            b=Benchmark(classes,title,test_string,runs=3,reps=10)
+            b.run()
+
     if 'shortest path' in tests:
         N=500
         p=0.3
@@ -238,3 +238,16 @@ class TestConvertNumpy(object):
         expected = nx.MultiGraph()
         expected.add_edge(0, 1, weight=1)
         assert_graphs_equal(G, expected)
+
+    def test_python_types(self):
+        """Tests that nodes and weights from
+        :func:`networkx.from_scipy_sparse_matrix` are Python objects for
+        all sparse formats.
+
+        """
+        A = sparse.csr_matrix([[0, 2.5], [2.5, 0]])
+        for fmt in ('csr', 'csc', 'coo', 'dok', 'lil'):
+            G = nx.from_scipy_sparse_matrix(A.asformat(fmt))
+            assert_equal(G.edges(data=True), [(0, 1, {'weight': 2.5})])
+            assert_equal(type(list(G[0])[0]), int)
+            assert_equal(type(G[0][1]['weight']), float)
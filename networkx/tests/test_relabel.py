@@ -92,6 +92,23 @@ class TestRelabel():
         G = nx.Graph()
         H=convert_node_labels_to_integers(G,ordering="increasing age")
 
+    def test_integer_relabeled(self):
+        from networkx.relabel import _integer_relabeled
+        G=nx.MultiDiGraph()
+        G.add_edge('b','a',weight=2)
+        G.add_edge('a','c')
+        G.add_node('d',color='red')
+        H,labels,index=_integer_relabeled(G)
+        assert_true(H.is_directed() and H.is_multigraph())
+        assert_equal(labels,G.nodes())
+        assert_equal(H.nodes(),list(range(4)))
+        assert_equal([index[n] for n in labels],list(range(4)))
+        assert_true(H[index['b']][index['a']][0] is G['b']['a'][0])
+        assert_equal(H.predecessors(index['a']),[index['b']])
+        assert_true(H.node[index['d']] is G.node['d'])
+        for n in G:
+            assert_equal([labels[v] for v in H[index[n]]],list(G[n]))
+
 
     def test_relabel_nodes_copy(self):
         G=empty_graph()
@@ -1,6 +1,10 @@
 import sys
 
 from collections import defaultdict
+try:
+    from inspect import getfullargspec as _getargspec
+except ImportError:
+    from inspect import getargspec as _getargspec
 from os.path import splitext
 
 import networkx as nx
@@ -10,6 +14,7 @@ from networkx.utils import is_string_like
 __all__ = [
     'not_implemented_for',
     'open_file',
+    'integer_fastpath',
 ]
 
 def not_implemented_for(*graph_types):
@@ -225,3 +230,134 @@ def open_file(path_arg, mode='r'):
         return result
 
     return _open_file
+
+
+# To map the results of a new kind of algorithm back to the original node
+# labels, define a function accepting the `result` on integer nodes and the
+# list of node `labels`.
+def _node_dict(result, labels):
+    try:
+        items = result.items()
+    except AttributeError:
+        # a single value, e.g. closeness_centrality(G, u)
+        return result
+    return dict((labels[n], v) for n, v in items)
+
+def _node_dict_of_dicts(result, labels):
+    return dict((labels[n], dict((labels[m], v) for m, v in d.items()))
+                for n, d in result.items())
+
+def _path_dict(result, labels):
+    return dict((labels[n], [labels[m] for m in path])
+                for n, path in result.items())
+
+def _path_dict_of_dicts(result, labels):
+    return dict((labels[n], _path_dict(paths, labels))
+                for n, paths in result.items())
+
+def _edge_dict(result, labels):
+    return dict(((labels[u], labels[v]), x) for (u, v), x in result.items())
+
+def _node_set_iter(result, labels):
+    return (set(labels[n] for n in c) for c in result)
+
+def _edge_iter(result, labels):
+    return ((labels[u], labels[v]) for u, v in result)
+
+_fastpath_results = {
+    'node_dict': _node_dict,
+    'node_dict_of_dicts': _node_dict_of_dicts,
+    'path_dict': _path_dict,
+    'path_dict_of_dicts': _path_dict_of_dicts,
+    'edge_dict': _edge_dict,
+    'node_set_iter': _node_set_iter,
+    'edge_iter': _edge_iter,
+}
+
+def integer_fastpath(result, *node_args):
+    """Decorator to optionally run an algorithm on integer node labels.
+
+    When the decorated function is called with ``fastpath=True`` the
+    graph (the first argument) is relabeled once to the integers
+    0..n-1, the algorithm runs on the relabeled graph and its result is
+    mapped back to the original node labels.  Hashing small integers is
+    much cheaper than hashing strings or tuples, so this speeds up
+    algorithms that look up many nodes, such as betweenness centrality.
+
+    Parameters
+    ----------
+    result : string
+        The kind of result returned by the function, one of
+        'node_dict' (dict keyed by node), 'node_dict_of_dicts' (dict of
+        dicts keyed by node), 'path_dict' (dict of node lists keyed by
+        node), 'path_dict_of_dicts', 'edge_dict' (dict keyed by node
+        pairs), 'node_set_iter' (iterator of node sets) or 'edge_iter'
+        (iterator of node pairs).
+    node_args : strings
+        Names of the arguments that hold a single node (or None).
+
+    Returns
+    -------
+    _integer_fastpath : function
+        The decorated function.
+
+    Notes
+    -----
+    The decorated function must have a ``fastpath`` argument, which
+    it ignores.  The relabeled graph shares the attribute dicts of the
+    original graph, so the function must not modify the graph.
+
+    The relabeling takes time linear in the size of the graph, about as
+    long as one search, so it pays off for algorithms that visit the
+    graph many times, such as betweenness and all-pairs shortest paths.
+    For a single search, such as a traversal or a single-source shortest
+    path, it only pays off for node labels that are slow to hash, such
+    as long tuples.
+
+    Examples
+    --------
+    Decorate functions like this::
+
+       @integer_fastpath('node_dict', 'source')
+       def sp_function(G, source, fastpath=False):
+           pass
+
+    See Also
+    --------
+    convert_node_labels_to_integers
+    """
+    try:
+        map_result = _fastpath_results[result]
+    except KeyError:
+        raise nx.NetworkXError('Unknown fastpath result: %s' % result)
+
+    argnames = {}
+
+    @decorator
+    def _integer_fastpath(func, *args, **kwargs):
+        # Since we have used @decorator, *args holds every named argument
+        # of func, with default values filled in (see open_file).
+        try:
+            names = argnames[func]
+        except KeyError:
+            names = argnames[func] = _getargspec(func)[0]
+        fast = names.index('fastpath')
+        if not args[fast]:
+            return func(*args, **kwargs)
+        from networkx.relabel import _integer_relabeled
+        H, labels, index = _integer_relabeled(args[0])
+        new_args = list(args)
+        new_args[0] = H
+        new_args[fast] = False
+        for name in node_args:
+            i = names.index(name)
+            if args[i] is None:
+                continue
+            try:
+                new_args[i] = index[args[i]]
+            except (KeyError, TypeError):
+                # not a node: let func report it on the original graph
+                return func(*args, **kwargs)
+        return map_result(func(*new_args, **kwargs), labels)
+
+    return _integer_fastpath
@@ -5,6 +5,7 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.utils.decorators import open_file,not_implemented_for
+from networkx.utils.decorators import integer_fastpath
 
 def test_not_implemented_decorator():
     @not_implemented_for('directed')
@@ -26,6 +27,23 @@ def test_not_implemented_decorator_raise():
         pass
     test1(nx.Graph())
 
+def test_integer_fastpath():
+    seen = []
+    @integer_fastpath('path_dict', 'source')
+    def paths(G, source, fastpath=False):
+        seen.append(sorted(G))
+        return nx.single_source_shortest_path(G, source)
+    G = nx.Graph()
+    G.add_path(['a', 'b', 'c'])
+    assert_equal(paths(G, 'b', fastpath=True), paths(G, 'b'))
+    assert_equal(seen, [[0, 1, 2], ['a', 'b', 'c']])
+    assert_equal(paths(G, 'a', True)['c'], ['a', 'b', 'c'])
+    assert_raises(KeyError, paths, G, 'z', fastpath=True)
+
+@raises(nx.NetworkXError)
+def test_integer_fastpath_result():
+    integer_fastpath('foo')
+
 
 
 class TestOpenFileDecorator(object):